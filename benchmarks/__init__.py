@@ -0,0 +1,4 @@
+"""Benchmarks for pydantic-gql.
+
+These are not part of the test suite. Run each one from the repository root, e.g. `python -m benchmarks.bench_compiled`.
+"""
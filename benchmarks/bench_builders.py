@@ -0,0 +1,54 @@
+"""Compare the throughput and peak memory of `OperationBuilder` and `IterativeOperationBuilder` over synthetic selection trees."""
+
+import tracemalloc
+from typing import Callable
+
+from pydantic_gql.builders import IterativeOperationBuilder, OperationBuilder
+
+from .trees import make_query, per_second
+
+WIDTHS = (2, 8, 32)
+DEPTHS = (2, 4, 6)
+MAX_NODES = 200_000
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Measure the peak memory allocated while calling a function, in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def count_nodes(width: int, depth: int) -> int:
+    """Count the fields in a tree created by `make_query`."""
+    return 1 + width + (width * count_nodes(width, depth - 1) if depth > 1 else 0)
+
+
+def main() -> None:
+    print(
+        f"{'width x depth':<15}{'nodes':>10}"
+        f"{'builder/s':>12}{'iterative/s':>13}{'speedup':>9}"
+        f"{'builder KiB':>13}{'iterative KiB':>15}"
+    )
+    for width in WIDTHS:
+        for depth in DEPTHS:
+            nodes = count_nodes(width, depth)
+            if nodes > MAX_NODES:
+                continue
+            query = make_query(width, depth)
+            builders = (OperationBuilder(), IterativeOperationBuilder())
+            assert builders[0].build(query) == builders[1].build(query)
+            rates = [per_second(lambda: b.build(query), 0.3) for b in builders]
+            peaks = [peak_memory(lambda: b.build(query)) / 1024 for b in builders]
+            print(
+                f"{f'{width} x {depth}':<15}{nodes:>10,}"
+                f"{rates[0]:>12,.1f}{rates[1]:>13,.1f}{rates[1] / rates[0]:>8.2f}x"
+                f"{peaks[0]:>13,.0f}{peaks[1]:>15,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
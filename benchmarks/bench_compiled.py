@@ -0,0 +1,24 @@
+"""Compare rendering an operation from scratch with rendering a compiled operation."""
+
+from itertools import count
+
+from .trees import SHAPES, make_query, per_second
+
+
+def main() -> None:
+    print(f"{'shape':<20}{'str(query)/s':>16}{'render()/s':>16}{'render(args)/s':>16}")
+    for label, (width, depth) in SHAPES.items():
+        query = make_query(width, depth)
+        compiled = query.compile()
+        assert compiled.render() == str(query)
+        limits = count()
+        results = (
+            per_second(lambda: str(query)),
+            per_second(compiled.render),
+            per_second(lambda: compiled.render({"root": {"first": next(limits)}})),
+        )
+        print(f"{label:<20}" + "".join(f"{r:>16,.0f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
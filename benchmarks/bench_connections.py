@@ -0,0 +1,71 @@
+"""Compare the time and memory used to validate large pages into `Connection` against `CompactConnection`.
+
+Each page is the response the model's own selection asks for, so the `Connection` page includes a cursor for every edge and the `CompactConnection` page doesn't.
+"""
+
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from pydantic import BaseModel
+
+from pydantic_gql.connections import CompactConnection, Connection
+
+from .trees import per_second
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def make_page(size: int, cursors: bool) -> bytes:
+    edges: list[dict[str, Any]] = [
+        {"node": {"id": i, "name": f"Item {i}"}} for i in range(size)
+    ]
+    if cursors:
+        for i, edge in enumerate(edges):
+            edge["cursor"] = f"cursor:{i:08}"
+    page_info = {
+        "hasNextPage": True,
+        "hasPreviousPage": False,
+        "startCursor": "cursor:00000000",
+        "endCursor": f"cursor:{size - 1:08}",
+    }
+    return json.dumps({"edges": edges, "pageInfo": page_info}).encode()
+
+
+def retained(model: type[BaseModel], page: bytes) -> float:
+    """Get the memory held by a validated page, in MiB."""
+    tracemalloc.start()
+    result = model.model_validate_json(page)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size / 2**20
+
+
+def main() -> None:
+    models: tuple[type[BaseModel], ...] = (Connection[Item], CompactConnection[Item])
+    print(
+        f"{'edges':>8}{'Connection/s':>14}{'Compact/s':>12}{'speedup':>9}"
+        f"{'Connection MiB':>16}{'Compact MiB':>13}"
+    )
+    for size in SIZES:
+        pages = (make_page(size, cursors=True), make_page(size, cursors=False))
+        rates = [
+            per_second(lambda: model.model_validate_json(page), 0.3)
+            for model, page in zip(models, pages)
+        ]
+        memory = [retained(model, page) for model, page in zip(models, pages)]
+        print(
+            f"{size:>8,}{rates[0]:>14,.1f}{rates[1]:>12,.1f}{rates[1] / rates[0]:>8.2f}x"
+            f"{memory[0]:>16.2f}{memory[1]:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare creating queries from a large model with an empty and a warm cache of fields.
+
+The model has a few wide levels of nested models, so its selection has thousands of fields. With a warm cache, creating a query only looks up the fields of the top-level model, whose frozen subtrees are shared by every query, so it takes the same time however large the selection is.
+"""
+
+import time
+from typing import Callable
+
+from pydantic import BaseModel, create_model
+
+from pydantic_gql import GqlField, Query
+
+WIDTHS = (5, 10, 20)
+"""How many fields each model has. The selection has about the cube of this many fields."""
+
+
+def make_model(width: int) -> type[BaseModel]:
+    """Create a model with `width` fields of a model with `width` fields of a model with `width` scalar fields."""
+    leaf: type[BaseModel] = create_model(  # type: ignore[call-overload]
+        "Leaf", **{f"scalar_{i}": (int, 0) for i in range(width)}
+    )
+    middle: type[BaseModel] = create_model(  # type: ignore[call-overload]
+        "Middle", **{f"leaf_{i}": (leaf, None) for i in range(width)}
+    )
+    return create_model(  # type: ignore[call-overload,no-any-return]
+        "Top", **{f"middle_{i}": (middle, None) for i in range(width)}
+    )
+
+
+def timed(func: Callable[[], object], warm: bool, repeat: int = 5) -> float:
+    """Get the fastest time, in milliseconds, to call a function with an empty or a warm cache of fields."""
+    best = float("inf")
+    for _ in range(repeat):
+        GqlField.clear_cache()
+        if warm:
+            func()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    print(f"{'width':>6}{'fields':>10}{'cold ms':>12}{'warm ms':>12}")
+    for width in WIDTHS:
+        model = make_model(width)
+        create = lambda: Query.from_model(model, "root")
+        fields = width + width**2 + width**3
+        print(
+            f"{width:>6}{fields:>10,}"
+            f"{timed(create, warm=False):>12.3f}{timed(create, warm=True):>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
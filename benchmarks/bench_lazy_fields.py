@@ -0,0 +1,71 @@
+"""Compare creating queries from a large graph of models with eager and lazy subfields.
+
+Each model has a few scalar fields and refers to the next few models, so the whole selection is large even though there are few models. Queries are created with an empty cache of fields, as they would be the first time each query is built, and with a warm cache, in which the fields of the model were already created eagerly.
+"""
+
+import time
+
+from pydantic import BaseModel, create_model
+
+from pydantic_gql import GqlField, Query
+
+WIDTH = 4
+"""How many scalar fields, and how many nested models, each model has."""
+
+DEPTHS = (4, 6, 8)
+
+
+def make_models(depth: int) -> type[BaseModel]:
+    """Create a chain of models `depth` levels deep, in which each model has `WIDTH` fields of the next model."""
+    model: type[BaseModel] = create_model(  # type: ignore[call-overload]
+        "Leaf", **{f"scalar_{i}": (int, 0) for i in range(WIDTH)}
+    )
+    for level in range(depth):
+        fields: dict[str, object] = {f"scalar_{i}": (int, 0) for i in range(WIDTH)}
+        fields.update({f"child_{i}": (model, None) for i in range(WIDTH)})
+        model = create_model(f"Level{level}", **fields)  # type: ignore[call-overload]
+    return model
+
+
+def timed(func: object, warm_up: object = None, repeat: int = 3) -> float:
+    """Get the fastest time, in milliseconds, to call a function with an empty cache of fields, or after calling another function to warm it up."""
+    best = float("inf")
+    for _ in range(repeat):
+        GqlField.clear_cache()
+        if warm_up is not None:
+            warm_up()  # type: ignore[operator]
+        start = time.perf_counter()
+        func()  # type: ignore[operator]
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    print(
+        f"{'depth':>6}{'eager create ms':>17}{'lazy create ms':>16}"
+        f"{'warm lazy ms':>14}{'eager render ms':>17}{'lazy render ms':>16}"
+        f"{'chars':>12}"
+    )
+    for depth in DEPTHS:
+        model = make_models(depth)
+        create = [
+            timed(lambda: Query.from_model(model, "root", lazy=lazy))
+            for lazy in (False, True)
+        ]
+        warm = timed(
+            lambda: Query.from_model(model, "root", lazy=True),
+            warm_up=lambda: Query.from_model(model, "root"),
+        )
+        render = [
+            timed(lambda: str(Query.from_model(model, "root", lazy=lazy)))
+            for lazy in (False, True)
+        ]
+        chars = len(f"{Query.from_model(model, 'root'):noindent}")
+        print(
+            f"{depth:>6}{create[0]:>17.3f}{create[1]:>16.3f}{warm:>14.3f}"
+            f"{render[0]:>17.3f}{render[1]:>16.3f}{chars:>12,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
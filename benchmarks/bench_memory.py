@@ -0,0 +1,103 @@
+"""Measure the memory held by large trees of fields and by many variables.
+
+`GqlField` and `Var` store their attributes in slots. They are compared with equivalent classes which store them in a `__dict__`, as they used to. Each tree is built from scratch, without sharing any subtrees, except when it is interned into a `FieldPool`, in which its equal subtrees are stored once. The time to compare two equal trees which were built separately is also measured, when they are frozen and when they are interned.
+"""
+
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Sequence
+
+from pydantic_gql import FieldPool, GqlField, Var
+
+from .trees import SHAPES
+
+
+@dataclass
+class DictField:
+    """A field with the same attributes as `GqlField`, stored in a `__dict__`."""
+
+    name: str
+    args: Mapping[str, Any] = field(default_factory=dict)
+    fields: Sequence["DictField"] = ()
+    alias: str | None = None
+    model: Any = None
+
+
+class DictVar:
+    """A variable with the same attributes as `Var`, stored in a `__dict__`."""
+
+    def __init__(self, name: str) -> None:
+        self._default = None
+        self._type = int
+        self._name = name
+        self.type_name = None
+        self._var_type = int
+        self._required = True
+
+
+def make_tree(field_class: Callable[..., Any], width: int, depth: int) -> Any:
+    fields = [field_class(f"scalar_{i}") for i in range(width)]
+    if depth > 1:
+        fields += [make_tree(field_class, width, depth - 1) for _ in range(width)]
+    return field_class("root", {"first": 10}, tuple(fields))
+
+
+def retained(build: Callable[[], object]) -> tuple[float, object]:
+    """Get the memory held by the result of a function, in MiB."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / 2**20, result
+
+
+def count(tree: Any) -> int:
+    return 1 + sum(count(f) for f in tree.fields)
+
+
+def compare_ms(first: object, second: object) -> float:
+    """Get the fastest time, in milliseconds, to compare two objects."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        assert first == second
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    print(
+        f"{'tree':>22}{'nodes':>10}{'dict MiB':>11}{'slots MiB':>11}{'frozen MiB':>12}"
+        f"{'interned MiB':>14}{'frozen eq ms':>14}{'interned eq ms':>16}"
+    )
+    shapes = {**SHAPES, "large (12 x 5)": (12, 5)}
+    for name, (width, depth) in shapes.items():
+        dict_size, tree = retained(lambda: make_tree(DictField, width, depth))
+        slots_size, _ = retained(lambda: make_tree(GqlField, width, depth))
+        frozen_size, frozen = retained(
+            lambda: make_tree(GqlField, width, depth).freeze()
+        )
+        pool = FieldPool()
+        interned_size, interned = retained(
+            lambda: make_tree(GqlField, width, depth).intern(pool)
+        )
+        frozen_eq = compare_ms(frozen, make_tree(GqlField, width, depth).freeze())
+        interned_eq = compare_ms(
+            interned, make_tree(GqlField, width, depth).intern(pool)
+        )
+        print(
+            f"{name:>22}{count(tree):>10,}{dict_size:>11.2f}{slots_size:>11.2f}"
+            f"{frozen_size:>12.2f}{interned_size:>14.2f}{frozen_eq:>14.3f}"
+            f"{interned_eq:>16.4f}"
+        )
+    n = 100_000
+    dict_vars, _ = retained(lambda: [DictVar(f"v{i}") for i in range(n)])
+    slot_vars, _ = retained(lambda: [Var[int](f"v{i}") for i in range(n)])
+    print(
+        f"\n{n:,} variables: {dict_vars:.2f} MiB with a dict, {slot_vars:.2f} MiB with slots"
+    )
+
+
+if __name__ == "__main__":
+    main()
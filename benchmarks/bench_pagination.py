@@ -0,0 +1,117 @@
+"""Compare sequential pagination of a connection (with and without prefetching) against concurrent pagination of ranges of it, using an in-process stand-in server which adds latency to each request."""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, Query, Var
+from pydantic_gql.client import GqlClient
+from pydantic_gql.connections import Connection
+
+ITEMS = 5_000
+PAGE_SIZE = 100
+LATENCY = 0.02
+"""Seconds added to each response."""
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class Vars(BaseVars):
+    first: Var[int]
+    after: Var[str | None] = Var(default=None)
+    min_id: Var[int]
+    max_id: Var[int]
+
+
+QUERY = Query.from_model(
+    Connection[Item],
+    "items",
+    variables=Vars,
+    args={
+        "first": Vars.first,
+        "after": Vars.after,
+        "minId": Vars.min_id,
+        "maxId": Vars.max_id,
+    },
+)
+
+
+async def handler(request: httpx.Request) -> httpx.Response:
+    """Serve the items with IDs between `min_id` and `max_id` inclusive, after the cursor."""
+    variables = json.loads(request.content)["variables"]
+    after = variables["after"]
+    start = variables["min_id"] if after is None else int(after) + 1
+    stop = min(start + variables["first"], variables["max_id"] + 1)
+    await asyncio.sleep(LATENCY)
+    page = {
+        "edges": [
+            {"node": {"id": i, "name": f"Item {i}"}, "cursor": str(i)}
+            for i in range(start, stop)
+        ],
+        "pageInfo": {
+            "hasNextPage": stop <= variables["max_id"],
+            "hasPreviousPage": start > 0,
+            "startCursor": str(start),
+            "endCursor": str(stop - 1),
+        },
+    }
+    return httpx.Response(200, json={"data": {"items": page}})
+
+
+def ranges(parts: int) -> list[Vars]:
+    size = -(-ITEMS // parts)
+    return [
+        Vars(first=PAGE_SIZE, min_id=i, max_id=min(i + size, ITEMS) - 1)
+        for i in range(0, ITEMS, size)
+    ]
+
+
+async def consume(nodes: AsyncIterator[Any]) -> int:
+    count = 0
+    async for node in nodes:
+        count += 1
+        await asyncio.sleep(0)  # Give other tasks a chance, as real processing would.
+    return count
+
+
+async def timed(name: str, nodes: Callable[[GqlClient], AsyncIterator[Any]]) -> None:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with GqlClient(
+        "http://bench/graphql", http_client=http_client, max_concurrency=16
+    ) as client:
+        start = time.perf_counter()
+        count = await consume(nodes(client))
+        duration = time.perf_counter() - start
+    assert count == ITEMS
+    print(f"{name:<28}{duration:>8.2f}s{ITEMS / duration:>12,.0f} items/s")
+
+
+async def main() -> None:
+    print(f"{ITEMS:,} items, {PAGE_SIZE} per page, {LATENCY * 1000:.0f}ms latency")
+    await timed("sequential", lambda c: c.paginate(QUERY, ranges(1)[0]))
+    await timed(
+        "sequential + prefetch",
+        lambda c: c.paginate(QUERY, ranges(1)[0], prefetch=True),
+    )
+    for workers in (2, 4, 8, 16):
+        await timed(
+            f"{workers} ranges, ordered",
+            lambda c: c.paginate_ranges(QUERY, ranges(workers), workers=workers),
+        )
+        await timed(
+            f"{workers} ranges, unordered",
+            lambda c: c.paginate_ranges(
+                QUERY, ranges(workers), workers=workers, ordered=False
+            ),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""Compare rendering a batch of operations with `render_many` against calling `str` on each one."""
+
+from pydantic_gql import BaseVars, GqlField, Query, Var
+from pydantic_gql.builders import render_many
+
+from .trees import per_second
+
+BATCH_SIZES = (10, 100, 1000)
+
+
+class Vars(BaseVars):
+    first: Var[int]
+    after: Var[str | None]
+
+
+def make_operations(count: int) -> list[Query]:
+    """Create one small query per tenant."""
+    return [
+        Query(
+            f"Tenant{i}",
+            GqlField(
+                "orders",
+                {"tenant": f"tenant-{i}", "first": Vars.first, "after": Vars.after},
+                [
+                    GqlField("id"),
+                    GqlField("total"),
+                    GqlField("items", {}, [GqlField("sku")]),
+                ],
+            ),
+            variables=Vars,
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    print(f"{'batch':>6}{'str() loop/s':>15}{'render_many/s':>15}{'speedup':>9}")
+    for size in BATCH_SIZES:
+        operations = make_operations(size)
+        assert render_many(operations) == [str(op) for op in operations]
+        rates = (
+            per_second(lambda: [str(op) for op in operations], 0.3),
+            per_second(lambda: render_many(operations), 0.3),
+        )
+        print(
+            f"{size:>6}"
+            + "".join(f"{r:>15,.1f}" for r in rates)
+            + f"{rates[1] / rates[0]:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare decoding a large list response with `json.loads` and validating each item against validating the raw response with `Operation.parse_response`."""
+
+import json
+
+from pydantic import BaseModel
+
+from pydantic_gql import Query
+
+from .trees import per_second
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+class Author(BaseModel):
+    name: str
+    born: int | None
+
+
+class Book(BaseModel):
+    id: int
+    title: str
+    tags: list[str]
+    authors: list[Author]
+
+
+def make_response(size: int) -> bytes:
+    books = [
+        {
+            "id": i,
+            "title": f"Book {i}",
+            "tags": ["fiction", "classic"],
+            "authors": [{"name": f"Author {i}", "born": 1900 + i % 100}],
+        }
+        for i in range(size)
+    ]
+    return json.dumps({"data": {"books": books}}).encode()
+
+
+def main() -> None:
+    query = Query.from_model(Book, "books")
+    print(f"{'items':>8}{'loads+validate/s':>18}{'parse_response/s':>18}{'speedup':>9}")
+    for size in SIZES:
+        content = make_response(size)
+
+        def baseline() -> list[Book]:
+            data = json.loads(content)["data"]
+            return [Book.model_validate(item) for item in data["books"]]
+
+        assert query.parse_response(content)["books"] == baseline()
+        rates = (
+            per_second(baseline, 0.3),
+            per_second(lambda: query.parse_response(content), 0.3),
+        )
+        print(
+            f"{size:>8,}"
+            + "".join(f"{r:>18,.2f}" for r in rates)
+            + f"{rates[1] / rates[0]:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
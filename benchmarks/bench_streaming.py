@@ -0,0 +1,48 @@
+"""Compare the peak memory and speed of validating a large list response all at once with `Operation.parse_response` against streaming it item by item with `iter_list`."""
+
+import io
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from pydantic_gql import Query
+from pydantic_gql.streaming import iter_list
+
+from .bench_response import Book, make_response
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, float]:
+    """Run a function once and get its duration in seconds and its peak memory in MiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak / 2**20
+
+
+def main() -> None:
+    query = Query.from_model(Book, "books")
+    print(
+        f"{'items':>8}{'parse s':>10}{'parse MiB':>11}{'stream s':>10}{'stream MiB':>12}"
+    )
+    for size in SIZES:
+        content = make_response(size)
+
+        def parse() -> None:
+            for book in query.parse_response(content)["books"]:
+                pass
+
+        def stream() -> None:
+            for book in iter_list(io.BytesIO(content), "books", Book):
+                pass
+
+        results = (*measure(parse), *measure(stream))
+        print(f"{size:>8,}" + "".join(f"{r:>11.2f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
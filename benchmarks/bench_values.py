@@ -0,0 +1,32 @@
+"""Measure how quickly `ValueBuilder` renders large list arguments, with `json.dumps` of the same data for reference."""
+
+import json
+
+from pydantic_gql import GqlValue
+from pydantic_gql.builders import ValueBuilder
+
+from .trees import per_second
+
+VALUES: dict[str, GqlValue] = {
+    "10k ints": list(range(10_000)),
+    "10k strings": [f"id-{i}" for i in range(10_000)],
+    "10k floats": [i / 7 for i in range(10_000)],
+    "10k bools": [i % 2 == 0 for i in range(10_000)],
+    "3k nested lists": [[i, str(i), None] for i in range(3_000)],
+    "100 x 100 ints": [list(range(100)) for _ in range(100)],
+}
+
+
+def main() -> None:
+    builder = ValueBuilder()
+    print(f"{'value':<18}{'ValueBuilder/s':>16}{'json.dumps/s':>14}")
+    for label, value in VALUES.items():
+        rates = (
+            per_second(lambda: builder.build(value), 0.3),
+            per_second(lambda: json.dumps(value), 0.3),
+        )
+        print(f"{label:<18}" + "".join(f"{r:>16,.1f}" for r in rates))
+
+
+if __name__ == "__main__":
+    main()
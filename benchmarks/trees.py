@@ -0,0 +1,34 @@
+from timeit import Timer
+from typing import Callable
+
+from pydantic_gql import GqlField, Query
+
+
+def make_query(width: int, depth: int) -> Query:
+    """Create a query whose selection set is `width` fields wide and `depth` levels deep, with a few arguments on every object field."""
+    return Query("Bench", _make_field("root", width, depth))
+
+
+def _make_field(name: str, width: int, depth: int) -> GqlField:
+    fields = [GqlField(f"scalar_{i}") for i in range(width)]
+    if depth > 1:
+        fields += [_make_field(f"child_{i}", width, depth - 1) for i in range(width)]
+    return GqlField(name, {"first": 10, "after": "cursor", "flag": True}, fields)
+
+
+SHAPES = {
+    "deep (2 x 8)": (2, 8),
+    "wide (60 x 2)": (60, 2),
+    "balanced (6 x 4)": (6, 4),
+}
+"""Selection trees to benchmark, as `(width, depth)`."""
+
+
+def per_second(func: Callable[[], object], min_time: float = 0.5) -> float:
+    """Measure how many times per second a function can be called."""
+    timer = Timer(func)
+    number, elapsed = timer.autorange()
+    while elapsed < min_time:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return number / elapsed
@@ -7,10 +7,21 @@ import importlib.metadata as metadata
 __version__ = metadata.version(__package__ or __name__)
 
 from .base_vars import BaseVars
-from .gql_field import GqlField
+from .fragment import Fragment
+from .gql_field import FieldPool, GqlField
 from .mutation import Mutation
 from .query import Query
 from .values import Expr, GqlValue
 from .var import Var
 
-__all__ = ("Query", "Mutation", "BaseVars", "Var", "GqlField", "Expr", "GqlValue")
+__all__ = (
+    "Query",
+    "Mutation",
+    "BaseVars",
+    "Var",
+    "GqlField",
+    "FieldPool",
+    "Fragment",
+    "Expr",
+    "GqlValue",
+)
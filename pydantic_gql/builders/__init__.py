@@ -2,7 +2,9 @@ from .args_builder import ArgsBuilder
 from .builder import Builder
 from .fields_builder import FieldsBuilder
 from .indentation import Indentation
+from .iterative_operation_builder import IterativeOperationBuilder
 from .operation_builder import OperationBuilder
+from .render_many import render_many
 from .type_builder import TypeBuilder
 from .value_builder import ValueBuilder
 from .vars_builder import VarsBuilder
@@ -12,7 +14,9 @@ __all__ = (
     "Builder",
     "FieldsBuilder",
     "Indentation",
+    "IterativeOperationBuilder",
     "OperationBuilder",
+    "render_many",
     "TypeBuilder",
     "VarsBuilder",
     "ValueBuilder",
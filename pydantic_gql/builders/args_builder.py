@@ -2,6 +2,7 @@ from io import StringIO
 from typing import Mapping, override
 
 from ..values import GqlValue
+from . import minify
 from .builder import Builder
 from .value_builder import ValueBuilder
 
@@ -10,8 +11,14 @@ class ArgsBuilder(Builder[Mapping[str, GqlValue]]):
     """A GraphQL arguments builder.
 
     This class is used to convert a mapping of argument names to `GqlValue` objects into a string containing the GraphQL arguments code.
+
+    Args:
+        minify: Whether to leave out all the commas and whitespace that aren't needed.
     """
 
+    def __init__(self, minify: bool = False) -> None:
+        self._minify = minify
+
     @override
     def insert(self, args: Mapping[str, GqlValue], buffer: StringIO) -> None:
         """Convert a mapping of argument names to `GqlValue` objects into a GraphQL arguments string.
@@ -23,6 +30,11 @@ class ArgsBuilder(Builder[Mapping[str, GqlValue]]):
             The arguments as a string.
         """
         buffer.write("(")
-        value_builder = ValueBuilder()
-        buffer.write(", ".join(f"{k}: {value_builder(v)}" for k, v in args.items()))
+        value_builder = ValueBuilder(self._minify)
+        if self._minify:
+            buffer.write(
+                minify.join(f"{k}:{value_builder(v)}" for k, v in args.items())
+            )
+        else:
+            buffer.write(", ".join(f"{k}: {value_builder(v)}" for k, v in args.items()))
         buffer.write(")")
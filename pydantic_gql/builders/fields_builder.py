@@ -11,10 +11,15 @@ class FieldsBuilder(Builder[Iterable[GqlField]]):
     """A GraphQL fields builder.
 
     This class is used to convert a sequence of `GqlField` objects into a string containing the GraphQL fields code.
+
+    Args:
+        indentation: The indentation of the fields.
+        minify: Whether to leave out all the commas and whitespace that aren't needed. The indentation should be disabled as well.
     """
 
-    def __init__(self, indentation: Indentation) -> None:
+    def __init__(self, indentation: Indentation, minify: bool = False) -> None:
         self._indentation = indentation
+        self._minify = minify
 
     @override
     def insert(self, fields: Iterable[GqlField], buffer: StringIO) -> None:
@@ -26,17 +31,28 @@ class FieldsBuilder(Builder[Iterable[GqlField]]):
         Returns:
             The fields as a string.
         """
+        separate = False
         for field in fields:
+            if separate:
+                buffer.write(" ")
             self._insert_field(field, buffer)
+            # In minified output, only a field which ends with its name runs into the next one.
+            separate = self._minify and not (field.args or field.fields)
 
     def _insert_field(self, field: GqlField, buffer: StringIO) -> None:
         """Insert one field into the resulting string buffer."""
-        buffer.write(f"{self._indentation}{field.name}")
+        buffer.write(str(self._indentation))
+        if field.alias:
+            buffer.write(f"{field.alias}:" if self._minify else f"{field.alias}: ")
+        buffer.write(field.name)
         if field.args:
-            ArgsBuilder().insert(field.args, buffer)
+            ArgsBuilder(self._minify).insert(field.args, buffer)
         if field.fields:
-            buffer.write(" {")
-            FieldsBuilder(self._indentation + 1).insert(field.fields, buffer)
+            buffer.write("{" if self._minify else " {")
+            FieldsBuilder(self._indentation + 1, self._minify).insert(
+                field.fields, buffer
+            )
             buffer.write(str(self._indentation))
             buffer.write("}")
-        buffer.write(",")
+        if not self._minify:
+            buffer.write(",")
@@ -0,0 +1,29 @@
+"""Helpers for the minified output format, which leaves out every comma and all whitespace that GraphQL doesn't need."""
+
+from typing import Iterable
+
+_PUNCTUATORS = frozenset('!$&():=@[]{}|"')
+"""Characters which end or start a token that can't run into a neighbouring token. (A string is delimited by quotes, so it counts as well.)"""
+
+
+def separator(before: str, after: str) -> str:
+    """Get the separator needed between two pieces of GraphQL code, which is a space unless either side is a punctuator where they meet."""
+    if (
+        before
+        and after
+        and before[-1] not in _PUNCTUATORS
+        and after[0] not in _PUNCTUATORS
+    ):
+        return " "
+    return ""
+
+
+def join(parts: Iterable[str]) -> str:
+    """Join pieces of GraphQL code (such as the items of a list) with as few separators as possible."""
+    result: list[str] = []
+    previous = ""
+    for part in parts:
+        result.append(separator(previous, part))
+        result.append(part)
+        previous = part
+    return "".join(result)
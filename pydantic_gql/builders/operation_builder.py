@@ -1,6 +1,8 @@
 from io import StringIO
-from typing import override
+from typing import Iterable, override
 
+from ..fragment import Fragment
+from ..gql_field import GqlField
 from ..operation import Operation
 from .builder import Builder
 from .fields_builder import FieldsBuilder
@@ -15,21 +17,29 @@ class OperationBuilder(Builder[Operation]):
 
     Args:
         indent: The indentation to use when formatting the output. If `False` then no indentation is used and the query is returned as a single line. If `True` (the default) then the default indentation is used (two spaces). If an integer then that many spaces are used for indentation. If a string (must be whitespace) then that string is used for indentation.
+        minify: Whether to produce the smallest valid document, leaving out every comma and all whitespace that isn't needed to separate two tokens. If `True`, `indent` is ignored.
     """
 
     DEFAULT_INDENTATION = "  "
 
-    def __init__(self, indent: int | str | bool = True) -> None:
-        indentation: str | None
+    def __init__(
+        self, indent: int | str | bool = True, *, minify: bool = False
+    ) -> None:
+        self._minify = minify
+        unit = None if minify else self._indentation_string(indent)
+        self._indentation = Indentation(unit, 0)
+        self._fragment_separator = "" if minify else " " if unit is None else "\n\n"
+
+    @classmethod
+    def _indentation_string(cls, indent: int | str | bool) -> str | None:
+        """Get the string to indent each level with, or `None` if the output shouldn't be indented."""
         if isinstance(indent, bool):
-            indentation = self.DEFAULT_INDENTATION if indent else None
-        elif isinstance(indent, str):
+            return cls.DEFAULT_INDENTATION if indent else None
+        if isinstance(indent, str):
             if not indent.isspace():
                 raise ValueError("indent must be whitespace if it is a string.")
-            indentation = indent
-        else:
-            indentation = " " * indent
-        self._indentation = Indentation(indentation, 0)
+            return indent
+        return " " * indent
 
     @override
     def insert(self, operation: Operation, buffer: StringIO) -> None:
@@ -40,8 +50,22 @@ class OperationBuilder(Builder[Operation]):
             buffer: The buffer to write the operation to.
         """
         buffer.write(f"{operation.type} {operation.name}")
-        VarsBuilder().insert(operation.variables, buffer)
-        buffer.write(" {")
-        FieldsBuilder(self._indentation + 1).insert(operation.fields, buffer)
+        VarsBuilder(self._minify).insert(operation.variables, buffer)
+        self._insert_selection(operation.fields, buffer)
+        self._insert_fragments(operation.fragments, buffer)
+
+    def _insert_selection(self, fields: Iterable[GqlField], buffer: StringIO) -> None:
+        """Insert the selection set of the operation or of a fragment, including its braces."""
+        buffer.write("{" if self._minify else " {")
+        FieldsBuilder(self._indentation + 1, self._minify).insert(fields, buffer)
         buffer.write(str(self._indentation))
         buffer.write("}")
+
+    def _insert_fragments(
+        self, fragments: Iterable[Fragment], buffer: StringIO
+    ) -> None:
+        """Insert the definitions of the fragments after the operation."""
+        for fragment in fragments:
+            buffer.write(self._fragment_separator)
+            buffer.write(f"fragment {fragment.name} on {fragment.type_name}")
+            self._insert_selection(fragment.fields, buffer)
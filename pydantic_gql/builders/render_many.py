@@ -0,0 +1,71 @@
+from io import StringIO
+from typing import Iterable, overload
+
+from ..operation import Operation
+from .iterative_operation_builder import IterativeOperationBuilder
+
+
+@overload
+def render_many(
+    operations: Iterable[Operation],
+    indent: int | str | bool = True,
+    *,
+    minify: bool = False,
+) -> list[str]: ...
+
+
+@overload
+def render_many(
+    operations: Iterable[Operation],
+    indent: int | str | bool = True,
+    *,
+    minify: bool = False,
+    buffer: StringIO,
+    separator: str = "\n",
+) -> None: ...
+
+
+def render_many(
+    operations: Iterable[Operation],
+    indent: int | str | bool = True,
+    *,
+    minify: bool = False,
+    buffer: StringIO | None = None,
+    separator: str = "\n",
+) -> list[str] | None:
+    """Render many operations at once.
+
+    This is equivalent to calling `format` on each operation, but a single builder (along with its indentation table) is shared by the whole batch instead of setting up new builders for every operation. Frozen operations are rendered through their own cache.
+
+    Args:
+        operations: The operations to render.
+        indent: The indentation to use when formatting the output. See `OperationBuilder`.
+        minify: Whether to produce the smallest valid documents (the `min` format). If `True`, `indent` is ignored.
+        buffer: If provided, the operations are written into this buffer instead of being returned.
+        separator: The string to write between operations when writing into a buffer.
+
+    Returns:
+        A list of the rendered operations in the same order, or `None` if a buffer was given.
+    """
+    builder = IterativeOperationBuilder(indent, minify=minify)
+    format_spec = "min" if minify else _format_spec(indent)
+    if buffer is None:
+        return [
+            format(op, format_spec) if op.frozen else builder.build(op)
+            for op in operations
+        ]
+    for i, op in enumerate(operations):
+        if i:
+            buffer.write(separator)
+        if op.frozen:
+            buffer.write(format(op, format_spec))
+        else:
+            builder.insert(op, buffer)
+    return None
+
+
+def _format_spec(indent: int | str | bool) -> str:
+    """Get the format specifier equivalent to an indent argument."""
+    if isinstance(indent, bool):
+        return "indent" if indent else "noindent"
+    return str(indent)
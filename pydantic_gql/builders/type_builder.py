@@ -1,16 +1,66 @@
 from io import StringIO
 from types import UnionType
-from typing import Any, Iterable, Mapping, Union, cast, get_args, get_origin, override
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Mapping,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    override,
+)
 
+from ..cache import LruCache
 from ..var import TypeAnnotation, Var, is_required
 from .builder import Builder
 
 
 class TypeBuilder(Builder[Var[Any]]):
+    """A GraphQL type builder.
+
+    This class is used to convert the type of a `Var` into a GraphQL type string, such as `[Int!]!`.
+
+    The type strings are cached globally in `TypeBuilder.cache`, keyed by the type annotation, whether the variable is required and its `type_name`, so each distinct variable type is only resolved once.
+
+    Python types are mapped to GraphQL types by name, except for the basic types (`str`, `int`, `float`, `bool`) which are mapped to the built-in GraphQL scalars. Use `register_scalar` to map other types to custom scalars.
+    """
+
+    cache: ClassVar[LruCache[tuple[Any, bool, str | None], str]] = LruCache(
+        maxsize=1024
+    )
+    """A cache of the GraphQL type strings of variables."""
+
     @override
     def insert(self, var: Var[Any], buffer: StringIO) -> None:
         """Insert a type into the resulting string buffer."""
-        buffer.write(self._type_of(var.var_type, var.required, var.type_name))
+        key = (var.var_type, var.required, var.type_name)
+        try:
+            type_string = self.cache.get(key, lambda: self._type_of(*key))
+        except TypeError:  # The type annotation is not hashable.
+            type_string = self._type_of(*key)
+        buffer.write(type_string)
+
+    @classmethod
+    def register_scalar(cls, python_type: TypeAnnotation, type_name: str) -> None:
+        """Map a Python type to a GraphQL scalar type.
+
+        Variables of this type (or of optional types or iterables of this type) will use the given type name, unless the variable has its own `type_name`.
+
+        ```python
+        TypeBuilder.register_scalar(datetime, "DateTime")
+        TypeBuilder.register_scalar(UUID, "ID")
+        ```
+
+        Args:
+            python_type: The Python type. Only variables of exactly this type are affected, not of its subclasses.
+            type_name: The name of the GraphQL type, without any `!` or `[]`.
+        """
+        cls._custom_scalars[python_type] = type_name
+        cls.cache.clear()
+
+    _custom_scalars: ClassVar[dict[TypeAnnotation, str]] = {}
 
     _basic_types: Mapping[TypeAnnotation, str] = {
         str: "String",
@@ -32,6 +82,8 @@ class TypeBuilder(Builder[Var[Any]]):
             var_type = self._iterable_type(t, type_name)
         elif type_name:
             var_type = type_name
+        elif t in self._custom_scalars:
+            var_type = self._custom_scalars[t]
         elif t in self._basic_types:
             var_type = self._basic_types[t]
         elif isinstance(t, type):
@@ -1,18 +1,49 @@
-import json
 from io import StringIO
-from typing import Iterable, override
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Iterable, Mapping, Sequence, override
 
+from pydantic import BaseModel
+
+from ..cache import LruCache
 from ..values import GqlValue
 from ..var import Var
+from . import minify
 from .builder import Builder
 
+_SCALARS: Mapping[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda _: "null",
+}
+"""Functions to render values of the most common exact types, to avoid a chain of `isinstance` checks."""
+
+_model_layouts: LruCache[type[BaseModel], Sequence[tuple[str, str]]] = LruCache(
+    maxsize=1024
+)
+"""The attribute name and GraphQL name of each field of each model rendered as an input object."""
+
 
 class ValueBuilder(Builder[GqlValue]):
     """A GraphQL value builder.
 
     This class is used to convert a `GqlValue` object into a string containing the GraphQL value code.
+
+    Pydantic models and mappings are rendered as GraphQL input objects. The fields of a model are named by their serialization alias if they have one.
+
+    Args:
+        minify: Whether to leave out all the commas and whitespace that aren't needed.
     """
 
+    def __init__(self, minify: bool = False) -> None:
+        self._minify = minify
+        self._colon = ":" if minify else ": "
+
+    @override
+    def build(self, value: GqlValue, /) -> str:
+        return self._render(value)
+
     @override
     def insert(self, value: GqlValue, buffer: StringIO) -> None:
         """Convert a `GqlValue` object into a GraphQL value string.
@@ -23,15 +54,42 @@ class ValueBuilder(Builder[GqlValue]):
         Returns:
             The value as a string.
         """
+        buffer.write(self._render(value))
+
+    def _render(self, value: GqlValue) -> str:
+        """Render a value as a string, joining the elements of iterables in a single pass."""
+        render = _SCALARS.get(type(value))
+        if render is not None:
+            return render(value)
         if isinstance(value, Var):
-            buffer.write(f"${value.name}")
-        elif isinstance(value, str):
-            buffer.write(json.dumps(value))
-        elif isinstance(value, bool):
-            buffer.write(str(value).lower())
-        elif value is None:
-            buffer.write("null")
-        elif isinstance(value, Iterable):
-            buffer.write(f"[{', '.join(self.build(v) for v in value)}]")
-        else:
-            buffer.write(str(value))
+            return f"${value.name}"
+        if isinstance(value, str):
+            return encode_basestring_ascii(value)
+        if isinstance(value, BaseModel):
+            return self._render_model(value)
+        if isinstance(value, Mapping):
+            return f"{{{self._join(f'{k}{self._colon}{self._render(v)}' for k, v in value.items())}}}"
+        if isinstance(value, Iterable):
+            return f"[{self._join(map(self._render, value))}]"
+        return str(value)
+
+    def _render_model(self, model: BaseModel) -> str:
+        """Render a Pydantic model as an input object."""
+        layout = _model_layouts.get(type(model), lambda: _layout_of(type(model)))
+        fields = self._join(
+            f"{name}{self._colon}{self._render(getattr(model, attr))}"
+            for attr, name in layout
+        )
+        return f"{{{fields}}}"
+
+    def _join(self, items: Iterable[str]) -> str:
+        """Join the rendered items of a list or the fields of an input object."""
+        return minify.join(items) if self._minify else ", ".join(items)
+
+
+def _layout_of(model: type[BaseModel]) -> Sequence[tuple[str, str]]:
+    """Get the attribute name and GraphQL name of each field of a model."""
+    return tuple(
+        (attr, field.serialization_alias or attr)
+        for attr, field in model.model_fields.items()
+    )
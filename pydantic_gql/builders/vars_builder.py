@@ -7,6 +7,15 @@ from .type_builder import TypeBuilder
 
 
 class VarsBuilder(Builder[Sequence[Var[Any]]]):
+    """A GraphQL variable definitions builder.
+
+    Args:
+        minify: Whether to leave out all the commas and whitespace that aren't needed.
+    """
+
+    def __init__(self, minify: bool = False) -> None:
+        self._minify = minify
+
     @override
     def insert(self, variables: Sequence[Var[Any]], buffer: StringIO) -> None:
         """Insert variables into the resulting string buffer."""
@@ -14,7 +23,13 @@ class VarsBuilder(Builder[Sequence[Var[Any]]]):
             return
         buffer.write("(")
         type_builder = TypeBuilder()
-        buffer.write(
-            ", ".join(f"${v.name}: {type_builder.build(v)}" for v in variables)
-        )
+        if self._minify:
+            # Each definition starts with "$", so they never need separating.
+            buffer.write(
+                "".join(f"${v.name}:{type_builder.build(v)}" for v in variables)
+            )
+        else:
+            buffer.write(
+                ", ".join(f"${v.name}: {type_builder.build(v)}" for v in variables)
+            )
         buffer.write(")")
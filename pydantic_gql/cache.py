@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+__all__ = ["CacheInfo", "LruCache"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Statistics about the usage of a `LruCache`."""
+
+    hits: int
+    """The number of lookups which found an existing entry."""
+
+    misses: int
+    """The number of lookups which had to create a new entry."""
+
+    size: int
+    """The number of entries currently in the cache."""
+
+    maxsize: int | None
+    """The maximum number of entries the cache can hold, or `None` if it is unbounded."""
+
+
+class LruCache(Generic[K, V]):
+    """A thread-safe cache of bounded size which evicts the least recently used entries first.
+
+    Args:
+        maxsize: The maximum number of entries to keep. If `None`, the cache grows without bound.
+    """
+
+    def __init__(self, maxsize: int | None = 1024) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer or None.")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K, factory: Callable[[], V]) -> V:
+        """Get the value for a key, creating it with the factory if it is not cached.
+
+        The factory is called without holding the lock, so it may itself use the cache (e.g. recursively). If two threads create a value for the same key at the same time, the first one to finish wins and both receive the same value.
+
+        Args:
+            key: The key to look up.
+            factory: A function which creates the value if the key is not cached.
+
+        Returns:
+            The cached or newly created value.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = factory()
+        with self._lock:
+            self._misses += 1
+            if key in self._entries:
+                return self._entries[key]
+            if self._maxsize != 0:
+                self._entries[key] = value
+            if self._maxsize is not None and len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: K) -> None:
+        """Remove a key from the cache if it is present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> None:
+        """Remove all the keys for which the predicate is true."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and reset its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get statistics about the usage of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, len(self._entries), self._maxsize
+            )
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Mapping,
+    Self,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from .base_vars import BaseVars
+from .connections import CompactConnection, Connection
+from .errors import GraphQLError
+from .operation import Operation
+from .streaming import aiter_list
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        "The GraphQL client requires httpx. Install it with `pip install pydantic-gql[http]`."
+    ) from e
+
+__all__ = ["GqlClient"]
+
+_Page = Connection[Any] | CompactConnection[Any]
+
+R = TypeVar("R")
+
+
+class GqlClient:
+    """An asynchronous client for sending operations to a GraphQL API over HTTP.
+
+    The client keeps a pool of keep-alive connections which are reused between requests, and limits the number of requests in flight at once. It should be closed when no longer needed, preferably by using it as an async context manager.
+
+    This requires the optional dependency `httpx`, which is installed with `pip install pydantic-gql[http]`.
+
+    ```python
+    async with GqlClient("https://example.com/graphql") as client:
+        data = await client.execute(Query.from_model(Book, "books"))
+        books: list[Book] = data["books"]
+    ```
+
+    Args:
+        url: The URL of the GraphQL endpoint.
+        headers: Headers to send with every request, e.g. for authentication.
+        max_concurrency: The maximum number of requests that may be in flight at once. Further requests wait until one of them completes.
+        timeout: The timeout for each request, in seconds.
+        http_client: An `httpx.AsyncClient` to send requests with. If not provided, one is created with a connection pool sized to `max_concurrency`. The client is closed along with this one either way.
+        persisted_queries: Whether to use automatic persisted queries. If enabled, each request first sends only the SHA-256 hash of the operation's document (see `Operation.document_hash`) instead of the document itself. If the server doesn't know the hash yet, the request is sent again with the whole document so that the server can store it. If the server doesn't support persisted queries at all, they are disabled for the rest of the client's life.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] = {},
+        max_concurrency: int = 10,
+        timeout: float = 30,
+        http_client: httpx.AsyncClient | None = None,
+        persisted_queries: bool = False,
+    ) -> None:
+        self.url = url
+        self.persisted_queries = persisted_queries
+        self._http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=timeout,
+        )
+        self._headers = {"Content-Type": "application/json", **headers}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def execute(
+        self,
+        operation: Operation,
+        variables: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send an operation and validate the data in the response.
+
+        Args:
+            operation: The operation to send.
+            variables: The values of the operation's variables, such as a `BaseVars` instance.
+
+        Returns:
+            A mapping from the key of each top-level field to its value. Values of fields created from Pydantic models are validated into those models straight from the raw response. See `Operation.parse_response`.
+
+        Raises:
+            GraphQLError: If the response contains any errors.
+            pydantic.ValidationError: If the response is not valid.
+            httpx.HTTPError: If the request fails.
+        """
+        return await self._send(
+            operation, variables, lambda response: self._parse(operation, response)
+        )
+
+    async def execute_raw(
+        self,
+        operation: Operation,
+        variables: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send an operation and return the data in the response without validating it.
+
+        Args:
+            operation: The operation to send.
+            variables: The values of the operation's variables, such as a `BaseVars` instance.
+
+        Returns:
+            The `data` object of the response.
+
+        Raises:
+            GraphQLError: If the response contains any errors.
+            pydantic.ValidationError: If the response is not valid.
+            httpx.HTTPError: If the request fails.
+        """
+        return await self._send(operation, variables, self._parse_raw)
+
+    async def stream(
+        self,
+        operation: Operation,
+        variables: Mapping[str, Any] | None = None,
+        *,
+        key: str | None = None,
+    ) -> AsyncIterator[Any]:
+        """Send an operation and yield the items of a list field one at a time as the response is received.
+
+        Each item is validated into the field's model as soon as it has been read, so memory usage stays bounded however long the list is. See `pydantic_gql.streaming`.
+
+        ```python
+        async for book in client.stream(Query.from_model(Book, "books")):
+            ...
+        ```
+
+        The request holds one of the client's concurrency slots until the iteration finishes.
+
+        Args:
+            operation: The operation to send.
+            variables: The values of the operation's variables, such as a `BaseVars` instance.
+            key: The key of the top-level field to stream (its alias or name). May be omitted if the operation has only one top-level field. The field must have been created from a Pydantic model.
+
+        Yields:
+            Each item of the field's list, validated into the field's model.
+
+        Raises:
+            GraphQLError: If the response contains any errors.
+            pydantic.ValidationError: If an item is not valid.
+            httpx.HTTPError: If the request fails.
+        """
+        key, model = self._list_field(operation, key)
+        if self.persisted_queries:
+            items = self._stream(
+                operation, self._body(operation, variables, query=False), key, model
+            )
+            yielded = False
+            # Close the request straight away if the caller stops early, rather than when the generator is garbage collected.
+            async with aclosing(items):
+                try:
+                    async for item in items:
+                        yielded = True
+                        yield item
+                    return
+                except GraphQLError as e:
+                    if yielded or not self._persisted_query_missed(e):
+                        raise
+        items = self._stream(operation, self._body(operation, variables), key, model)
+        async with aclosing(items):
+            async for item in items:
+                yield item
+
+    async def _stream(
+        self, operation: Operation, body: bytes, key: str, model: type[BaseModel]
+    ) -> AsyncGenerator[Any, None]:
+        """Send a request body and yield the items of a list field in the response as they are received."""
+        async with self._semaphore, self._http.stream(
+            "POST", self.url, content=body, headers=self._headers
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                self._parse(operation, response)
+            async for item in aiter_list(response.aiter_bytes(), key, model):
+                yield item
+
+    async def paginate(
+        self,
+        operation: Operation,
+        variables: Mapping[str, Any] | None = None,
+        *,
+        key: str | None = None,
+        cursor_var: str = "after",
+        prefetch: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Send an operation for each page of a connection and yield the nodes of all the pages.
+
+        The operation should select a `Connection` or `CompactConnection` field (see `pydantic_gql.connections`) with an argument which takes the cursor to start after from a variable. After each page, the page's end cursor is fed back into that variable to fetch the next one, until a page has no next page.
+
+        ```python
+        class Vars(BaseVars):
+            first: Var[int]
+            after: Var[str | None]
+
+        query = Query.from_model(
+            Connection[User], "users", variables=Vars, args={"first": Vars.first, "after": Vars.after}
+        )
+        async for user in client.paginate(query, Vars(first=100, after=None)):
+            ...
+        ```
+
+        Args:
+            operation: The operation to send.
+            variables: The values of the operation's variables for the first page, such as a `BaseVars` instance.
+            key: The key of the top-level connection field (its alias or name). May be omitted if the operation has only one top-level field.
+            cursor_var: The name of the variable which takes the cursor to start after.
+            prefetch: Whether to request the next page as soon as a page arrives, so that it is fetched while the nodes of the current page are being consumed.
+
+        Yields:
+            The nodes of each page, in order.
+
+        Raises:
+            GraphQLError: If any response contains errors.
+            pydantic.ValidationError: If any response is not valid.
+            httpx.HTTPError: If any request fails.
+        """
+        key = self._connection_key(operation, key, cursor_var)
+        pages = self._pages(operation, dict(variables or {}), key, cursor_var, prefetch)
+        async with aclosing(pages):
+            async for page in pages:
+                for node in page.nodes:
+                    yield node
+
+    async def paginate_ranges(
+        self,
+        operation: Operation,
+        ranges: Iterable[Mapping[str, Any]],
+        *,
+        key: str | None = None,
+        cursor_var: str = "after",
+        workers: int = 4,
+        ordered: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Paginate through several ranges of a connection concurrently and yield the nodes of all of them.
+
+        Sequential pagination must wait for each page before it can request the next one. If the server can restrict a connection to a range of it (e.g. with arguments filtering on an ordered key, or with an offset), the connection can instead be split into ranges which are paginated independently and concurrently, each as with `paginate`.
+
+        ```python
+        class Vars(BaseVars):
+            first: Var[int]
+            after: Var[str | None]
+            min_id: Var[int]
+            max_id: Var[int]
+
+        ranges = [Vars(first=100, min_id=i, max_id=i + 9999) for i in range(0, 100_000, 10_000)]
+        async for user in client.paginate_ranges(query, ranges, workers=8):
+            ...
+        ```
+
+        Args:
+            operation: The operation to send.
+            ranges: The values of the operation's variables for the first page of each range.
+            key: The key of the top-level connection field (its alias or name). May be omitted if the operation has only one top-level field.
+            cursor_var: The name of the variable which takes the cursor to start after.
+            workers: The maximum number of ranges to paginate at once. Requests are also limited by the client's `max_concurrency`.
+            ordered: Whether to yield the nodes in the order of the ranges. If so, the pages of a range are held in memory until all the ranges before it are done. Otherwise, the nodes of each page are yielded as soon as it arrives.
+
+        Yields:
+            The nodes of each page of each range.
+
+        Raises:
+            GraphQLError: If any response contains errors.
+            pydantic.ValidationError: If any response is not valid.
+            httpx.HTTPError: If any request fails.
+        """
+        key = self._connection_key(operation, key, cursor_var)
+        slots = asyncio.Semaphore(workers)
+
+        async def paginate_range(
+            values: Mapping[str, Any], queue: asyncio.Queue[Any]
+        ) -> None:
+            try:
+                async with slots:
+                    async for page in self._pages(
+                        operation, dict(values), key, cursor_var, prefetch=False
+                    ):
+                        queue.put_nowait(page)
+            except Exception as e:
+                queue.put_nowait(e)
+            else:
+                queue.put_nowait(None)
+
+        shared: asyncio.Queue[Any] = asyncio.Queue()
+        queues = []
+        tasks = []
+        for values in ranges:
+            queues.append(asyncio.Queue() if ordered else shared)
+            tasks.append(asyncio.ensure_future(paginate_range(values, queues[-1])))
+        try:
+            drains = (
+                [_drain(queue, 1) for queue in queues]
+                if ordered
+                else [_drain(shared, len(tasks))]
+            )
+            for drain in drains:
+                async for page in drain:
+                    for node in page.nodes:
+                        yield node
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _pages(
+        self,
+        operation: Operation,
+        values: dict[str, Any],
+        key: str,
+        cursor_var: str,
+        prefetch: bool,
+    ) -> AsyncGenerator[_Page, None]:
+        """Fetch each page of a connection in turn, feeding its end cursor into the cursor variable."""
+
+        async def fetch(cursor: str) -> _Page | None:
+            data = await self.execute(operation, {**values, cursor_var: cursor})
+            return data[key]
+
+        connection = (await self.execute(operation, values))[key]
+        next_page: asyncio.Task[_Page | None] | None = None
+        try:
+            while connection is not None:
+                page_info = connection.page_info
+                cursor = page_info.end_cursor if page_info.has_next_page else None
+                if cursor is not None and prefetch:
+                    next_page = asyncio.ensure_future(fetch(cursor))
+                yield connection
+                if cursor is None:
+                    break
+                connection = await (next_page or fetch(cursor))
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    @classmethod
+    def _connection_key(
+        cls, operation: Operation, key: str | None, cursor_var: str
+    ) -> str:
+        """Find the key of the top-level connection field of an operation to paginate."""
+        key, model = cls._list_field(operation, key)
+        if not issubclass(model, (Connection, CompactConnection)):
+            raise ValueError(f"The field {key!r} is not a connection.")
+        if cursor_var not in {var.name for var in operation.variables}:
+            raise ValueError(
+                f"The operation {operation.name!r} has no variable {cursor_var!r} to pass the cursor in."
+            )
+        return key
+
+    @staticmethod
+    def _list_field(
+        operation: Operation, key: str | None
+    ) -> tuple[str, type[BaseModel]]:
+        """Find the key and model of the top-level field of an operation to read items from."""
+        if key is None and len(operation.fields) != 1:
+            raise ValueError(
+                f"The operation {operation.name!r} has several top-level fields, so the key of one must be given."
+            )
+        for field in operation.fields:
+            if key is None or field.key == key:
+                if field.model is None:
+                    raise ValueError(
+                        f"The field {field.key!r} was not created from a Pydantic model."
+                    )
+                return field.key, field.model
+        raise ValueError(f"The operation {operation.name!r} has no field {key!r}.")
+
+    @staticmethod
+    def _parse(operation: Operation, response: httpx.Response) -> dict[str, Any]:
+        """Validate a response, preferring GraphQL errors to HTTP errors when the body contains them."""
+        try:
+            data = operation.parse_response(response.content)
+        except ValueError:
+            response.raise_for_status()
+            raise
+        response.raise_for_status()
+        return data
+
+    @staticmethod
+    def _parse_raw(response: httpx.Response) -> dict[str, Any]:
+        """Get the data from a response without validating it, preferring GraphQL errors to HTTP errors when the body contains them."""
+        try:
+            body = from_json(response.content)
+        except ValueError:
+            body = None
+        if not isinstance(body, dict) or not ("data" in body or "errors" in body):
+            response.raise_for_status()
+            raise ValueError(f"Invalid GraphQL response: {response.text!r}")
+        if body.get("errors"):
+            raise GraphQLError(body["errors"], body.get("data"))
+        response.raise_for_status()
+        return body.get("data") or {}
+
+    async def _send(
+        self,
+        operation: Operation,
+        variables: Mapping[str, Any] | None,
+        handle: Callable[[httpx.Response], R],
+    ) -> R:
+        """Send an operation and handle the response, using a persisted query if enabled."""
+        if self.persisted_queries:
+            response = await self._post(self._body(operation, variables, query=False))
+            try:
+                return handle(response)
+            except GraphQLError as e:
+                if not self._persisted_query_missed(e):
+                    raise
+        return handle(await self._post(self._body(operation, variables)))
+
+    def _persisted_query_missed(self, error: GraphQLError) -> bool:
+        """Check whether a request for a persisted query failed because the server doesn't have it, and whether to send the whole document.
+
+        If the server doesn't support persisted queries, they are disabled.
+        """
+        codes = {
+            code
+            for e in error.errors
+            for code in (e.get("message"), (e.get("extensions") or {}).get("code"))
+        }
+        if codes & {"PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"}:
+            self.persisted_queries = False
+            return True
+        return bool(codes & {"PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"})
+
+    async def _post(self, content: bytes) -> httpx.Response:
+        """Send a request body to the endpoint, waiting for a free slot first."""
+        async with self._semaphore:
+            return await self._http.post(
+                self.url, content=content, headers=self._headers
+            )
+
+    def _body(
+        self,
+        operation: Operation,
+        variables: Mapping[str, Any] | None,
+        *,
+        query: bool = True,
+    ) -> bytes:
+        """Encode the JSON body of a request for an operation.
+
+        Args:
+            operation: The operation to send.
+            variables: The values of the operation's variables.
+            query: Whether to include the document of the operation. If persisted queries are enabled, the hash of the document is included either way.
+        """
+        if isinstance(variables, BaseVars):
+            encoded_vars = variables.to_json_bytes()
+        else:
+            encoded_vars = to_json(dict(variables or {}))
+        parts = [
+            b'{"operationName":',
+            to_json(operation.name),
+            b',"variables":',
+            encoded_vars,
+        ]
+        if query:
+            parts += (b',"query":', to_json(operation.document))
+        if self.persisted_queries:
+            parts += (
+                b',"extensions":{"persistedQuery":{"version":1,"sha256Hash":"',
+                operation.document_hash.encode(),
+                b'"}}',
+            )
+        parts.append(b"}")
+        return b"".join(parts)
+
+    async def aclose(self) -> None:
+        """Close the client and its connections."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+async def _drain(queue: asyncio.Queue[Any], producers: int) -> AsyncIterator[Any]:
+    """Yield the pages put in a queue until each producer has put `None` to signal that it is done, raising any exception put instead."""
+    while producers:
+        page = await queue.get()
+        if page is None:
+            producers -= 1
+        elif isinstance(page, Exception):
+            raise page
+        else:
+            yield page
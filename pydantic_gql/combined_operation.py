@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Iterable, Mapping, Sequence
+
+from pydantic import BaseModel
+
+from .fragment import Fragment
+from .gql_field import GqlField
+from .operation import Operation
+from .values import GqlValue
+from .var import Var
+
+
+class CombinedOperation(Operation):
+    """An operation which combines several independent operations of the same type into one document, so that they can be sent to the server in a single request.
+
+    Top-level fields whose response keys collide are given aliases, and variables whose names collide are renamed, so the operations don't interfere with each other. The fragments of the operations are combined as well, so fragments with the same name must be identical. Use `merge_variables` to build the variables for the combined operation from the variables of each operation, and `split` to split the combined response back into the response of each operation.
+
+    ```python
+    combined = CombinedOperation(
+        "Dashboard",
+        Query.from_model(Book, "books", variables=BookVars, args={"first": BookVars.first}),
+        Query.from_model(Author, "authors", variables=AuthorVars, args={"first": AuthorVars.first}),
+    )
+    variables = combined.merge_variables(BookVars(first=10), AuthorVars(first=5))
+    response = httpx.post(..., json={"query": str(combined), "variables": variables}).json()
+    books_data, authors_data = combined.split(response["data"])
+    ```
+
+    Args:
+        name: The name of the combined operation.
+        operations: The operations to combine. They must all have the same type (e.g. all queries).
+        frozen: Whether the combined operation is immutable. See `Operation` for details.
+    """
+
+    def __init__(self, name: str, *operations: Operation, frozen: bool = False) -> None:
+        op_types = {op.type for op in operations}
+        if len(op_types) != 1:
+            raise ValueError(
+                f"Can only combine operations of one type, got {sorted(op_types)}."
+            )
+        keys: set[str] = set()
+        var_names: set[str] = set()
+        fields: list[GqlField] = []
+        variables: list[Var[Any]] = []
+        fragments: dict[str, Fragment] = {}
+        self._keys: list[Sequence[tuple[str, str]]] = []
+        self._var_names: list[Mapping[str, str]] = []
+        for i, op in enumerate(operations):
+            renamed = {
+                var.name: var.renamed(_unique(var.name, i, var_names))
+                for var in op.variables
+            }
+            variables.extend(renamed.values())
+            self._var_names.append({k: v.name for k, v in renamed.items()})
+            op_fields = [
+                _rename_field(f, _unique(f.key, i, keys), renamed) for f in op.fields
+            ]
+            self._keys.append(
+                [(f.key, orig.key) for f, orig in zip(op_fields, op.fields)]
+            )
+            fields.extend(op_fields)
+            for fragment in op.fragments:
+                fragment = replace(
+                    fragment,
+                    fields=tuple(_rename_vars(f, renamed) for f in fragment.fields),
+                )
+                if fragments.setdefault(fragment.name, fragment) != fragment:
+                    raise ValueError(
+                        f"Can't combine operations with different fragments named {fragment.name!r}."
+                    )
+        self.operations = operations
+        super().__init__(
+            op_types.pop(),
+            name,
+            *fields,
+            variables=variables,
+            fragments=fragments.values(),
+            frozen=frozen,
+        )
+
+    def merge_variables(self, *values: Mapping[str, Any]) -> dict[str, Any]:
+        """Merge the variable values of each operation into the variable values of the combined operation.
+
+        Args:
+            values: A mapping of variable names to values (such as a `BaseVars` instance) for each operation, in the order the operations were combined.
+
+        Returns:
+            A mapping of the combined operation's variable names to values. Only variables declared by the operations are included.
+        """
+        if len(values) != len(self.operations):
+            raise ValueError(
+                f"Expected variables for {len(self.operations)} operations, got {len(values)}."
+            )
+        return {
+            names[name]: value
+            for names, op_values in zip(self._var_names, values)
+            for name, value in op_values.items()
+            if name in names
+        }
+
+    def split(self, data: Mapping[str, Any]) -> list[dict[str, Any]]:
+        """Split the `data` of a response to the combined operation into the `data` each operation would have received on its own.
+
+        Args:
+            data: The `data` object of the response.
+
+        Returns:
+            The data of each operation, in the order the operations were combined. Fields missing from the response are `None`.
+        """
+        return [
+            {original: data.get(combined) for combined, original in keys}
+            for keys in self._keys
+        ]
+
+
+def _unique(name: str, index: int, used: set[str]) -> str:
+    """Get a name based on `name` that is not yet used, and mark it as used."""
+    unique = name
+    while unique in used:
+        unique = f"{name}_{index}"
+        index += 1
+    used.add(unique)
+    return unique
+
+
+def _rename_field(
+    field: GqlField, key: str, variables: Mapping[str, Var[Any]]
+) -> GqlField:
+    """Copy a top-level field, giving it an alias if its key changed and renaming the variables in its arguments and those of its subfields."""
+    return replace(
+        _rename_vars(field, variables),
+        alias=key if key != field.key else field.alias,
+    )
+
+
+def _rename_vars(field: GqlField, variables: Mapping[str, Var[Any]]) -> GqlField:
+    """Copy a field and its subfields, replacing the variables in their arguments."""
+    return replace(
+        field,
+        args={k: _rename_value(v, variables) for k, v in field.args.items()},
+        fields=tuple(_rename_vars(f, variables) for f in field.fields),
+    )
+
+
+def _rename_value(value: GqlValue, variables: Mapping[str, Var[Any]]) -> GqlValue:
+    """Replace the variables in an argument value with their renamed versions."""
+    if isinstance(value, Var):
+        return variables.get(value.name, value)
+    if isinstance(value, (str, BaseModel)):
+        return value
+    if isinstance(value, Mapping):
+        return {k: _rename_value(v, variables) for k, v in value.items()}
+    if isinstance(value, Iterable):
+        return [_rename_value(v, variables) for v in value]
+    return value
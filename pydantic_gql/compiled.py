@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+from dataclasses import replace
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+from .builders import minify
+from .gql_field import GqlField
+from .values import Expr, GqlValue
+
+if TYPE_CHECKING:
+    from .operation import Operation
+
+_PLACEHOLDER = re.compile("\x00([0-9]+)\x00")
+
+
+class CompiledOperation:
+    """An operation whose static text has been rendered ahead of time.
+
+    Rendering a compiled operation only formats the values of the arguments which are overridden, and splices them between the pre-rendered segments of the document. This is much faster than rendering the operation from scratch when the same operation is sent many times with different argument values.
+
+    Create compiled operations with `Operation.compile`.
+
+    ```python
+    query = Query.from_model(Book, "books", args={"limit": 10})
+    compiled = query.compile()
+    compiled.render()  # Same as str(query)
+    compiled.render({"books": {"limit": 20}})
+    ```
+
+    Args:
+        operation: The operation to compile.
+        format_spec: The format specifier to render the operation with. See `Operation.__format__` for valid values.
+
+    Raises:
+        ValueError: If the text of the operation contains a NUL character outside of a string, which isn't valid GraphQL.
+    """
+
+    def __init__(self, operation: Operation, format_spec: str = "") -> None:
+        from .builders.value_builder import ValueBuilder
+        from .operation import Operation
+
+        self._value_builder = ValueBuilder(minify=format_spec == "min")
+        self._slots: dict[str, dict[str, list[int]]] = {}
+        values: list[GqlValue] = []
+        fields = tuple(self._template_field(f, "", values) for f in operation.fields)
+        template = Operation(
+            operation.type,
+            operation.name,
+            *fields,
+            variables=operation.variables,
+            fragments=operation.fragments,
+        )
+        text = format(template, format_spec)
+        # Each placeholder is rendered exactly once, and NUL is escaped in strings, so any other NUL (which GraphQL doesn't allow in documents anyway) would be mistaken for part of a placeholder.
+        if text.count("\x00") != 2 * len(values):
+            raise ValueError(
+                "Can't compile an operation whose names, aliases or expressions contain a NUL character."
+            )
+        self._parts = _PLACEHOLDER.split(text)
+        self._separated: set[int] = set()
+        """The indices of values which were followed by a separator in the template. In minified output, whether one is needed depends on the value."""
+        if format_spec == "min":
+            for i in range(1, len(self._parts), 2):
+                if self._parts[i + 1].startswith(" "):
+                    self._parts[i + 1] = self._parts[i + 1][1:]
+                    self._separated.add(i)
+        positions: dict[int, list[int]] = {}
+        for i in range(1, len(self._parts), 2):
+            placeholder = int(self._parts[i])
+            positions.setdefault(placeholder, []).append(i)
+            self._parts[i] = self._render_value(i, values[placeholder])
+        for slots in self._slots.values():
+            for name, placeholders in slots.items():
+                slots[name] = [i for p in placeholders for i in positions[p]]
+
+    def _template_field(
+        self, field: GqlField, parent: str, values: list[GqlValue]
+    ) -> GqlField:
+        """Copy a field, replacing its argument values with numbered placeholders and recording which argument each one belongs to."""
+        path = f"{parent}.{field.key}" if parent else field.key
+        slots = self._slots.setdefault(path, {})
+        args: dict[str, GqlValue] = {}
+        for name, value in field.args.items():
+            slots.setdefault(name, []).append(len(values))
+            args[name] = Expr(f"\x00{len(values)}\x00")
+            values.append(value)
+        return replace(
+            field,
+            args=args,
+            fields=tuple(self._template_field(f, path, values) for f in field.fields),
+        )
+
+    @property
+    def paths(self) -> Mapping[str, Sequence[str]]:
+        """A mapping of the dot-separated path of each field to the names of its arguments that can be overridden in `render`."""
+        return {path: tuple(args) for path, args in self._slots.items() if args}
+
+    def render(self, args: Mapping[str, Mapping[str, GqlValue]] = {}) -> str:
+        """Render the operation, optionally overriding the values of some of its arguments.
+
+        Only arguments which were present in the operation when it was compiled may be overridden, since the argument names are part of the static text.
+
+        Args:
+            args: A mapping of dot-separated field paths (e.g. `"books"` or `"library.books"`, using the alias of fields which have one) to a mapping of argument names to their new values. Arguments which are not given keep the value they had when the operation was compiled. If several fields have the same path, the arguments of all of them are overridden.
+
+        Returns:
+            The operation as a string of GraphQL code.
+        """
+        if not args:
+            return "".join(self._parts)
+        parts = self._parts.copy()
+        for path, overrides in args.items():
+            if path not in self._slots:
+                raise ValueError(f"Unknown field path: {path!r}")
+            slots = self._slots[path]
+            for name, value in overrides.items():
+                if name not in slots:
+                    raise ValueError(
+                        f"Field {path!r} has no argument {name!r} to override."
+                    )
+                for index in slots[name]:
+                    parts[index] = self._render_value(index, value)
+        return "".join(parts)
+
+    def _render_value(self, index: int, value: GqlValue) -> str:
+        """Render the value of an argument to splice into the given part of the document."""
+        rendered = self._value_builder.build(value)
+        if index in self._separated:
+            rendered += minify.separator(rendered, self._parts[index + 1])
+        return rendered
+
+    def __str__(self) -> str:
+        return self.render()
@@ -1,8 +1,12 @@
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Annotated, Generic, Sequence, TypedDict, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
-__all__ = ["PageInfo", "Edge", "Connection"]
+from .gql_field import GqlField
+
+__all__ = ["PageInfo", "Edge", "Connection", "CompactConnection"]
+
+_F = TypeVar("_F", bound=GqlField)
 
 _T = TypeVar("_T", bound=BaseModel)
 
@@ -16,11 +20,11 @@ class PageInfo(BaseModel):
     has_previous_page: bool = Field(alias="hasPreviousPage")
     """Whether there is a previous page."""
 
-    start_cursor: str = Field(alias="startCursor")
-    """The cursor of the first item in the page."""
+    start_cursor: str | None = Field(alias="startCursor")
+    """The cursor of the first item in the page, or `None` if the page is empty."""
 
-    end_cursor: str = Field(alias="endCursor")
-    """The cursor of the last item in the page."""
+    end_cursor: str | None = Field(alias="endCursor")
+    """The cursor of the last item in the page, or `None` if the page is empty."""
 
 
 class Edge(BaseModel, Generic[_T]):
@@ -46,3 +50,57 @@ class Connection(BaseModel, Generic[_T]):
     """A list of edges in the connection."""
 
     page_info: PageInfo = Field(alias="pageInfo")
+    """Information about the page of the connection."""
+
+    @property
+    def nodes(self) -> list[_T]:
+        """The nodes of the edges in the connection."""
+        return [edge.node for edge in self.edges]
+
+
+class _NodeEdge(TypedDict, Generic[_T]):
+    """An edge of which only the node is selected."""
+
+    node: _T
+
+
+def _unwrap_nodes(edges: list[_NodeEdge[_T]]) -> list[_T]:
+    return [edge["node"] for edge in edges]
+
+
+class CompactConnection(BaseModel, Generic[_T]):
+    """A lighter connection type for pagination which keeps only the nodes of the edges.
+
+    It is selected in the same way as `Connection` except that the cursor of each edge is not requested, so the cursors are only available for the boundaries of the page, in `page_info`. The nodes are validated straight into a list, without creating an `Edge` model for each one, which makes validating large pages faster and uses less memory.
+    """
+
+    if TYPE_CHECKING:
+        nodes: list[_T]
+    else:
+        # Each edge is validated into a plain dict, from which the node is taken.
+        nodes: Annotated[list[_NodeEdge[_T]], AfterValidator(_unwrap_nodes)] = Field(
+            validation_alias="edges"
+        )
+    """The nodes of the edges in the connection."""
+
+    page_info: PageInfo = Field(alias="pageInfo")
+    """Information about the page of the connection."""
+
+    @classmethod
+    def __gql_fields__(
+        cls, field_class: type[_F], max_depth: int | None = None
+    ) -> Sequence[_F]:
+        """Select `edges { node { ... } }` and `pageInfo { ... }`, or nothing if `max_depth` doesn't reach the fields of the nodes."""
+        (node_model,) = cls.__pydantic_generic_metadata__["args"]
+        if max_depth is not None and max_depth < 2:
+            return ()
+        node_depth = None if max_depth is None else max_depth - 2
+        return (
+            field_class(
+                "edges",
+                fields=(
+                    field_class.from_model(node_model, "node", max_depth=node_depth),
+                ),
+            ),
+            field_class.from_model(PageInfo, "pageInfo"),
+        )
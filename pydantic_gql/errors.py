@@ -0,0 +1,22 @@
+from typing import Any, Mapping, Sequence
+
+
+class GraphQLError(Exception):
+    """An error reported by a GraphQL server in the `errors` of a response.
+
+    Args:
+        errors: The list of errors from the response.
+        data: The `data` object of the response, if any. A server may return partial data along with errors.
+    """
+
+    def __init__(
+        self,
+        errors: Sequence[Mapping[str, Any]],
+        data: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.errors = errors
+        self.data = data
+        super().__init__(
+            "; ".join(str(error.get("message", error)) for error in errors)
+            or "Unknown GraphQL error"
+        )
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, replace
+from typing import Mapping, Sequence
+
+from pydantic import BaseModel
+
+from .gql_field import FrozenGqlField, GqlField
+
+_NAME = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+
+
+@dataclass
+class Fragment:
+    """A named GraphQL fragment, which is a selection of fields on a type that can be spread into several selections.
+
+    Fragments are usually created by `Operation.with_fragments`, but they can also be created manually and passed to an operation, with `spread` placed among the fields of any selection that should include them.
+
+    ```python
+    author_fields = Fragment("AuthorFields", "Author", GqlField.fields_of_model(Author))
+    query = Query(
+        "Library",
+        GqlField("books", fields=(GqlField("title"), GqlField("author", fields=(author_fields.spread,)))),
+        GqlField("authors", fields=(author_fields.spread,)),
+        fragments=[author_fields],
+    )
+    ```
+
+    Args:
+        name: The name of the fragment.
+        type_name: The name of the GraphQL type the fragment selects fields from.
+        fields: The fields the fragment selects.
+    """
+
+    name: str
+    """The name of the fragment."""
+
+    type_name: str
+    """The name of the GraphQL type the fragment selects fields from."""
+
+    fields: Sequence[GqlField] = ()
+    """The fields the fragment selects."""
+
+    @property
+    def spread(self) -> GqlField:
+        """A field which spreads the fragment into a selection, i.e. `...Name`."""
+        return GqlField(f"...{self.name}")
+
+
+def extract_fragments(
+    fields: Sequence[GqlField],
+    *,
+    min_count: int = 2,
+    type_names: Mapping[type[BaseModel], str] = {},
+    reserved: set[str] = set(),
+) -> tuple[tuple[GqlField, ...], tuple[Fragment, ...]]:
+    """Replace the sub-selections derived from the same model which are repeated in a tree of fields with spreads of fragments.
+
+    Only the subfields of fields which have a `model` are replaced, and only if they appear at least `min_count` times in the final document. A selection that only appears inside a fragment is counted once, however many times that fragment is spread. The field itself, with its name, alias and arguments, stays where it was.
+
+    Args:
+        fields: The fields to search for repeated selections.
+        min_count: How many times a selection must appear to be replaced by a fragment.
+        type_names: The name of the GraphQL type of each model, which the fragments of its selections are defined on. Models which are not given use their class name, unless it is not a valid GraphQL name (as for generic models), in which case their selections are never replaced.
+        reserved: Names which the fragments must not be given.
+
+    Returns:
+        The new fields and the fragments they spread, with every fragment appearing after the fragments it spreads.
+    """
+    return _FragmentExtractor(min_count, type_names, reserved).extract(fields)
+
+
+_Key = tuple[str, type[BaseModel], tuple[FrozenGqlField, ...]]
+"""The GraphQL type name of a model, the model, and the structure of a selection derived from it."""
+
+
+class _FragmentExtractor:
+    """Finds the repeated selections in a tree of fields and replaces them with spreads of fragments."""
+
+    def __init__(
+        self,
+        min_count: int,
+        type_names: Mapping[type[BaseModel], str],
+        reserved: set[str],
+    ) -> None:
+        self._min_count = min_count
+        self._type_names = type_names
+        self._names = set(reserved)
+        self._structures: dict[int, tuple[FrozenGqlField, ...]] = {}
+        self._counts: dict[_Key, int] = {}
+        self._fragments: dict[_Key, Fragment] = {}
+
+    def extract(
+        self, fields: Sequence[GqlField]
+    ) -> tuple[tuple[GqlField, ...], tuple[Fragment, ...]]:
+        self._count(fields)
+        new_fields = self._replace(fields)
+        return new_fields, tuple(self._fragments.values())
+
+    def _count(self, fields: Sequence[GqlField]) -> None:
+        """Count how many times each selection appears, descending into each distinct selection only once, since a repeated one will only be written once."""
+        for field in fields:
+            if not field.fields:
+                continue
+            key = self._key(field)
+            if key is not None:
+                self._counts[key] = self._counts.get(key, 0) + 1
+                if self._counts[key] > 1:
+                    continue
+            self._count(field.fields)
+
+    def _replace(self, fields: Sequence[GqlField]) -> tuple[GqlField, ...]:
+        """Copy fields, replacing their repeated selections with spreads."""
+        return tuple(self._replace_field(field) for field in fields)
+
+    def _replace_field(self, field: GqlField) -> GqlField:
+        if not field.fields:
+            return field
+        key = self._key(field)
+        if key is None or self._counts[key] < self._min_count:
+            return replace(field, fields=self._replace(field.fields))
+        if key not in self._fragments:
+            subfields = self._replace(field.fields)
+            type_name = key[0]
+            self._fragments[key] = Fragment(self._name(type_name), type_name, subfields)
+        return replace(field, fields=(self._fragments[key].spread,))
+
+    def _key(self, field: GqlField) -> _Key | None:
+        """Identify the selection of a field, or `None` if it can't be replaced by a fragment."""
+        if field.model is None:
+            return None
+        type_name = self._type_names.get(field.model, field.model.__name__)
+        if not _NAME.fullmatch(type_name):
+            return None
+        return type_name, field.model, self._structure(field.fields)
+
+    def _structure(self, fields: Sequence[GqlField]) -> tuple[FrozenGqlField, ...]:
+        """Get a hashable value which is equal for selections that render the same, which is the selection with its fields frozen."""
+        # Frozen fields (such as the subtrees selected from models, which are shared through the cache of fields) are hashed once, and compared by how they render, so they are used as they are. The structure of each other selection is only computed once, reusing the structures of its subselections.
+        if id(fields) not in self._structures:
+            self._structures[id(fields)] = tuple(
+                (
+                    field
+                    if isinstance(field, FrozenGqlField)
+                    else FrozenGqlField(
+                        field.name,
+                        field.args,
+                        self._structure(field.fields),
+                        field.alias,
+                        field.model,
+                    )
+                )
+                for field in fields
+            )
+        return self._structures[id(fields)]
+
+    def _name(self, type_name: str) -> str:
+        """Get an unused name for a fragment on the given type."""
+        name = f"{type_name}Fields"
+        index = 2
+        while name in self._names:
+            name = f"{type_name}Fields{index}"
+            index += 1
+        self._names.add(name)
+        return name
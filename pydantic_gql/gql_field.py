@@ -1,23 +1,43 @@
-from dataclasses import dataclass, field
+from contextvars import ContextVar
+from dataclasses import FrozenInstanceError, dataclass, field
+from threading import Lock
 from types import UnionType
-from typing import Iterable, Mapping, Self, Sequence, Union, get_args, get_origin
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Self,
+    Sequence,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    overload,
+)
+from weakref import WeakValueDictionary
 
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
-from .values import GqlValue
+from .cache import LruCache
+from .values import GqlValue, ReadOnlyDict, freeze_value
 
 
-@dataclass
+@dataclass(slots=True)
 class GqlField:
     """A GraphQL field.
 
-    This class is used to represent a field in a GraphQL query. Fields can have arguments and subfields.
+    This class is used to represent a field in a GraphQL query. Fields can have arguments and subfields. Its attributes are stored in slots rather than a `__dict__`, which keeps large trees of fields small. Use `freeze` to get an immutable, hashable copy.
 
     Args:
         name: The name of the field.
         args: A mapping of argument names to argument values.
         fields: A sequence of subfields.
+        alias: An alias for the field, under which its value will appear in the response.
+        model: The Pydantic model the field was created from, if any. This is used to validate the value of the field in responses.
     """
 
     name: str
@@ -29,12 +49,60 @@ class GqlField:
     fields: Sequence[Self] = ()
     """A sequence of subfields for the field."""
 
+    alias: str | None = None
+    """An alias for the field, under which its value will appear in the response instead of under its name."""
+
+    model: type[BaseModel] | None = field(default=None, compare=False, repr=False)
+    """The Pydantic model the field was created from, if any. The value of the field in a response is validated into this model (or a list of it)."""
+
+    @property
+    def key(self) -> str:
+        """The key under which the value of the field appears in the response, i.e. its alias if it has one, otherwise its name."""
+        return self.alias or self.name
+
+    def freeze(self) -> "FrozenGqlField":
+        """Get an immutable, hashable copy of the field and its subfields. If the field is already frozen, it is returned as it is.
+
+        Lazy subfields stay lazy, and are frozen as they are created.
+        """
+        if isinstance(self, FrozenGqlField):
+            return self
+        # The subfields are frozen by the frozen field.
+        fields = cast(Sequence[FrozenGqlField], self.fields)
+        return FrozenGqlField(self.name, self.args, fields, self.alias, self.model)
+
+    def intern(self, pool: "FieldPool | None" = None) -> "FrozenGqlField":
+        """Get the frozen field which is equal to this one from a pool of fields, adding a frozen copy of it to the pool if there is none.
+
+        Args:
+            pool: The pool to get the field from. If `None`, the shared `field_pool` is used.
+
+        Returns:
+            A frozen field whose subfields are in the pool as well, so that equal subtrees of any fields interned in the same pool are the same objects.
+        """
+        return (GqlField.field_pool if pool is None else pool).intern(self)
+
+    field_pool: ClassVar["FieldPool"]
+    """The pool of fields shared by `intern` and frozen operations. See `FieldPool`."""
+
+    fields_cache: ClassVar[LruCache[tuple[Any, ...], Any]] = LruCache(maxsize=1024)
+    """A cache of the fields derived from each model by `fields_of_model`, for each maximum depth.
+
+    Pruned selections (see the `include` and `exclude` arguments) are cached for each set of paths. Lazy fields are cached as well. Without a maximum depth, they are cached separately for each set of models they are nested in, so that models which refer to themselves are still detected.
+
+    Use `fields_cache.info()` to see how many lookups were served from the cache. The fields in the cache are shared by every caller, and by the fields of the models which contain the model, so they are frozen (see `FrozenGqlField`).
+    """
+
     @classmethod
     def from_model(
         cls,
         model: type[BaseModel],
         name: str | None = None,
         args: Mapping[str, GqlValue] = {},
+        max_depth: int | None = None,
+        lazy: bool = False,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
     ) -> Self:
         """Create a `GqlField` from a Pydantic model.
 
@@ -44,34 +112,575 @@ class GqlField:
             model: The Pydantic model to create a field from.
             name: The name of the field. If not provided, the name of the model will be used.
             args: A mapping of argument names to argument values for the field.
+            max_depth: How many levels of nested models to select below the fields of the model. This is required for models which refer to themselves, directly or through other models. See `fields_of_model`.
+            lazy: Whether to create the subfields only when they are first used (e.g. when the field is rendered), instead of straight away. See `fields_of_model`.
+            include: The paths of the only fields of the model to select. See `fields_of_model`.
+            exclude: The paths of fields of the model not to select. See `fields_of_model`.
+
+        Returns:
+            A `GqlField` representing the model. If some of its fields are left out, its `model` is a subclass of the model in which they are optional, so that responses without them can be validated.
+        """
+        include = None if include is None else frozenset(include)
+        exclude = frozenset(exclude)
+        return cls(
+            name or model.__name__,
+            # The subfields are frozen fields shared with the cache, rather than instances of this class.
+            fields=cast(
+                Sequence[Self],
+                cls.fields_of_model(model, max_depth, lazy, include, exclude),
+            ),
+            args=args,
+            model=_pruned_model(model, include, exclude),
+        )
+
+    @classmethod
+    def fields_of_model(
+        cls,
+        model: type[BaseModel],
+        max_depth: int | None = None,
+        lazy: bool = False,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
+    ) -> Sequence["FrozenGqlField"]:
+        """Get the GraphQL fields corresponding to a Pydantic model.
+
+        A model whose fields don't mirror the selection it is validated from can define a classmethod `__gql_fields__`, which takes the `GqlField` class and the maximum depth, and returns the fields to select instead (see `CompactConnection`).
+
+        The result is cached per model and maximum depth in `fields_cache`, so repeated calls for the same model do not walk its fields again, and each model in a large graph of models is only expanded once for each depth it appears at. The cached fields are returned as they are, so they are frozen, since they are shared by every caller. Use `dataclasses.replace` to get a modified copy of one of them.
+
+        Args:
+            model: The Pydantic model to get the fields of.
+            max_depth: How many levels of nested models to select below the fields of the model. For example, if a `Category` model has a field `children: list[Category]`, then with a `max_depth` of 1 the fields of the children are selected, but not the fields of their children. Fields of nested models deeper than this are left out, so they should have default values. If `None`, all nested models are selected.
+            lazy: Whether to return `LazyFields`, which only creates the fields when they are first accessed, and creates the subfields of each of them lazily in turn. This makes it cheap to create operations from very large models which are only rendered later, if at all. Fields which are already in the cache are returned as they are.
+            include: The dot-separated paths of the only fields to select, using the names of the fields in the models (e.g. `{"title", "author.name"}`). A path to a nested model selects all of its fields, unless paths to some of them are given as well. If `None`, all the fields are selected.
+            exclude: The dot-separated paths of fields not to select (e.g. `{"author.bio", "reviews"}`). A field is left out if it is excluded, even if it is included as well.
 
         Returns:
-            A `GqlField` representing the model.
+            The frozen fields of the model, which are shared with the cache.
+
+        Raises:
+            ValueError: If `max_depth` is `None` and the model refers to itself, directly or through other models. If `lazy` is true, this is raised when the fields are accessed instead. Also raised if a path to include or exclude doesn't match a field.
         """
-        return cls(name or model.__name__, fields=cls.fields_of_model(model), args=args)
+        include = None if include is None else frozenset(include)
+        exclude = frozenset(exclude)
+        return cls._cached_fields_of_model(model, max_depth, lazy, include, exclude)
 
     @classmethod
-    def fields_of_model(cls, model: type[BaseModel]) -> Sequence[Self]:
-        """Get the GraphQL fields corresponding to a Pydantic model."""
-        return tuple(
-            cls.from_pydantic_field(name, field)
-            for name, field in model.model_fields.items()
+    def _cached_fields_of_model(
+        cls,
+        model: type[BaseModel],
+        max_depth: int | None,
+        lazy: bool,
+        include: frozenset[str] | None,
+        exclude: frozenset[str],
+    ) -> Sequence["FrozenGqlField"]:
+        """Get the fields of a model from the cache, or create and freeze them if they aren't in it."""
+        selection = () if include is None and not exclude else (include, exclude)
+        key = (cls, model, max_depth, *selection)
+        if lazy and key not in cls.fields_cache:
+            ancestors = _expanding.get() if max_depth is None else frozenset()
+            return cls.fields_cache.get(
+                (*key, LazyFields, ancestors),
+                lambda: LazyFields(cls, model, max_depth, include, exclude),
+            )
+        return cls.fields_cache.get(
+            key,
+            lambda: tuple(
+                f.freeze()
+                for f in cls._fields_of_model(model, max_depth, False, include, exclude)
+            ),
         )
 
     @classmethod
-    def from_pydantic_field(cls, name: str, field: FieldInfo) -> Self:
-        """Create a `GqlField` from a Pydantic field."""
+    def _fields_of_model(
+        cls,
+        model: type[BaseModel],
+        max_depth: int | None,
+        lazy: bool = False,
+        include: frozenset[str] | None = None,
+        exclude: frozenset[str] = frozenset(),
+    ) -> tuple[Self, ...]:
+        """Get the GraphQL fields corresponding to a Pydantic model, without the cache."""
+        custom_fields = getattr(model, "__gql_fields__", None)
+        if custom_fields is not None:
+            if include is not None or exclude:
+                raise ValueError(
+                    f"Can't include or exclude the fields of {model.__name__}, since it selects its own fields."
+                )
+            return tuple(custom_fields(cls, max_depth))
+        if not model.__pydantic_complete__:
+            # A model which refers to a model defined after it (as mutually recursive models do) has to be rebuilt before the types of its fields are known.
+            model.model_rebuild(raise_errors=False)
+        _check_paths(model, include, exclude)
+        expanding = _expanding.get()
+        if max_depth is None and model in expanding:
+            raise ValueError(
+                f"The model {model.__name__} refers to itself, so a max_depth must be given to select its fields."
+            )
+        token = _expanding.set(expanding | {model})
+        try:
+            fields = (
+                cls.from_pydantic_field(name, field, max_depth, lazy, *subpaths)
+                for name, field in model.model_fields.items()
+                if (subpaths := _subpaths(name, include, exclude)) is not None
+            )
+            # A nested model whose fields are all too deep or excluded can't be selected at all.
+            return tuple(f for f in fields if f.model is None or f.fields)
+        finally:
+            _expanding.reset(token)
+
+    @classmethod
+    def clear_cache(cls, model: type[BaseModel] | None = None) -> None:
+        """Clear the cached fields of a model, or of all models.
+
+        This is only needed if a model's fields are changed after it was first used (e.g. by `model_rebuild`). Note that the fields of a model which contains the given model are cached separately, so they are only cleared when no model is given.
+
+        Args:
+            model: The model whose fields should be cleared. If not provided, the whole cache is cleared.
+        """
+        if model is None:
+            cls.fields_cache.clear()
+        else:
+            cls.fields_cache.invalidate_where(lambda key: key[:2] == (cls, model))
+
+    @classmethod
+    def from_pydantic_field(
+        cls,
+        name: str,
+        field: FieldInfo,
+        max_depth: int | None = None,
+        lazy: bool = False,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
+    ) -> Self:
+        """Create a `GqlField` from a Pydantic field.
+
+        Args:
+            name: The name of the field in the model. It is used unless the field has a string validation alias.
+            field: The Pydantic field.
+            max_depth: If the field is a model, how many levels of nested models may be selected, counting the field's own subfields. If 0, no subfields are selected. If `None`, there is no limit.
+            lazy: Whether to create the subfields only when they are first accessed. See `fields_of_model`.
+            include: If the field is a model, the paths of the only subfields to select. See `fields_of_model`.
+            exclude: If the field is a model, the paths of subfields not to select. See `fields_of_model`.
+
+        Returns:
+            A `GqlField` whose subfields are frozen fields shared with the cache. See `fields_of_model`.
+        """
+        include = None if include is None else frozenset(include)
+        exclude = frozenset(exclude)
         submodel = _model_of(field)
+        fields: Sequence[FrozenGqlField] = ()
+        if submodel and max_depth != 0:
+            fields = cls._cached_fields_of_model(
+                submodel,
+                None if max_depth is None else max_depth - 1,
+                lazy,
+                include,
+                exclude,
+            )
         return cls(
             name=(
                 field.validation_alias
                 if isinstance(field.validation_alias, str)
                 else name
             ),
-            fields=cls.fields_of_model(submodel) if submodel else (),
+            # The subfields are frozen fields shared with the cache, rather than instances of this class.
+            fields=cast(Sequence[Self], fields),
+            model=_pruned_model(submodel, include, exclude) if submodel else None,
+        )
+
+
+@dataclass(slots=True, eq=False, weakref_slot=True)
+class FrozenGqlField(GqlField):
+    """An immutable and hashable `GqlField`.
+
+    The arguments and subfields are converted to read-only collections (and the subfields to frozen fields) when it is created. Lazy subfields are kept lazy, and frozen as they are created. Its hash is computed once from its structure (when it is first needed, if the subfields are lazy), so frozen fields can be used as dictionary keys, and comparing two fields with different hashes is immediate.
+
+    Two frozen fields are equal if they have the same name and alias, their arguments are written the same way in GraphQL, and their subfields are equal. As with `GqlField`, the `model` is not compared.
+    """
+
+    _args_text: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        from .builders.args_builder import ArgsBuilder
+
+        set_attr = object.__setattr__
+        set_attr(
+            self,
+            "args",
+            (
+                ReadOnlyDict({k: freeze_value(v) for k, v in self.args.items()})
+                if self.args
+                else _NO_ARGS
+            ),
+        )
+        set_attr(
+            self,
+            "fields",
+            (
+                self.fields
+                if isinstance(self.fields, LazyFields) or _is_frozen(self.fields)
+                else tuple(f.freeze() for f in self.fields)
+            ),
+        )
+        set_attr(
+            self, "_args_text", ArgsBuilder().build(self.args) if self.args else ""
+        )
+        if not isinstance(self.fields, LazyFields):
+            set_attr(self, "_hash", self._structure_hash())
+
+    def _structure_hash(self) -> int:
+        return hash((self.name, self.alias, self._args_text, tuple(self.fields)))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The attributes are only set through the generated __init__ before the arguments text is.
+        try:
+            self._args_text
+        except AttributeError:
+            object.__setattr__(self, name, value)
+        else:
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Create copies through the constructor, since the attributes can't be set once they are frozen.
+        return type(self), (
+            self.name,
+            dict(self.args),
+            self.fields,
+            self.alias,
+            self.model,
+        )
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            # The subfields are lazy, so they are only created now.
+            object.__setattr__(self, "_hash", self._structure_hash())
+            return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, GqlField):
+            return NotImplemented
+        # A field which isn't frozen is equal to the frozen fields it would be frozen into.
+        other = other.freeze()
+        return (
+            hash(self) == hash(other)
+            and self.name == other.name
+            and self.alias == other.alias
+            and self._args_text == other._args_text
+            and self.fields == other.fields
         )
 
 
+def _is_frozen(fields: Sequence[GqlField]) -> bool:
+    """Whether the fields are a tuple of frozen fields, which can be shared as it is."""
+    return type(fields) is tuple and all(isinstance(f, FrozenGqlField) for f in fields)
+
+
+_NO_ARGS: Mapping[str, GqlValue] = ReadOnlyDict({})
+"""The arguments of every frozen field without any, to save memory."""
+
+
+class FieldPool:
+    """A pool of frozen fields in which each tree of fields is stored only once.
+
+    Interning a field gets the frozen field in the pool which is equal to it, with the same model, or adds a frozen copy of it if there is none. The subfields are interned first (creating them if they are lazy), so equal subtrees are shared between all the fields in the pool, however many times they were created. Fields interned in the same pool are equal only if they are the same object, so comparing them (for example, as keys of a cache of rendered operations) takes constant time.
+
+    The pool only holds weak references to its fields, so fields are removed from it once nothing else uses them.
+    """
+
+    def __init__(self) -> None:
+        self._fields: WeakValueDictionary[_PoolKey, FrozenGqlField] = (
+            WeakValueDictionary()
+        )
+        self._lock = Lock()
+
+    def intern(self, field: GqlField) -> FrozenGqlField:
+        """Get the field in the pool which is equal to the given field, adding a frozen copy of it if there is none.
+
+        Args:
+            field: The field to intern.
+
+        Returns:
+            The interned field.
+        """
+        # A frozen field without lazy subfields can be added to the pool as it is.
+        reusable = (
+            field
+            if isinstance(field, FrozenGqlField) and isinstance(field.fields, tuple)
+            else None
+        )
+        if reusable is not None and self._get(reusable) is reusable:
+            # Its subfields were interned when it was added.
+            return reusable
+        fields = tuple(self.intern(f) for f in field.fields)
+        frozen: FrozenGqlField
+        if reusable is not None and all(
+            new is old for new, old in zip(fields, reusable.fields)
+        ):
+            frozen = reusable
+        else:
+            frozen = FrozenGqlField(
+                field.name, field.args, fields, field.alias, field.model
+            )
+        with self._lock:
+            return self._fields.setdefault(_pool_key(frozen), frozen)
+
+    def _get(self, field: FrozenGqlField) -> FrozenGqlField | None:
+        with self._lock:
+            return self._fields.get(_pool_key(field))
+
+    def clear(self) -> None:
+        """Remove all the fields from the pool. Fields which were already interned are not affected, but they won't be shared with fields interned later."""
+        with self._lock:
+            self._fields.clear()
+
+    def __len__(self) -> int:
+        """The number of distinct fields in the pool, including subfields."""
+        return len(self._fields)
+
+
+_PoolKey = tuple[str, str | None, str, Sequence[FrozenGqlField], Any]
+"""The name, alias, arguments text, interned subfields and model of a field in a `FieldPool`."""
+
+
+def _pool_key(field: FrozenGqlField) -> _PoolKey:
+    # The subfields of interned fields are interned too, so they are compared by identity.
+    return field.name, field.alias, field._args_text, field.fields, field.model
+
+
+GqlField.field_pool = FieldPool()
+
+
+class LazyFields(Sequence[FrozenGqlField]):
+    """The fields of a model, which are only created when they are first accessed, and then kept.
+
+    The subfields of the fields are lazy as well, so only the parts of a selection which are used are ever created. These are created by `GqlField.fields_of_model` (and the constructors which use it) with `lazy=True`, and can be used wherever a sequence of fields is expected. Like the rest of `GqlField.fields_cache`, they are shared by every caller, so the fields are frozen as they are created.
+
+    Args:
+        field_class: The class of the fields to create.
+        model: The model whose fields to create.
+        max_depth: How many levels of nested models to select below the fields of the model. See `GqlField.fields_of_model`.
+        include: The paths of the only fields to select. See `GqlField.fields_of_model`.
+        exclude: The paths of fields not to select. See `GqlField.fields_of_model`.
+    """
+
+    def __init__(
+        self,
+        field_class: type[GqlField],
+        model: type[BaseModel],
+        max_depth: int | None,
+        include: frozenset[str] | None = None,
+        exclude: frozenset[str] = frozenset(),
+    ) -> None:
+        self._field_class = field_class
+        self._model = model
+        self._max_depth = max_depth
+        self._include = include
+        self._exclude = exclude
+        self._fields: tuple[FrozenGqlField, ...] | None = None
+        # Expanding the fields later must still detect a model which refers to the models it is nested in.
+        self._ancestors = _expanding.get()
+
+    @property
+    def expanded(self) -> bool:
+        """Whether the fields have been created yet."""
+        return self._fields is not None
+
+    def _expand(self) -> tuple[FrozenGqlField, ...]:
+        if self._fields is None:
+            token = _expanding.set(self._ancestors)
+            try:
+                self._fields = tuple(
+                    f.freeze()
+                    for f in self._field_class._fields_of_model(
+                        self._model,
+                        self._max_depth,
+                        True,
+                        self._include,
+                        self._exclude,
+                    )
+                )
+            finally:
+                _expanding.reset(token)
+        return self._fields
+
+    @overload
+    def __getitem__(self, index: int) -> FrozenGqlField: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[FrozenGqlField]: ...
+    def __getitem__(
+        self, index: int | slice
+    ) -> FrozenGqlField | Sequence[FrozenGqlField]:
+        return self._expand()[index]
+
+    def __iter__(self) -> Iterator[FrozenGqlField]:
+        return iter(self._expand())
+
+    def __len__(self) -> int:
+        return len(self._expand())
+
+    def __bool__(self) -> bool:
+        # A model with a field that isn't a model always has some fields, so they don't need to be created to know that.
+        if (
+            self._fields is None
+            and self._model.__pydantic_complete__
+            and not hasattr(self._model, "__gql_fields__")
+            and any(
+                _model_of(field) is None
+                and _subpaths(name, self._include, self._exclude) is not None
+                for name, field in self._model.model_fields.items()
+            )
+        ):
+            return True
+        return bool(self._expand())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyFields):
+            other = other._expand()
+        return self._expand() == other
+
+    def __repr__(self) -> str:
+        if self._fields is None:
+            return f"LazyFields({self._model.__name__}, max_depth={self._max_depth})"
+        return repr(self._fields)
+
+
+_expanding: ContextVar[frozenset[type[BaseModel]]] = ContextVar(
+    "_expanding", default=frozenset()
+)
+"""The models whose fields are being expanded by `GqlField.fields_of_model`, to detect models which refer to themselves."""
+
+
+_Subpaths = tuple[frozenset[str] | None, frozenset[str]]
+"""The paths to include and exclude below a field."""
+
+
+def _subpaths(
+    name: str, include: frozenset[str] | None, exclude: frozenset[str]
+) -> _Subpaths | None:
+    """Get the paths to include and exclude below a field of a model, or `None` if the field itself is not selected."""
+    if name in exclude:
+        return None
+    prefix = f"{name}."
+    sub_include = None
+    if include is not None and name not in include:
+        sub_include = frozenset(
+            p.removeprefix(prefix) for p in include if p.startswith(prefix)
+        )
+        if not sub_include:
+            return None
+    sub_exclude = frozenset(
+        p.removeprefix(prefix) for p in exclude if p.startswith(prefix)
+    )
+    return sub_include, sub_exclude
+
+
+def _check_paths(
+    model: type[BaseModel], include: frozenset[str] | None, exclude: frozenset[str]
+) -> None:
+    """Make sure that the first part of each path to include or exclude is a field of the model, and that only paths to models continue below it."""
+    paths = (include or frozenset()) | exclude
+    names = {path.split(".", 1)[0] for path in paths}
+    unknown = names - model.model_fields.keys()
+    if unknown:
+        raise ValueError(
+            f"The model {model.__name__} has no fields named {', '.join(sorted(unknown))}."
+        )
+    for path in sorted(paths):
+        name, dot, _ = path.partition(".")
+        if dot and _model_of(model.model_fields[name]) is None:
+            raise ValueError(
+                f"Can't select {path!r}, since the field {name} of {model.__name__} is not a model."
+            )
+
+
+_pruned_models: LruCache[
+    tuple[type[BaseModel], frozenset[str] | None, frozenset[str]], type[BaseModel]
+] = LruCache(maxsize=1024)
+"""The models created by `_pruned_model`."""
+
+
+def _pruned_model(
+    model: type[BaseModel], include: frozenset[str] | None, exclude: frozenset[str]
+) -> type[BaseModel]:
+    """Get a model to validate a response to a pruned selection of a model's fields.
+
+    This is a subclass of the model in which the fields which are left out are optional, and the nested models which are pruned are replaced by their own pruned models. If no fields are left out, it is the model itself.
+    """
+    if (include is None and not exclude) or hasattr(model, "__gql_fields__"):
+        return model
+    return _pruned_models.get(
+        (model, include, exclude), lambda: _create_pruned_model(model, include, exclude)
+    )
+
+
+def _create_pruned_model(
+    model: type[BaseModel], include: frozenset[str] | None, exclude: frozenset[str]
+) -> type[BaseModel]:
+    overrides: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        subpaths = _subpaths(name, include, exclude)
+        if subpaths is None:
+            overrides[name] = (
+                Optional[field.annotation],
+                FieldInfo.merge_field_infos(field, default=None),
+            )
+            continue
+        submodel = _model_of(field)
+        if submodel is None:
+            continue
+        if _selects_nothing(submodel, *subpaths):
+            # The field is left out of the selection, since none of its fields are selected.
+            overrides[name] = (
+                Optional[field.annotation],
+                FieldInfo.merge_field_infos(field, default=None),
+            )
+            continue
+        pruned = _pruned_model(submodel, *subpaths)
+        if pruned is not submodel:
+            overrides[name] = (_replace_type(field.annotation, submodel, pruned), field)
+    if not overrides:
+        return model
+    return create_model(
+        model.__name__, __base__=model, __module__=model.__module__, **overrides
+    )
+
+
+def _selects_nothing(
+    model: type[BaseModel], include: frozenset[str] | None, exclude: frozenset[str]
+) -> bool:
+    """Whether none of the fields of a model are selected by the paths to include and exclude, including models whose own fields are all left out."""
+    if (include is None and not exclude) or hasattr(model, "__gql_fields__"):
+        return False
+    for name, field in model.model_fields.items():
+        subpaths = _subpaths(name, include, exclude)
+        if subpaths is None:
+            continue
+        submodel = _model_of(field)
+        if submodel is None or not _selects_nothing(submodel, *subpaths):
+            return False
+    return True
+
+
+def _replace_type(annotation: Any, old: type, new: type) -> Any:
+    """Replace a type in a type annotation, including in the arguments of generic types such as `list[old] | None`."""
+    if annotation is old:
+        return new
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    new_args = tuple(_replace_type(arg, old, new) for arg in args)
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return Union[new_args]
+    return origin[new_args]
+
+
 def _model_of(field: FieldInfo) -> type[BaseModel] | None:
     """Get the model class of a Pydantic field.
 
@@ -0,0 +1,155 @@
+"""Export a manifest of persisted queries to register with a server ahead of time.
+
+A manifest maps the SHA-256 hash of each operation's canonical document (see `Operation.document_hash`) to the document itself. Once a server has been given the manifest, clients only need to send the hashes.
+
+The operations are discovered by importing modules and collecting every `Operation` (such as a `Query` or `Mutation`) assigned at the module level, along with any operation registered with `register`.
+
+From the command line:
+
+```sh
+pydantic-gql-manifest myapp.queries myapp.mutations --output manifest.json
+```
+
+Or from Python:
+
+```python
+manifest = build_manifest(discover(["myapp.queries", "myapp.mutations"]))
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import sys
+from types import ModuleType
+from typing import Callable, Iterable, Sequence, TypeVar, overload
+
+from .operation import Operation
+
+__all__ = ["register", "registered", "discover", "build_manifest", "main"]
+
+O = TypeVar("O", bound=Operation)
+
+_registry: dict[int, Operation] = {}
+"""The operations registered with `register`, by their ID."""
+
+
+@overload
+def register(operation: O) -> O: ...
+@overload
+def register(operation: Callable[[], O]) -> Callable[[], O]: ...
+def register(operation: O | Callable[[], O]) -> O | Callable[[], O]:
+    """Register an operation to be included in manifests, even if it is not assigned at the module level.
+
+    This can be called with an operation, or used as a decorator on a function without parameters which creates an operation. In the latter case the function is called once, when it is decorated.
+
+    ```python
+    BOOKS = register(Query.from_model(Book, "books"))
+
+    @register
+    def authors_query() -> Query:
+        return Query.from_model(Author, "authors")
+    ```
+
+    Args:
+        operation: The operation, or a function which creates it.
+
+    Returns:
+        The argument, unchanged.
+    """
+    op = operation if isinstance(operation, Operation) else operation()
+    _registry[id(op)] = op
+    return operation
+
+
+def registered() -> list[Operation]:
+    """Get the operations registered with `register`, in the order they were registered."""
+    return list(_registry.values())
+
+
+def discover(
+    modules: Iterable[str | ModuleType], *, recursive: bool = False
+) -> list[Operation]:
+    """Import modules and collect the operations assigned at their module level, along with all the registered operations.
+
+    Args:
+        modules: The modules to search, or their names.
+        recursive: Whether to also search the submodules of any packages among the modules.
+
+    Returns:
+        The operations found, without duplicates, in the order they were found. Registered operations come last.
+    """
+    found: dict[int, Operation] = {}
+    for module in _import_all(modules, recursive):
+        for value in vars(module).values():
+            if isinstance(value, Operation):
+                found.setdefault(id(value), value)
+    for operation in registered():
+        found.setdefault(id(operation), operation)
+    return list(found.values())
+
+
+def build_manifest(operations: Iterable[Operation]) -> dict[str, str]:
+    """Create a manifest of persisted queries.
+
+    Args:
+        operations: The operations to include.
+
+    Returns:
+        A mapping from the hash of each operation's canonical document to the document, sorted by hash. Operations with the same document appear once.
+    """
+    documents = {op.document_hash: op.document for op in operations}
+    return dict(sorted(documents.items()))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the command line interface. See the module documentation."""
+    parser = argparse.ArgumentParser(
+        prog="pydantic-gql-manifest",
+        description="Write a JSON manifest mapping the SHA-256 hash of each operation to its document.",
+    )
+    parser.add_argument(
+        "modules", nargs="+", help="the modules to import and search for operations"
+    )
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="also search the submodules of packages",
+    )
+    parser.add_argument(
+        "-o", "--output", help="the file to write the manifest to (default: stdout)"
+    )
+    args = parser.parse_args(argv)
+    # Allow importing modules from the working directory, as `python -m` does.
+    sys.path.insert(0, "")
+    manifest = build_manifest(discover(args.modules, recursive=args.recursive))
+    text = json.dumps(manifest, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+
+
+def _import_all(
+    modules: Iterable[str | ModuleType], recursive: bool
+) -> Iterable[ModuleType]:
+    """Import the given modules, and the submodules of any packages among them if `recursive` is true."""
+    for name_or_module in modules:
+        module = (
+            importlib.import_module(name_or_module)
+            if isinstance(name_or_module, str)
+            else name_or_module
+        )
+        yield module
+        if recursive and hasattr(module, "__path__"):
+            for info in pkgutil.walk_packages(module.__path__, f"{module.__name__}."):
+                yield importlib.import_module(info.name)
+
+
+if __name__ == "__main__":
+    main()
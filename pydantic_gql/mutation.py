@@ -4,6 +4,7 @@ from typing import Any, Iterable, Mapping, Self
 
 from pydantic import BaseModel
 
+from .fragment import Fragment
 from .gql_field import GqlField
 from .operation import Operation
 from .values import GqlValue
@@ -65,6 +66,7 @@ class Mutation(Operation):
     f"default indentation of 2 spaces: {mutation}"
     f"same as above:                   {mutation:indent}"
     f"no indentation; all on one line: {mutation:noindent}"
+    f"smallest valid document:         {mutation:min}"
     f"indentation of 4 spaces:         {mutation:4}"
     f"indentation with tabs:           {mutation:\t}"
     ```
@@ -73,12 +75,26 @@ class Mutation(Operation):
         name: The name of the mutation. This has no meaning in the GraphQL mutation itself; it is just a label for you to identify the mutation.
         fields: The fields to include in the mutation. These can be created manually or using the `GqlField.from_model` constructor.
         variables: The variables to include in the mutation.
+        fragments: The fragments spread by the fields. See `Operation` for details.
+        frozen: Whether the mutation is immutable, which allows its string to be cached. See `Operation` for details.
     """
 
     def __init__(
-        self, name: str, *fields: GqlField, variables: Iterable[Var[Any]] = ()
+        self,
+        name: str,
+        *fields: GqlField,
+        variables: Iterable[Var[Any]] = (),
+        fragments: Iterable[Fragment] = (),
+        frozen: bool = False,
     ) -> None:
-        super().__init__("mutation", name, *fields, variables=variables)
+        super().__init__(
+            "mutation",
+            name,
+            *fields,
+            variables=variables,
+            fragments=fragments,
+            frozen=frozen,
+        )
 
     @classmethod
     def from_model(
@@ -88,6 +104,11 @@ class Mutation(Operation):
         mutation_name: str | None = None,
         variables: Iterable[Var[Any]] = (),
         args: Mapping[str, GqlValue] = {},
+        frozen: bool = False,
+        max_depth: int | None = None,
+        lazy: bool = False,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
     ) -> Self:
         """Create a mutation with a single top-level field whose subfields are defined by a Pydantic model.
 
@@ -151,10 +172,18 @@ class Mutation(Operation):
             mutation_name: The name of the mutation. If not provided, the name of the model is used.
             variables: The variables to include in the mutation.
             args: The arguments to pass to the top-level field.
+            frozen: Whether the mutation is immutable, which allows its string to be cached. See `Operation` for details.
+            max_depth: How many levels of nested models to select below the fields of the model. This is required for models which refer to themselves. See `GqlField.fields_of_model`.
+            lazy: Whether to create the subfields of the top-level field only when the mutation is first rendered. See `GqlField.fields_of_model`.
+            include: The dot-separated paths of the only fields of the model to select, such as `{"title", "author.name"}`. See `GqlField.fields_of_model`.
+            exclude: The dot-separated paths of fields of the model not to select, such as `{"author.bio", "reviews"}`. See `GqlField.fields_of_model`.
         """
 
         return cls(
             mutation_name or model.__name__,
-            GqlField.from_model(model, field_name, args),
+            GqlField.from_model(
+                model, field_name, args, max_depth, lazy, include, exclude
+            ),
             variables=variables,
+            frozen=frozen,
         )
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+import copy
+import hashlib
+from dataclasses import FrozenInstanceError, replace
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    Iterable,
+    Mapping,
+    Self,
+    TypedDict,
+    TypeVar,
+)
 
-from .gql_field import GqlField
+from pydantic import BaseModel, Field, TypeAdapter
+
+from .cache import LruCache
+from .errors import GraphQLError
+from .fragment import Fragment, extract_fragments
+from .gql_field import FrozenGqlField, GqlField, LazyFields
 from .var import Var
 
+if TYPE_CHECKING:
+    from .builders.operation_builder import OperationBuilder
+    from .compiled import CompiledOperation
+
+T = TypeVar("T")
+
 
 class Operation:
     """A GraphQL operation object, such as a query or mutation, which is a collection of fields to be queried from a GraphQL API.
@@ -14,23 +39,55 @@ class Operation:
         op_name: The name of the operation. This has no meaning in the GraphQL operation itself; it is just a label for you to identify the operation.
         fields: The fields to include in the operation. These can be created manually or using the `GqlField.from_model` constructor.
         variables: The variables to include in the operation.
+        fragments: The fragments spread by the fields, which are defined after the operation in its document. See `Fragment` and `with_fragments`.
+        frozen: Whether the operation is immutable. A frozen operation takes a snapshot of its fields, arguments and variables when it is created and can't be modified afterwards (its fields are interned in `GqlField.field_pool`, so subtrees shared by many frozen operations are stored once), so the string it renders to is computed only once per format specifier and then cached. Frozen operations are also hashable and compare equal to other frozen operations which render to the same document.
     """
 
+    builder_class: ClassVar[type[OperationBuilder] | None] = None
+    """The builder used to render operations to strings. If `None`, `OperationBuilder` is used. Set this to `IterativeOperationBuilder` (from `pydantic_gql.builders`) to use the single-pass rendering engine instead."""
+
     def __init__(
         self,
         op_type: str,
         op_name: str,
         *fields: GqlField,
         variables: Iterable[Var[Any]] = (),
+        fragments: Iterable[Fragment] = (),
+        frozen: bool = False,
     ) -> None:
         self.type = op_type
         self.name = op_name
-        self.fields = fields
-        self.variables = tuple(variables)
+        self.fields = tuple(_freeze_field(f) for f in fields) if frozen else fields
+        self.variables = (
+            tuple(_freeze_var(v) for v in variables) if frozen else tuple(variables)
+        )
+        self.fragments = (
+            tuple(_freeze_fragment(f) for f in fragments)
+            if frozen
+            else tuple(fragments)
+        )
+        self._rendered: dict[str, str] = {}
+        self._hashes: dict[str, str] = {}
+        self.frozen = frozen
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "frozen", False):
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super().__setattr__(name, value)
 
     def __format__(self, format_spec: str) -> str:
+        if not self.frozen:
+            return self._render(format_spec)
+        if format_spec not in self._rendered:
+            self._rendered[format_spec] = self._render(format_spec)
+        return self._rendered[format_spec]
+
+    def _render(self, format_spec: str) -> str:
+        """Render the operation from scratch with the given format specifier."""
         from .builders.operation_builder import OperationBuilder
 
+        if format_spec == "min":
+            return (self.builder_class or OperationBuilder)(minify=True).build(self)
         indent: bool | int | str
         if format_spec in ("", "indent"):
             indent = True
@@ -42,12 +99,198 @@ class Operation:
             indent = format_spec
         else:
             raise ValueError(
-                f"Invalid format specifier: {format_spec!r}. Must be one of '', 'indent', 'noindent', whitespace, or a positive integer."
+                f"Invalid format specifier: {format_spec!r}. Must be one of '', 'indent', 'noindent', 'min', whitespace, or a positive integer."
             )
-        return OperationBuilder(indent=indent).build(self)
+        return (self.builder_class or OperationBuilder)(indent=indent).build(self)
+
+    @property
+    def document(self) -> str:
+        """The canonical text of the operation, as sent to a server.
+
+        This is the operation rendered without indentation. It is cached if the operation is frozen.
+        """
+        return f"{self:noindent}"
+
+    @property
+    def document_hash(self) -> str:
+        """The SHA-256 hash of the `document`, as a hexadecimal string.
+
+        This identifies the operation for persisted queries. It is cached if the operation is frozen.
+        """
+        if not self.frozen:
+            return _sha256(self.document)
+        if "noindent" not in self._hashes:
+            self._hashes["noindent"] = _sha256(self.document)
+        return self._hashes["noindent"]
+
+    def with_fragments(
+        self, *, min_count: int = 2, type_names: Mapping[type[BaseModel], str] = {}
+    ) -> Self:
+        """Create a copy of the operation in which each repeated selection of subfields derived from the same model is written once, as a named fragment, and spread wherever it appeared.
+
+        For example, if an `Author` model is nested under both `Book` and `Review`, the selection of its fields appears once in the document as `fragment AuthorFields on Author {...}`, and each `author` field selects `...AuthorFields` instead. This makes the documents of operations on wide schemas smaller and quicker for the server to parse, without changing the shape of the response.
+
+        Args:
+            min_count: How many times a selection must appear in the document to be replaced by a fragment.
+            type_names: The name of the GraphQL type of each model, which its fragments are defined on. By default the name of the model class is used, and models whose class names are not valid GraphQL names (such as generic models like `Connection[Book]`) are never replaced by fragments.
+
+        Returns:
+            A copy of the operation with the fragments added. It is frozen if this operation is.
+        """
+        fields, fragments = extract_fragments(
+            self.fields,
+            min_count=min_count,
+            type_names=type_names,
+            reserved={f.name for f in self.fragments},
+        )
+        operation = copy.copy(self)
+        fragments = self.fragments + fragments
+        if self.frozen:
+            fields = tuple(_freeze_field(f) for f in fields)
+            fragments = tuple(_freeze_fragment(f) for f in fragments)
+        # Bypass the frozen check, since the copy hasn't been handed out yet.
+        object.__setattr__(operation, "fields", fields)
+        object.__setattr__(operation, "fragments", fragments)
+        object.__setattr__(operation, "_rendered", {})
+        object.__setattr__(operation, "_hashes", {})
+        return operation
+
+    def compile(self, format_spec: str = "") -> CompiledOperation:
+        """Pre-render the static text of the operation so that it can be rendered quickly many times with different argument values.
+
+        The compiled operation does not reflect later changes to this operation.
+
+        Args:
+            format_spec: The format specifier to render the operation with (the same as for `format(operation, format_spec)`).
+
+        Returns:
+            A `CompiledOperation` whose `render` method produces the operation string.
+
+        Raises:
+            ValueError: If the text of the operation contains a NUL character outside of a string, which isn't valid GraphQL.
+        """
+        from .compiled import CompiledOperation
+
+        return CompiledOperation(self, format_spec)
+
+    @property
+    def response_adapter(self) -> TypeAdapter[Any]:
+        """A validator for the whole JSON response to this operation, i.e. an object with `data` and `errors`.
+
+        In the `data`, the value of each top-level field that has a `model` (such as fields created with `GqlField.from_model`) is validated into an instance of that model, or a list of instances if the value is a list. The values of other fields are left as they are.
+
+        The validator is built once for each combination of top-level field keys and models, and then cached.
+        """
+        shape = tuple((field.key, field.model) for field in self.fields)
+        return _response_adapters.get(shape, lambda: _response_adapter(shape))
+
+    def parse_response(self, content: bytes | str) -> dict[str, Any]:
+        """Validate a JSON response to this operation directly from its raw content.
+
+        This parses and validates the whole response in one pass, without first decoding the JSON into Python objects. See `response_adapter` for how the data is validated.
+
+        Args:
+            content: The body of the response.
+
+        Returns:
+            A mapping from the key of each top-level field (its alias or name) to its validated value. Fields missing from the response are `None`.
+
+        Raises:
+            GraphQLError: If the response contains any errors.
+            pydantic.ValidationError: If the response is not valid.
+        """
+        response = self.response_adapter.validate_json(content)
+        data = response.get("data") or {}
+        if response.get("errors"):
+            raise GraphQLError(response["errors"], data)
+        return {field.key: data.get(field.key) for field in self.fields}
+
+    def parse_data(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate the `data` object of a response to this operation which has already been decoded from JSON.
+
+        See `response_adapter` for how the data is validated. If you have the raw response, `parse_response` is faster.
+
+        Args:
+            data: The `data` object of the response.
+
+        Returns:
+            A mapping from the key of each top-level field (its alias or name) to its validated value. Fields missing from the data are `None`.
+        """
+        validated = self.response_adapter.validate_python({"data": data})["data"]
+        return {field.key: validated.get(field.key) for field in self.fields}
 
     def __str__(self) -> str:
         return self.__format__("")
 
     def __repr__(self) -> str:
         return f"<{self.type} {self:noindent}>"
+
+    def __eq__(self, other: object) -> bool:
+        if not (self.frozen and isinstance(other, Operation) and other.frozen):
+            return self is other
+        return f"{self:noindent}" == f"{other:noindent}"
+
+    def __hash__(self) -> int:
+        if not self.frozen:
+            return super().__hash__()
+        return hash(f"{self:noindent}")
+
+
+_ResponseShape = tuple[tuple[str, type[BaseModel] | None], ...]
+"""The key and model of each top-level field of an operation."""
+
+_response_adapters: LruCache[_ResponseShape, TypeAdapter[Any]] = LruCache(maxsize=1024)
+"""Validators for the responses to operations with each shape."""
+
+
+class _Response(TypedDict, Generic[T], total=False):
+    """A GraphQL response whose `data` is of type `T`."""
+
+    data: T | None
+    errors: list[dict[str, Any]]
+
+
+def _response_adapter(shape: _ResponseShape) -> TypeAdapter[Any]:
+    """Create a validator for the response to an operation with the given top-level fields."""
+    fields = {key: _value_type(model) for key, model in shape}
+    data: Any = TypedDict("Data", fields, total=False)  # type: ignore[misc]
+    return TypeAdapter(_Response[data])
+
+
+def _value_type(model: type[BaseModel] | None) -> Any:
+    """Get the type of the value of a field created from a model, which may be an object, a list of objects or null."""
+    if model is None:
+        return Any
+    # Smart unions validate large lists noticeably slower than trying each type in order.
+    return Annotated[
+        list[model] | model | None,  # type: ignore[valid-type]
+        Field(union_mode="left_to_right"),
+    ]
+
+
+def _sha256(document: str) -> str:
+    return hashlib.sha256(document.encode()).hexdigest()
+
+
+def _freeze_field(field: GqlField) -> FrozenGqlField:
+    """Get a copy of a field and its subfields which can't be modified.
+
+    The copy is interned in the shared `GqlField.field_pool`, so that the subtrees which many frozen operations have in common are only stored once. Fields with lazy subfields (at any depth) are frozen without being interned instead, since interning them would create all their subfields. Their lazy subfields are frozen as they are created.
+    """
+    return field.freeze() if _has_lazy_fields(field) else field.intern()
+
+
+def _has_lazy_fields(field: GqlField) -> bool:
+    return isinstance(field.fields, LazyFields) or any(
+        _has_lazy_fields(f) for f in field.fields
+    )
+
+
+def _freeze_var(var: Var[Any]) -> Var[Any]:
+    """Create a copy of a variable and its default value, so that later changes to the original don't affect the operation."""
+    return copy.deepcopy(var)
+
+
+def _freeze_fragment(fragment: Fragment) -> Fragment:
+    """Create a copy of a fragment whose fields can't be modified."""
+    return replace(fragment, fields=tuple(_freeze_field(f) for f in fragment.fields))
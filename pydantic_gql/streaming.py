@@ -0,0 +1,237 @@
+"""Incremental parsing of large list responses.
+
+The functions in this module read a GraphQL response as a stream of bytes and yield the validated items of one list field under `data` as soon as each of them has been received. Only the item currently being read is kept in memory, so memory usage is bounded regardless of the size of the response.
+
+```python
+with open("response.json", "rb") as file:
+    for book in iter_list(file, "books", Book):
+        ...
+```
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import IO, Any, AsyncIterable, AsyncIterator, Iterable, Iterator, TypeVar
+
+from pydantic import BaseModel
+
+from .errors import GraphQLError
+
+__all__ = ["iter_list", "aiter_list"]
+
+M = TypeVar("M", bound=BaseModel)
+
+_NON_WHITESPACE = re.compile(r"[^ \t\r\n]")
+
+_DECODER = json.JSONDecoder()
+
+
+def iter_list(
+    source: IO[bytes] | Iterable[bytes],
+    key: str,
+    model: type[M],
+    *,
+    chunk_size: int = 1 << 16,
+) -> Iterator[M]:
+    """Read a GraphQL response incrementally and yield the items of the list at `data.<key>`.
+
+    Args:
+        source: A binary file (or file-like object) to read the response from, or an iterable of chunks of bytes.
+        key: The key of the top-level field whose value is the list (its alias or name).
+        model: The model to validate each item into.
+        chunk_size: The number of bytes to read from a file at a time.
+
+    Yields:
+        Each item of the list, validated into the model. If the value of the field is null or missing, nothing is yielded.
+
+    Raises:
+        GraphQLError: If the response contains any errors.
+        ValueError: If the response is not valid JSON or is incomplete.
+    """
+    chunks = (
+        iter(lambda: source.read(chunk_size), b"")
+        if hasattr(source, "read")
+        else source
+    )
+    scanner = _ListScanner(key)
+    for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield model.model_validate_json(item)
+        scanner.check()
+    for item in scanner.close():
+        yield model.model_validate_json(item)
+    scanner.check(final=True)
+
+
+async def aiter_list(
+    source: AsyncIterable[bytes], key: str, model: type[M]
+) -> AsyncIterator[M]:
+    """Read a GraphQL response incrementally from an asynchronous stream and yield the items of the list at `data.<key>`.
+
+    This is the asynchronous equivalent of `iter_list`, e.g. for the `aiter_bytes()` of a streamed HTTP response.
+
+    Args:
+        source: An asynchronous iterable of chunks of bytes.
+        key: The key of the top-level field whose value is the list (its alias or name).
+        model: The model to validate each item into.
+
+    Yields:
+        Each item of the list, validated into the model. If the value of the field is null or missing, nothing is yielded.
+
+    Raises:
+        GraphQLError: If the response contains any errors.
+        ValueError: If the response is not valid JSON or is incomplete.
+    """
+    scanner = _ListScanner(key)
+    async for chunk in source:
+        for item in scanner.feed(chunk):
+            yield model.model_validate_json(item)
+        scanner.check()
+    for item in scanner.close():
+        yield model.model_validate_json(item)
+    scanner.check(final=True)
+
+
+class _Frame:
+    """An object or array of the response which is being navigated token by token."""
+
+    def __init__(self, kind: str, path: tuple[str, ...]) -> None:
+        self.kind = kind
+        self.path = path
+        self.closing = "}" if kind == "{" else "]"
+        self.key = ""
+        self.state = "key" if kind == "{" else "value"
+
+
+class _ListScanner:
+    """A push parser which finds the raw JSON of each item of the list at `data.<key>` in a response.
+
+    Only the objects on the way to the list (and the list itself) are navigated token by token. Every other value, including each item of the list, is read whole by the C scanner of the `json` module. A value which is cut off at the end of the data received so far is read again once enough data has arrived to double its length, so each byte is scanned a constant number of times on average.
+    """
+
+    def __init__(self, key: str) -> None:
+        self._target = ("data", key)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._retry_at = 0
+        self._stack: list[_Frame] = []
+        self._started = False
+        self._done = False
+        self._errors: list[dict[str, Any]] | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of the response and get the raw JSON of the items which have been completed."""
+        self._text += self._decoder.decode(chunk)
+        return self._scan()
+
+    def close(self) -> list[bytes]:
+        """Signal the end of the response and get the raw JSON of the remaining items."""
+        self._text += self._decoder.decode(b"", final=True)
+        self._retry_at = 0
+        return self._scan(final=True)
+
+    def check(self, final: bool = False) -> None:
+        """Raise the errors of the response if any have been found. If `final` is true, also check that the whole response was received."""
+        if self._errors:
+            raise GraphQLError(self._errors)
+        if final and (not self._done or self._text.strip()):
+            raise ValueError("The JSON response is incomplete or invalid.")
+
+    def _scan(self, final: bool = False) -> list[bytes]:
+        """Consume as much of the text as possible and discard it. Scanning stops at the errors of the response, if any."""
+        items: list[bytes] = []
+        if len(self._text) >= self._retry_at:
+            while not self._done and not self._errors and self._step(items, final):
+                pass
+        self._text = self._text[self._pos :]
+        self._retry_at = max(self._retry_at - self._pos, 0)
+        self._pos = 0
+        return items
+
+    def _step(self, items: list[bytes], final: bool) -> bool:
+        """Consume one token or value. Returns `False` if more data is needed."""
+        text = self._text
+        match = _NON_WHITESPACE.search(text, self._pos)
+        if not match:
+            return False
+        pos = match.start()
+        char = text[pos]
+        if not self._started:
+            self._expect(char, "{")
+            self._started = True
+            self._stack.append(_Frame("{", ()))
+            self._pos = pos + 1
+            return True
+        frame = self._stack[-1]
+        if char == frame.closing and frame.state in (
+            "next",
+            "key" if frame.kind == "{" else "value",
+        ):
+            self._stack.pop()
+            self._done = not self._stack
+        elif frame.state == "colon":
+            self._expect(char, ":")
+            frame.state = "value"
+        elif frame.state == "next":
+            self._expect(char, ",")
+            frame.state = "key" if frame.kind == "{" else "value"
+        elif frame.state == "key":
+            self._expect(char, '"')
+            key = self._read(pos, final)
+            if key is None:
+                return False
+            frame.key = json.loads(key)
+            frame.state = "colon"
+            return True
+        elif frame.kind == "{" and char in "{[" and self._navigable(frame, char):
+            frame.state = "next"
+            self._stack.append(_Frame(char, (*frame.path, frame.key)))
+        else:
+            value = self._read(pos, final)
+            if value is None:
+                return False
+            frame.state = "next"
+            if frame.kind == "[":
+                items.append(value.encode())
+            elif frame.path == () and frame.key == "errors":
+                self._errors = json.loads(value)
+                return not self._errors
+            return True
+        self._pos = pos + 1
+        return True
+
+    def _navigable(self, frame: _Frame, char: str) -> bool:
+        """Check whether the value of the current key of a frame leads to the list."""
+        path = (*frame.path, frame.key)
+        if char == "[":
+            return path == self._target
+        return path == self._target[: len(path)] and path != self._target
+
+    def _read(self, pos: int, final: bool) -> str | None:
+        """Read a whole JSON value starting at a position, or get `None` if it is not complete yet."""
+        try:
+            end = _DECODER.raw_decode(self._text, pos)[1]
+        except json.JSONDecodeError:
+            if final:
+                raise
+            end = None
+        if end is None or (
+            end == len(self._text) and not final and self._text[end - 1] not in '"]}'
+        ):
+            # The value is cut off, e.g. in the middle of a string, or it is a number or literal which may continue.
+            self._pos = pos
+            self._retry_at = pos + 2 * (len(self._text) - pos) + 1
+            return None
+        self._pos = end
+        return self._text[pos:end]
+
+    @staticmethod
+    def _expect(char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(
+                f"Expected {expected!r} but got {char!r} in the JSON response."
+            )
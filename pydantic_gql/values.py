@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, Mapping, TypeVar
+
+from pydantic import BaseModel
 
 from .var import Var
 
+K = TypeVar("K")
+V = TypeVar("V")
+
 
 @dataclass
 class Expr:
@@ -20,4 +25,58 @@ class Expr:
         return self.value
 
 
-GqlValue = str | int | float | bool | None | Iterable[Any] | Var[Any] | Expr
+GqlValue = (
+    str
+    | int
+    | float
+    | bool
+    | None
+    | Iterable[Any]
+    | Mapping[str, Any]
+    | BaseModel
+    | Var[Any]
+    | Expr
+)
+
+
+def freeze_value(value: GqlValue) -> GqlValue:
+    """Convert mutable collections in an argument value to read-only ones."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    if isinstance(value, Mapping):
+        return ReadOnlyDict({k: freeze_value(v) for k, v in value.items()})
+    if isinstance(value, Iterable):
+        return tuple(freeze_value(v) for v in value)
+    return value
+
+
+class ReadOnlyDict(Mapping[K, V]):
+    """A mapping which can't be modified, used for the arguments of frozen fields and operations.
+
+    Unlike `types.MappingProxyType`, it can be copied and pickled.
+
+    Args:
+        items: The items of the mapping. They are copied, so later changes to them are not reflected.
+    """
+
+    __slots__ = ("_dict",)
+
+    def __init__(self, items: Mapping[K, V] = {}) -> None:
+        self._dict = dict(items)
+
+    def __getitem__(self, key: K) -> V:
+        return self._dict[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._dict)
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._dict!r})"
+
+    def __reduce__(self) -> tuple[type[ReadOnlyDict[K, V]], tuple[dict[K, V]]]:
+        return type(self), (self._dict,)
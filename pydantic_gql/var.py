@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import cached_property
+from copy import copy
 from types import UnionType
 from typing import (
     TYPE_CHECKING,
@@ -20,7 +20,21 @@ if TYPE_CHECKING:
     from .base_vars import BaseVars
 
 TypeAnnotation = Union[type, _SpecialForm, UnionType]
-NOTSET: Any = object()
+
+
+class _NotSet:
+    """The type of `NOTSET`. It is copied and pickled as a reference to `NOTSET`, so that copies of variables can still tell which of their attributes are unset."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "NOTSET"
+
+    def __repr__(self) -> str:
+        return "NOTSET"
+
+
+NOTSET: Any = _NotSet()
 T = TypeVar("T")
 
 
@@ -34,6 +48,17 @@ class Var(Generic[T]):
         type_name: The name of the type in the GraphQL schema. If provided, it may not contain any `!` or `[]` as these will be added automatically based on type annotations. If not provided, the type name will be determined automatically.
     """
 
+    # Slots keep variables small. `__orig_class__` is set by `Var[T](...)`.
+    __slots__ = (
+        "_default",
+        "_type",
+        "_name",
+        "type_name",
+        "_var_type",
+        "_required",
+        "__orig_class__",
+    )
+
     def __init__(
         self,
         name: str | None = None,
@@ -45,6 +70,8 @@ class Var(Generic[T]):
         self._type = type
         self._name = name
         self.type_name = type_name
+        self._var_type = NOTSET
+        self._required = NOTSET
 
     @property
     def name(self) -> str:
@@ -52,9 +79,14 @@ class Var(Generic[T]):
         assert self._name is not None, "Var name is not set"
         return self._name
 
-    @cached_property
+    @property
     def var_type(self) -> type[T]:
         """The python type of the variable."""
+        if self._var_type is NOTSET:
+            self._var_type = self._find_var_type()
+        return self._var_type
+
+    def _find_var_type(self) -> type[T]:
         if self._type:
             return self._type
         if hasattr(self, "__orig_class__"):
@@ -63,15 +95,15 @@ class Var(Generic[T]):
                 return args[0]
         raise ValueError("Var type is not set")
 
-    @cached_property
+    @property
     def required(self) -> bool:
         """Whether the variable is required.
 
         A variable is required if (1) no default value is set *and* (2) the type annotation does not allow None.
         """
-        if self._default is not NOTSET:
-            return False
-        return is_required(self.var_type)
+        if self._required is NOTSET:
+            self._required = self._default is NOTSET and is_required(self.var_type)
+        return self._required
 
     @property
     def default(self) -> T:
@@ -94,8 +126,14 @@ class Var(Generic[T]):
         """Set the type of the variable if it is not set."""
         if self._type is None:
             self._type = var_type
-            self.__dict__.pop("var_type", None)
-            self.__dict__.pop("required", None)
+            self._var_type = NOTSET
+            self._required = NOTSET
+
+    def renamed(self, name: str) -> Self:
+        """Create a copy of the variable with a different name but the same type and default value."""
+        var = copy(self)
+        var._name = name
+        return var
 
     @overload
     def __get__(self, instance: None, owner: type) -> Self: ...
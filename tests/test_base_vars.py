@@ -1,6 +1,8 @@
+import json
 from datetime import datetime
 
 import pytest
+from pydantic import BaseModel, Field
 
 from pydantic_gql import BaseVars, Var
 
@@ -97,3 +99,53 @@ def test_dict(variables: Vars) -> None:
         "c": False,
         "D": A_DATE.isoformat(),
     }
+
+
+def test_serializers_built_once() -> None:
+    assert set(Vars.__serializers__) == {"a", "b", "c", "D"}
+    assert Vars.__serializer__ is not None
+
+
+def test_to_json_dict(variables: Vars) -> None:
+    assert variables.to_json_dict() == dict(variables)
+
+
+def test_to_json_bytes(variables: Vars) -> None:
+    assert json.loads(variables.to_json_bytes()) == dict(variables)
+
+
+class Nested(BaseModel):
+    value: int = Field(alias="Value")
+
+
+class Opaque:
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+class MoreVars(BaseVars):
+    nested: Var[Nested]
+    many: Var[list[Nested]]
+    opaque: Var[Opaque | None] = Var(default=None, type_name="Opaque")
+
+
+def test_serialize_by_alias() -> None:
+    variables = MoreVars(nested=Nested(Value=1), many=[Nested(Value=2)])
+    assert variables.to_json_dict() == {
+        "nested": {"Value": 1},
+        "many": [{"Value": 2}],
+        "opaque": None,
+    }
+
+
+def test_unsupported_declared_type() -> None:
+    assert MoreVars.__serializers__["opaque"] is None
+    assert MoreVars.__serializer__ is None
+    variables = MoreVars(nested=Nested(Value=1), many=[], opaque=None)
+    assert json.loads(variables.to_json_bytes()) == variables.to_json_dict()
+    assert variables.to_json_dict() == dict(variables)
+
+
+def test_value_not_matching_declared_type() -> None:
+    variables = Vars(a="1", b=None, d="1970-01-01")  # type: ignore
+    assert dict(variables) == {"a": "1", "b": None, "c": True, "D": "1970-01-01"}
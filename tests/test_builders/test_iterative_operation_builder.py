@@ -0,0 +1,79 @@
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, GqlField, Query, Var
+from pydantic_gql.builders import IterativeOperationBuilder, OperationBuilder
+from pydantic_gql.connections import Connection
+from pydantic_gql.operation import Operation
+
+
+class Author(BaseModel):
+    name: str
+
+
+class Book(BaseModel):
+    title: str
+    authors: list[Author]
+
+
+class Vars(BaseVars):
+    first: Var[int]
+    after: Var[str | None]
+
+
+QUERIES = {
+    "flat": Query("Flat", GqlField("a"), GqlField("b", {"x": 1})),
+    "empty": Query("Empty"),
+    "aliased": Query(
+        "Aliased",
+        GqlField("a", alias="b"),
+        GqlField("c", {"x": 1}, [GqlField("d")], "e"),
+    ),
+    "nested": Query.from_model(Book, "books", args={"ids": [1, 2], "q": "x"}),
+    "connection": Query.from_model(
+        Connection[Book],
+        "books",
+        variables=Vars,
+        args={"first": Vars.first, "after": Vars.after},
+    ),
+    "multiple": Query(
+        "Multiple", GqlField.from_model(Book), GqlField.from_model(Author, "a")
+    ),
+}
+
+
+@pytest.mark.parametrize("indent", [True, False, 0, 4, "\t"])
+@pytest.mark.parametrize("query", QUERIES.values(), ids=QUERIES.keys())
+def test_same_as_operation_builder(query: Query, indent: bool | int | str) -> None:
+    expected = OperationBuilder(indent).build(query)
+    assert IterativeOperationBuilder(indent).build(query) == expected
+
+
+@pytest.mark.parametrize("query", QUERIES.values(), ids=QUERIES.keys())
+def test_minified_same_as_operation_builder(query: Query) -> None:
+    expected = OperationBuilder(minify=True).build(query)
+    assert IterativeOperationBuilder(minify=True).build(query) == expected
+
+
+def test_reusable() -> None:
+    builder = IterativeOperationBuilder()
+    assert builder.build(QUERIES["nested"]) == builder.build(QUERIES["nested"])
+
+
+def test_very_deep() -> None:
+    field = GqlField("leaf")
+    for _ in range(2000):
+        field = GqlField("node", fields=(field,))
+    output = IterativeOperationBuilder(False).build(Query("Deep", field))
+    assert output.count("{") == 2001
+
+
+def test_builder_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = str(QUERIES["nested"])
+    monkeypatch.setattr(Operation, "builder_class", IterativeOperationBuilder)
+    assert str(QUERIES["nested"]) == expected
+
+
+def test_invalid_indent() -> None:
+    with pytest.raises(ValueError):
+        IterativeOperationBuilder("x")
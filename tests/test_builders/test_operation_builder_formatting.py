@@ -1,7 +1,7 @@
 import pytest
 from pydantic import BaseModel
 
-from pydantic_gql import Query
+from pydantic_gql import BaseVars, Expr, GqlField, Query, Var
 
 
 class Book(BaseModel):
@@ -34,3 +34,40 @@ def test_1_indent_formatting(query: Query) -> None:
 
 def test_tab_indent_formatting(query: Query) -> None:
     assert f"{query:\t}" == "query Book {\n\tbooks {\n\t\ttitle,\n\t\tauthor,\n\t},\n}"
+
+
+def test_alias_formatting() -> None:
+    query = Query("Aliased", GqlField("books", {"first": 1}, [GqlField("title")], "b"))
+    assert f"{query:noindent}" == "query Aliased {b: books(first: 1) {title,},}"
+
+
+def test_min_formatting(query: Query) -> None:
+    assert f"{query:min}" == "query Book{books{title author}}"
+
+
+def test_min_formatting_separators() -> None:
+    class Vars(BaseVars):
+        first: Var[int]
+        after: Var[str | None]
+
+    query = Query(
+        "Min",
+        GqlField("a", {"first": Vars.first, "after": Vars.after, "n": 1}),
+        GqlField("b", {"s": "x", "t": 2}),
+        GqlField("c", alias="d"),
+        GqlField(
+            "e", fields=[GqlField("f"), GqlField("g", {"l": [1, "y", 2, Expr("ASC")]})]
+        ),
+        GqlField("h", {"o": {"k": 1, "m": "z", "n": True}}),
+        GqlField("i"),
+        variables=Vars,
+    )
+    assert f"{query:min}" == (
+        "query Min($first:Int!$after:String)"
+        "{a(first:$first after:$after n:1)"
+        'b(s:"x"t:2)'
+        "d:c "
+        'e{f g(l:[1"y"2 ASC])}'
+        'h(o:{k:1 m:"z"n:true})'
+        "i}"
+    )
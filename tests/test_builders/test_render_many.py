@@ -0,0 +1,48 @@
+from io import StringIO
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, Query, Var
+from pydantic_gql.builders import render_many
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+class Vars(BaseVars):
+    tenant: Var[str]
+
+
+@pytest.fixture
+def queries() -> list[Query]:
+    return [
+        Query.from_model(Book, "books", args={"tenant": "a"}),
+        Query.from_model(Book, "books", variables=Vars, args={"t": Vars.tenant}),
+        Query.from_model(Book, "magazines", frozen=True),
+    ]
+
+
+@pytest.mark.parametrize(
+    "indent, format_spec", [(True, ""), (False, "noindent"), (4, "4"), ("\t", "\t")]
+)
+def test_render_many(
+    queries: list[Query], indent: bool | int | str, format_spec: str
+) -> None:
+    assert render_many(queries, indent) == [format(q, format_spec) for q in queries]
+
+
+def test_render_many_minified(queries: list[Query]) -> None:
+    assert render_many(queries, minify=True) == [f"{q:min}" for q in queries]
+
+
+def test_render_many_into_buffer(queries: list[Query]) -> None:
+    buffer = StringIO()
+    assert render_many(queries, False, buffer=buffer, separator="\n---\n") is None
+    assert buffer.getvalue() == "\n---\n".join(f"{q:noindent}" for q in queries)
+
+
+def test_render_none() -> None:
+    assert render_many([]) == []
@@ -1,5 +1,8 @@
 from datetime import datetime
-from typing import Any, Iterable, Mapping, Optional, Union
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+from uuid import UUID
 
 import pytest
 
@@ -81,3 +84,51 @@ def test_custom_type_name(builder: TypeBuilder, var: Var[Any], expected: str) ->
 def test_unknown_type(builder: TypeBuilder) -> None:
     with pytest.raises(ValueError):
         builder.build(Var())
+
+
+@pytest.fixture
+def scalars(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(TypeBuilder, "_custom_scalars", {})
+    TypeBuilder.cache.clear()
+    yield
+    TypeBuilder.cache.clear()
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@pytest.mark.usefixtures("scalars")
+@pytest.mark.parametrize(
+    "var, expected",
+    (
+        (Var[datetime](), "DateTime!"),
+        (Var[datetime | None](), "DateTime"),
+        (Var[list[datetime]](), "[DateTime!]!"),
+        (Var[UUID](), "ID!"),
+        (Var[Decimal](), "Decimal!"),
+        (Var[Color](), "Colour!"),
+        (Var[datetime](type_name="Date"), "Date!"),
+    ),
+)
+def test_register_scalar(builder: TypeBuilder, var: Var[Any], expected: str) -> None:
+    TypeBuilder.register_scalar(datetime, "DateTime")
+    TypeBuilder.register_scalar(UUID, "ID")
+    TypeBuilder.register_scalar(Color, "Colour")
+    assert builder.build(var) == expected
+
+
+@pytest.mark.usefixtures("scalars")
+def test_register_scalar_clears_cache(builder: TypeBuilder) -> None:
+    assert builder.build(Var[datetime]()) == "datetime!"
+    TypeBuilder.register_scalar(datetime, "DateTime")
+    assert builder.build(Var[datetime]()) == "DateTime!"
+
+
+@pytest.mark.usefixtures("scalars")
+def test_cache(builder: TypeBuilder) -> None:
+    builder.build(Var[list[int]]())
+    builder.build(Var[list[int]]())
+    builder.build(Var[list[int]](default=[]))
+    info = TypeBuilder.cache.info()
+    assert (info.hits, info.misses) == (1, 2)
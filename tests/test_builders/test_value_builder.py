@@ -1,4 +1,8 @@
+from enum import Enum, IntEnum
+from io import StringIO
+
 import pytest
+from pydantic import BaseModel, Field
 
 from pydantic_gql import Expr, Var
 from pydantic_gql.builders import ValueBuilder
@@ -50,3 +54,64 @@ def test_float(builder: ValueBuilder) -> None:
 
 def test_none(builder: ValueBuilder) -> None:
     assert builder.build(None) == "null"
+
+
+def test_nested_iterable(builder: ValueBuilder) -> None:
+    assert (
+        builder.build([[1, "a"], [], [None, [True]]])
+        == '[[1, "a"], [], [null, [true]]]'
+    )
+
+
+def test_subclasses(builder: ValueBuilder) -> None:
+    class Color(str, Enum):
+        RED = "red"
+
+    class Size(IntEnum):
+        BIG = 2
+
+    assert builder.build(Color.RED) == '"red"'
+    assert builder.build(Size.BIG) == "2"
+
+
+def test_non_ascii_string(builder: ValueBuilder) -> None:
+    assert builder.build("café") == '"caf\\u00e9"'
+
+
+def test_insert(builder: ValueBuilder) -> None:
+    buffer = StringIO()
+    builder.insert([1, 2], buffer)
+    builder.insert("x", buffer)
+    assert buffer.getvalue() == '[1, 2]"x"'
+
+
+class Author(BaseModel):
+    name: str
+    birth_year: int | None = Field(default=None, alias="birthYear")
+
+
+class Book(BaseModel):
+    title: str
+    authors: list[Author]
+
+
+def test_mapping(builder: ValueBuilder) -> None:
+    assert builder.build({}) == "{}"
+    assert builder.build({"a": 1, "b": [True, {"c": None}]}) == (
+        "{a: 1, b: [true, {c: null}]}"
+    )
+
+
+def test_model(builder: ValueBuilder) -> None:
+    book = Book(title="Good Omens", authors=[Author(name="Terry", birthYear=1948)])
+    assert builder.build(book) == (
+        '{title: "Good Omens", authors: [{name: "Terry", birthYear: 1948}]}'
+    )
+
+
+def test_many_models(builder: ValueBuilder) -> None:
+    authors = [Author(name=str(i)) for i in range(3)]
+    assert builder.build(authors) == (
+        '[{name: "0", birthYear: null}, {name: "1", birthYear: null}, '
+        '{name: "2", birthYear: null}]'
+    )
@@ -0,0 +1,85 @@
+from threading import Thread
+
+import pytest
+
+from pydantic_gql.cache import LruCache
+
+
+def test_get_creates_once() -> None:
+    cache = LruCache[str, int]()
+    calls: list[int] = []
+
+    def create(value: int) -> int:
+        calls.append(value)
+        return value
+
+    assert cache.get("a", lambda: create(1)) == 1
+    assert cache.get("a", lambda: create(2)) == 1
+    assert calls == [1]
+
+
+def test_info() -> None:
+    cache = LruCache[str, int](maxsize=10)
+    cache.get("a", lambda: 1)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    info = cache.info()
+    assert (info.hits, info.misses, info.size, info.maxsize) == (1, 2, 2, 10)
+
+
+def test_eviction() -> None:
+    cache = LruCache[str, int](maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_zero_maxsize() -> None:
+    cache = LruCache[str, int](maxsize=0)
+    assert cache.get("a", lambda: 1) == 1
+    assert len(cache) == 0
+
+
+def test_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        LruCache(maxsize=-1)
+
+
+def test_invalidate_and_clear() -> None:
+    cache = LruCache[str, int]()
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert "a" not in cache
+    assert "b" in cache
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info().misses == 0
+
+
+def test_invalidate_where() -> None:
+    cache = LruCache[tuple[str, int], int]()
+    for key in [("a", 1), ("a", 2), ("b", 1)]:
+        cache.get(key, lambda: 0)
+    cache.invalidate_where(lambda key: key[0] == "a")
+    assert len(cache) == 1
+    assert ("b", 1) in cache
+
+
+def test_threads_share_value() -> None:
+    cache = LruCache[str, object]()
+    results: list[object] = []
+    threads = [
+        Thread(target=lambda: results.append(cache.get("a", object))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(map(id, results))) == 1
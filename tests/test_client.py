@@ -0,0 +1,453 @@
+import asyncio
+import hashlib
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    cast,
+)
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, GqlField, Query, Var
+from pydantic_gql.connections import CompactConnection, Connection
+from pydantic_gql.errors import GraphQLError
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    httpx = pytest.importorskip("httpx")
+
+from pydantic_gql.client import GqlClient
+
+
+class Book(BaseModel):
+    title: str
+
+
+class Vars(BaseVars):
+    first: Var[int]
+
+
+QUERY = Query.from_model(Book, "books", variables=Vars, args={"first": Vars.first})
+
+Handler = Callable[[httpx.Request], Coroutine[Any, Any, httpx.Response]]
+
+
+def run(
+    handler: Handler, test: Callable[[GqlClient], Awaitable[Any]], **kwargs: Any
+) -> Any:
+    """Run a test against an in-process stand-in for a GraphQL server."""
+
+    async def main() -> Any:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with GqlClient(
+            "http://test/graphql", http_client=http_client, **kwargs
+        ) as client:
+            return await test(client)
+
+    return asyncio.run(main())
+
+
+def respond(body: Any, status_code: int = 200) -> Handler:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json=body)
+
+    return handler
+
+
+def test_request_body() -> None:
+    requests: list[Any] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.headers["Content-Type"], json.loads(request.content)))
+        return httpx.Response(200, json={"data": {"books": []}})
+
+    run(handler, lambda client: client.execute(QUERY, Vars(first=2)))
+    assert requests == [
+        (
+            "application/json",
+            {
+                "query": f"{QUERY:noindent}",
+                "operationName": "Book",
+                "variables": {"first": 2},
+            },
+        )
+    ]
+
+
+def test_validates_models() -> None:
+    data = run(
+        respond({"data": {"books": [{"title": "a"}, {"title": "b"}]}}),
+        lambda client: client.execute(QUERY, Vars(first=2)),
+    )
+    assert data == {"books": [Book(title="a"), Book(title="b")]}
+
+
+def test_fields_without_model() -> None:
+    query = Query("Count", GqlField("count"), GqlField.from_model(Book, "book"))
+    data = run(
+        respond({"data": {"count": 3, "book": {"title": "a"}}}),
+        lambda client: client.execute(query),
+    )
+    assert data == {"count": 3, "book": Book(title="a")}
+
+
+def test_execute_raw() -> None:
+    data = run(
+        respond({"data": {"books": [{"title": "a"}]}}),
+        lambda client: client.execute_raw(QUERY, {"first": 1}),
+    )
+    assert data == {"books": [{"title": "a"}]}
+
+
+def test_graphql_error() -> None:
+    body = {"errors": [{"message": "Bad"}, {"message": "Worse"}], "data": None}
+    for status in (200, 400):
+        with pytest.raises(GraphQLError, match="Bad; Worse") as info:
+            run(respond(body, status), lambda client: client.execute(QUERY))
+        assert info.value.errors == body["errors"]
+
+
+def test_http_error() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, text="Bad Gateway")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        run(handler, lambda client: client.execute(QUERY))
+
+
+def test_invalid_response() -> None:
+    with pytest.raises(ValueError):
+        run(respond([1, 2]), lambda client: client.execute(QUERY))
+
+
+def test_max_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": {"books": []}})
+
+    async def test(client: GqlClient) -> None:
+        await asyncio.gather(*(client.execute(QUERY) for _ in range(10)))
+
+    run(handler, test, max_concurrency=3)
+    assert peak == 3
+
+
+def collect(client: GqlClient, **kwargs: Any) -> Awaitable[list[Any]]:
+    async def main() -> list[Any]:
+        return [item async for item in client.stream(**kwargs)]
+
+    return main()
+
+
+def test_stream() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        async def body() -> Any:
+            yield b'{"data": {"books": ['
+            yield b'{"title": "a"}, {"ti'
+            yield b'tle": "b"}]}}'
+
+        return httpx.Response(200, content=body())
+
+    books = run(handler, lambda client: collect(client, operation=QUERY))
+    assert books == [Book(title="a"), Book(title="b")]
+
+
+def test_stream_key() -> None:
+    query = Query("Count", GqlField("count"), GqlField.from_model(Book, "books"))
+    books = run(
+        respond({"data": {"count": 1, "books": [{"title": "a"}]}}),
+        lambda client: collect(client, operation=query, key="books"),
+    )
+    assert books == [Book(title="a")]
+    for key in (None, "count", "missing"):
+        with pytest.raises(ValueError):
+            run(respond({}), lambda client: collect(client, operation=query, key=key))
+
+
+def test_stream_errors() -> None:
+    body = {"errors": [{"message": "Bad"}], "data": None}
+    for status in (200, 400):
+        with pytest.raises(GraphQLError, match="Bad"):
+            run(respond(body, status), lambda client: collect(client, operation=QUERY))
+    with pytest.raises(httpx.HTTPStatusError):
+        run(respond("Nope", 502), lambda client: collect(client, operation=QUERY))
+
+
+def test_stream_released_when_stopped_early() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"data": {"books": [{"title": "a"}, {"title": "b"}]}}
+        )
+
+    async def test(client: GqlClient) -> None:
+        for _ in range(2):
+            items = cast(AsyncGenerator[Any, None], client.stream(QUERY))
+            assert await anext(items) == Book(title="a")
+            await items.aclose()
+            assert not client._semaphore.locked()
+
+    for persisted_queries in (False, True):
+        run(handler, test, max_concurrency=1, persisted_queries=persisted_queries)
+
+
+class PageVars(BaseVars):
+    first: Var[int]
+    after: Var[str | None] = Var(default=None)
+
+
+PAGE_QUERY = Query.from_model(
+    Connection[Book],
+    "books",
+    variables=PageVars,
+    args={"first": PageVars.first, "after": PageVars.after},
+)
+
+
+def paged_books(count: int, cursors: list[Any]) -> Handler:
+    """A stand-in server for a connection of `count` books whose cursors are their indices."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        after = variables.get("after")
+        cursors.append(after)
+        start = variables.get("start", 0) if after is None else int(after) + 1
+        stop = min(start + variables["first"], variables.get("stop", count))
+        indices = range(start, stop)
+        page = {
+            "edges": [{"node": {"title": str(i)}, "cursor": str(i)} for i in indices],
+            "pageInfo": {
+                "hasNextPage": indices.stop < variables.get("stop", count),
+                "hasPreviousPage": start > 0,
+                "startCursor": str(indices.start) if indices else None,
+                "endCursor": str(indices.stop - 1) if indices else None,
+            },
+        }
+        return httpx.Response(200, json={"data": {"books": page}})
+
+    return handler
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginate(prefetch: bool) -> None:
+    cursors: list[Any] = []
+
+    async def test(client: GqlClient) -> list[Any]:
+        pages = client.paginate(PAGE_QUERY, PageVars(first=10), prefetch=prefetch)
+        return [book.title async for book in pages]
+
+    assert run(paged_books(25, cursors), test) == [str(i) for i in range(25)]
+    assert cursors == [None, "9", "19"]
+
+
+def test_paginate_compact() -> None:
+    query = Query.from_model(
+        CompactConnection[Book],
+        "books",
+        variables=PageVars,
+        args={"first": PageVars.first, "after": PageVars.after},
+    )
+
+    async def test(client: GqlClient) -> list[Any]:
+        return [book.title async for book in client.paginate(query, {"first": 4})]
+
+    assert run(paged_books(10, []), test) == [str(i) for i in range(10)]
+
+
+def test_paginate_prefetch() -> None:
+    for prefetch, expected in ((False, [None]), (True, [None, "1"])):
+        cursors: list[Any] = []
+
+        async def test(client: GqlClient) -> None:
+            pages = cast(
+                AsyncGenerator[Any, None],
+                client.paginate(PAGE_QUERY, {"first": 2}, prefetch=prefetch),
+            )
+            await anext(pages)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await pages.aclose()
+
+        run(paged_books(25, cursors), test)
+        assert cursors == expected
+
+
+def test_paginate_invalid() -> None:
+    for query, cursor_var in ((QUERY, "after"), (PAGE_QUERY, "before")):
+        with pytest.raises(ValueError):
+            run(
+                paged_books(1, []),
+                lambda client: anext(client.paginate(query, cursor_var=cursor_var)),
+            )
+
+
+class RangeVars(PageVars):
+    start: Var[int]
+    stop: Var[int]
+
+
+RANGE_QUERY = Query.from_model(
+    Connection[Book],
+    "books",
+    variables=RangeVars,
+    args={
+        "first": RangeVars.first,
+        "after": RangeVars.after,
+        "start": RangeVars.start,
+        "stop": RangeVars.stop,
+    },
+)
+
+
+def book_ranges(*bounds: int) -> list[RangeVars]:
+    return [
+        RangeVars(first=3, start=start, stop=stop)
+        for start, stop in zip(bounds, bounds[1:])
+    ]
+
+
+def test_paginate_ranges() -> None:
+    cursors: list[Any] = []
+
+    async def test(client: GqlClient) -> list[Any]:
+        pages = client.paginate_ranges(RANGE_QUERY, book_ranges(0, 10, 20, 25))
+        return [book.title async for book in pages]
+
+    assert run(paged_books(25, cursors), test) == [str(i) for i in range(25)]
+    assert len(cursors) == 4 + 4 + 2
+
+
+def test_paginate_ranges_unordered() -> None:
+    handler = paged_books(25, [])
+
+    async def slow_start(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["variables"]["start"] == 0:
+            await asyncio.sleep(0.05)
+        return await handler(request)
+
+    async def test(client: GqlClient) -> list[Any]:
+        ranges = book_ranges(0, 3, 6)
+        pages = client.paginate_ranges(RANGE_QUERY, ranges, ordered=False)
+        return [book.title async for book in pages]
+
+    assert run(slow_start, test) == ["3", "4", "5", "0", "1", "2"]
+
+
+def test_paginate_ranges_workers() -> None:
+    handler = paged_books(100, [])
+    starts: set[int] = set()
+    peak = 0
+
+    async def tracking(request: httpx.Request) -> httpx.Response:
+        nonlocal peak
+        start = json.loads(request.content)["variables"]["start"]
+        starts.add(start)
+        peak = max(peak, len(starts))
+        await asyncio.sleep(0.01)
+        response = await handler(request)
+        if not json.loads(response.content)["data"]["books"]["pageInfo"]["hasNextPage"]:
+            starts.discard(start)
+        return response
+
+    async def test(client: GqlClient) -> int:
+        ranges = book_ranges(*range(0, 101, 10))
+        return len(
+            [_ async for _ in client.paginate_ranges(RANGE_QUERY, ranges, workers=3)]
+        )
+
+    assert run(tracking, test) == 100
+    assert peak == 3
+
+
+def test_paginate_ranges_error() -> None:
+    async def test(client: GqlClient) -> list[Any]:
+        return [
+            _ async for _ in client.paginate_ranges(RANGE_QUERY, book_ranges(0, 5, 10))
+        ]
+
+    with pytest.raises(GraphQLError, match="Bad"):
+        run(respond({"errors": [{"message": "Bad"}], "data": None}), test)
+
+
+def persisting_server(
+    requests: list[dict[str, Any]], supported: bool = True
+) -> Handler:
+    """A stand-in server for automatic persisted queries, which stores each document sent along with its hash."""
+    documents: dict[str, str] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        if not supported and "query" not in body:
+            return httpx.Response(
+                200, json={"errors": [{"message": "PersistedQueryNotSupported"}]}
+            )
+        sha256 = body.get("extensions", {}).get("persistedQuery", {}).get("sha256Hash")
+        if "query" in body:
+            if sha256 is not None:
+                assert sha256 == hashlib.sha256(body["query"].encode()).hexdigest()
+                documents[sha256] = body["query"]
+        elif sha256 not in documents:
+            error = {
+                "message": "PersistedQueryNotFound",
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+            return httpx.Response(200, json={"errors": [error]})
+        return httpx.Response(200, json={"data": {"books": [{"title": "a"}]}})
+
+    return handler
+
+
+def test_persisted_queries() -> None:
+    requests: list[dict[str, Any]] = []
+
+    async def test(client: GqlClient) -> list[Any]:
+        return [await client.execute(QUERY, {"first": 1}) for _ in range(3)]
+
+    results = run(persisting_server(requests), test, persisted_queries=True)
+    assert results == [{"books": [Book(title="a")]}] * 3
+    assert ["query" in body for body in requests] == [False, True, False, False]
+    assert all(
+        body["extensions"]["persistedQuery"]
+        == {"version": 1, "sha256Hash": QUERY.document_hash}
+        for body in requests
+    )
+
+
+def test_persisted_queries_not_supported() -> None:
+    requests: list[dict[str, Any]] = []
+
+    async def test(client: GqlClient) -> bool:
+        for _ in range(2):
+            await client.execute_raw(QUERY, {"first": 1})
+        return client.persisted_queries
+
+    assert not run(
+        persisting_server(requests, supported=False), test, persisted_queries=True
+    )
+    assert ["query" in body for body in requests] == [False, True, True]
+    assert "extensions" not in requests[-1]
+
+
+def test_persisted_queries_stream() -> None:
+    requests: list[dict[str, Any]] = []
+
+    async def test(client: GqlClient) -> list[Any]:
+        return [await collect(client, operation=QUERY) for _ in range(2)]
+
+    results = run(persisting_server(requests), test, persisted_queries=True)
+    assert results == [[Book(title="a")]] * 2
+    assert ["query" in body for body in requests] == [False, True, False]
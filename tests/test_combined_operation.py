@@ -0,0 +1,101 @@
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, GqlField, Mutation, Query, Var
+from pydantic_gql.combined_operation import CombinedOperation
+
+from .check_op import check_op
+
+
+class Book(BaseModel):
+    title: str
+
+
+class Author(BaseModel):
+    name: str
+
+
+class BookVars(BaseVars):
+    first: Var[int]
+    genre: Var[str | None]
+
+
+class AuthorVars(BaseVars):
+    first: Var[int]
+
+
+@pytest.fixture
+def combined() -> CombinedOperation:
+    return CombinedOperation(
+        "Combined",
+        Query.from_model(
+            Book,
+            "books",
+            variables=BookVars,
+            args={"first": BookVars.first, "where": {"genre": [BookVars.genre]}},
+        ),
+        Query.from_model(Book, "books", args={"first": 1}),
+        Query.from_model(
+            Author, "authors", variables=AuthorVars, args={"first": AuthorVars.first}
+        ),
+    )
+
+
+def test_document(combined: CombinedOperation) -> None:
+    check_op(
+        combined,
+        """
+        query Combined($first: Int!, $genre: String, $first_2: Int!) {
+            books(first: $first, where: {genre: [$genre]}) { title, },
+            books_1: books(first: 1) { title, },
+            authors(first: $first_2) { name, },
+        }
+        """,
+    )
+
+
+def test_merge_variables(combined: CombinedOperation) -> None:
+    assert combined.merge_variables(
+        BookVars(first=10, genre="fantasy"), {}, AuthorVars(first=5)
+    ) == {"first": 10, "genre": "fantasy", "first_2": 5}
+
+
+def test_merge_variables_wrong_count(combined: CombinedOperation) -> None:
+    with pytest.raises(ValueError):
+        combined.merge_variables({})
+
+
+def test_split(combined: CombinedOperation) -> None:
+    data = {
+        "books": [{"title": "a"}],
+        "books_1": [{"title": "b"}],
+        "authors": [{"name": "c"}],
+    }
+    assert combined.split(data) == [
+        {"books": [{"title": "a"}]},
+        {"books": [{"title": "b"}]},
+        {"authors": [{"name": "c"}]},
+    ]
+
+
+def test_existing_alias() -> None:
+    combined = CombinedOperation(
+        "Combined",
+        Query("A", GqlField("books", alias="mine")),
+        Query("B", GqlField("mine"), GqlField("books", alias="other")),
+    )
+    check_op(combined, "query Combined { mine: books, mine_1: mine, other: books, }")
+    assert combined.split({"mine": 1, "mine_1": 2, "other": 3}) == [
+        {"mine": 1},
+        {"mine": 2, "other": 3},
+    ]
+
+
+def test_mixed_types() -> None:
+    with pytest.raises(ValueError):
+        CombinedOperation("Combined", Query("A"), Mutation("B"))
+
+
+def test_originals_unchanged(combined: CombinedOperation) -> None:
+    assert combined.operations[1].fields[0].alias is None
+    assert BookVars.first.name == "first"
@@ -0,0 +1,109 @@
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, Expr, Fragment, GqlField, Query, Var
+
+
+class Book(BaseModel):
+    title: str
+    author: str
+
+
+class Vars(BaseVars):
+    year: Var[int]
+
+
+@pytest.fixture
+def query() -> Query:
+    return Query(
+        "Library",
+        GqlField.from_model(Book, "books", args={"limit": 10, "year": Vars.year}),
+        GqlField("authors", {"limit": 10}, (GqlField("books", {"limit": 2}),)),
+        variables=Vars,
+    )
+
+
+@pytest.mark.parametrize("format_spec", ["", "noindent", "min", "4", "\t"])
+def test_render_matches_format(query: Query, format_spec: str) -> None:
+    assert query.compile(format_spec).render() == format(query, format_spec)
+
+
+def test_str(query: Query) -> None:
+    assert str(query.compile()) == str(query)
+
+
+def test_render_with_args(query: Query) -> None:
+    compiled = query.compile("noindent")
+    assert compiled.render(
+        {"books": {"limit": 20}, "authors.books": {"limit": "x"}}
+    ) == (
+        "query Library($year: Int!) {books(limit: 20, year: $year) {title,author,},"
+        'authors(limit: 10) {books(limit: "x"),},}'
+    )
+
+
+def test_render_min_with_args(query: Query) -> None:
+    compiled = query.compile("min")
+    assert compiled.render(
+        {"authors": {"limit": "x"}, "authors.books": {"limit": 3}}
+    ) == (
+        "query Library($year:Int!){books(limit:10 year:$year){title author}"
+        'authors(limit:"x"){books(limit:3)}}'
+    )
+
+
+def test_paths(query: Query) -> None:
+    assert query.compile().paths == {
+        "books": ("limit", "year"),
+        "authors": ("limit",),
+        "authors.books": ("limit",),
+    }
+
+
+def test_unknown_path(query: Query) -> None:
+    with pytest.raises(ValueError):
+        query.compile().render({"magazines": {"limit": 1}})
+
+
+def test_unknown_arg(query: Query) -> None:
+    with pytest.raises(ValueError):
+        query.compile().render({"books": {"offset": 1}})
+
+
+def test_compiled_is_independent(query: Query) -> None:
+    compiled = query.compile()
+    expected = str(query)
+    query.fields[0].args = {"limit": 1}
+    assert compiled.render() == expected
+
+
+def test_nul_in_string() -> None:
+    query = Query("Search", GqlField("search", args={"text": "a\x000\x00b"}))
+    compiled = query.compile()
+    assert compiled.render() == str(query)
+    assert compiled.render({"search": {"text": "\x001\x00"}}) == str(
+        Query("Search", GqlField("search", args={"text": "\x001\x00"}))
+    )
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        GqlField("a\x000\x00", args={"x": 1}),
+        GqlField("a", args={"x": 1}, alias="\x000\x00"),
+    ],
+)
+def test_nul_outside_string(field: GqlField) -> None:
+    with pytest.raises(ValueError, match="NUL"):
+        Query("Q", field).compile()
+
+
+def test_nul_in_fragment() -> None:
+    fragment = Fragment("F", "T", (GqlField("b", args={"x": Expr("\x000\x00")}),))
+    query = Query(
+        "Q",
+        GqlField("a", args={"x": 1}, fields=(fragment.spread,)),
+        fragments=[fragment],
+    )
+    with pytest.raises(ValueError, match="NUL"):
+        query.compile()
@@ -1,8 +1,10 @@
+import json
+
 import pytest
 from pydantic import BaseModel
 
 from pydantic_gql import Query
-from pydantic_gql.connections import Connection
+from pydantic_gql.connections import CompactConnection, Connection
 
 from .check_op import check_op
 
@@ -42,3 +44,88 @@ def test_connection(query: Query) -> None:
         }
         """,
     )
+
+
+def test_nodes() -> None:
+    connection = Connection[Item].model_validate(
+        {
+            "edges": [
+                {"node": {"id": 1, "name": "a"}, "cursor": "c1"},
+                {"node": {"id": 2, "name": "b"}, "cursor": "c2"},
+            ],
+            "pageInfo": {
+                "hasNextPage": False,
+                "hasPreviousPage": False,
+                "startCursor": "c1",
+                "endCursor": "c2",
+            },
+        }
+    )
+    assert connection.nodes == [Item(id=1, name="a"), Item(id=2, name="b")]
+
+
+def test_empty_page() -> None:
+    connection = Connection[Item].model_validate(
+        {
+            "edges": [],
+            "pageInfo": {
+                "hasNextPage": False,
+                "hasPreviousPage": False,
+                "startCursor": None,
+                "endCursor": None,
+            },
+        }
+    )
+    assert connection.nodes == []
+    assert connection.page_info.end_cursor is None
+
+
+def test_compact_connection() -> None:
+    query = Query.from_model(
+        CompactConnection[Item], "items", "CompactTest", args={"first": 10}
+    )
+    check_op(
+        query,
+        """
+        query CompactTest {
+            items(first: 10) {
+                edges {
+                    node {
+                        id,
+                        name,
+                    },
+                },
+                pageInfo {
+                    hasNextPage,
+                    hasPreviousPage,
+                    startCursor,
+                    endCursor,
+                },
+            },
+        }
+        """,
+    )
+
+
+def test_compact_connection_validation() -> None:
+    response = {
+        "data": {
+            "items": {
+                "edges": [
+                    {"node": {"id": 1, "name": "a"}},
+                    {"node": {"id": 2, "name": "b"}, "cursor": "ignored"},
+                ],
+                "pageInfo": {
+                    "hasNextPage": True,
+                    "hasPreviousPage": False,
+                    "startCursor": "c1",
+                    "endCursor": "c2",
+                },
+            }
+        }
+    }
+    query = Query.from_model(CompactConnection[Item], "items")
+    connection = query.parse_response(json.dumps(response))["items"]
+    assert isinstance(connection, CompactConnection)
+    assert connection.nodes == [Item(id=1, name="a"), Item(id=2, name="b")]
+    assert connection.page_info.end_cursor == "c2"
@@ -0,0 +1,199 @@
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import BaseVars, Fragment, GqlField, Query, Var
+from pydantic_gql.builders import IterativeOperationBuilder
+from pydantic_gql.combined_operation import CombinedOperation
+from pydantic_gql.connections import Connection
+
+from .check_op import check_op
+
+
+class Author(BaseModel):
+    name: str
+    born: int
+
+
+class Review(BaseModel):
+    text: str
+    author: Author
+
+
+class Book(BaseModel):
+    title: str
+    author: Author
+    reviews: list[Review]
+
+
+class Vars(BaseVars):
+    first: Var[int]
+
+
+@pytest.fixture
+def query() -> Query:
+    return Query(
+        "Library",
+        GqlField.from_model(Book, "books"),
+        GqlField.from_model(Review, "reviews", args={"first": 10}),
+        GqlField.from_model(Author, "authors"),
+    )
+
+
+def test_with_fragments(query: Query) -> None:
+    check_op(
+        query.with_fragments(),
+        """query Library {
+            books {title, author {...AuthorFields,}, reviews {...ReviewFields,},},
+            reviews(first: 10) {...ReviewFields,},
+            authors {...AuthorFields,},
+        }
+        fragment AuthorFields on Author {name, born,}
+        fragment ReviewFields on Review {text, author {...AuthorFields,},}""",
+    )
+
+
+def test_with_fragments_leaves_original(query: Query) -> None:
+    before = str(query)
+    query.with_fragments()
+    assert str(query) == before
+    assert query.fragments == ()
+
+
+def test_with_fragments_formats(query: Query) -> None:
+    op = query.with_fragments()
+    assert f"{op:noindent}".endswith(
+        "} fragment AuthorFields on Author {name,born,}"
+        " fragment ReviewFields on Review {text,author {...AuthorFields,},}"
+    )
+    assert f"{op:min}".endswith(
+        "}fragment AuthorFields on Author{name born}"
+        "fragment ReviewFields on Review{text author{...AuthorFields}}"
+    )
+    assert "\n  },\n}\n\nfragment AuthorFields on Author {\n  name,\n" in str(op)
+
+
+@pytest.mark.parametrize("format_spec", ["", "noindent", "min"])
+def test_with_fragments_iterative_builder(query: Query, format_spec: str) -> None:
+    op = query.with_fragments()
+    builder = IterativeOperationBuilder(
+        format_spec != "noindent", minify=format_spec == "min"
+    )
+    assert builder.build(op) == format(op, format_spec)
+
+
+def test_single_use_not_extracted() -> None:
+    query = Query.from_model(Review, "reviews")
+    assert str(query.with_fragments()) == str(query)
+
+
+def test_min_count(query: Query) -> None:
+    op = query.with_fragments(min_count=3)
+    assert [f.name for f in op.fragments] == ["AuthorFields"]
+
+
+def test_different_selections_of_same_model() -> None:
+    query = Query(
+        "Authors",
+        GqlField("a", fields=(GqlField("name"),), model=Author),
+        GqlField("b", fields=(GqlField("name"),), model=Author),
+        GqlField("c", fields=(GqlField("born"),), model=Author),
+        GqlField("d", fields=(GqlField("born"),), model=Author),
+    )
+    check_op(
+        query.with_fragments(),
+        """query Authors {
+            a {...AuthorFields,}, b {...AuthorFields,},
+            c {...AuthorFields2,}, d {...AuthorFields2,},
+        }
+        fragment AuthorFields on Author {name,}
+        fragment AuthorFields2 on Author {born,}""",
+    )
+
+
+def test_manual_selection_same_as_model() -> None:
+    query = Query(
+        "Authors",
+        GqlField.from_model(Author, "a"),
+        GqlField("b", fields=(GqlField("name"), GqlField("born")), model=Author),
+    )
+    check_op(
+        query.with_fragments(),
+        """query Authors {a {...AuthorFields,}, b {...AuthorFields,},}
+        fragment AuthorFields on Author {name, born,}""",
+    )
+
+
+def test_type_names() -> None:
+    query = Query(
+        "Pages",
+        GqlField.from_model(Connection[Book], "a"),
+        GqlField.from_model(Connection[Book], "b"),
+    )
+    op = query.with_fragments(type_names={Connection[Book]: "BookConnection"})
+    assert [(f.name, f.type_name) for f in op.fragments] == [
+        ("AuthorFields", "Author"),
+        ("BookConnectionFields", "BookConnection"),
+    ]
+    # Generic models aren't valid type names, so they are only extracted when named.
+    assert "Connection" not in str(query.with_fragments())
+
+
+def test_frozen(query: Query) -> None:
+    op = Query("Library", *query.fields, frozen=True).with_fragments()
+    assert op.frozen
+    assert str(op) == str(query.with_fragments())
+    with pytest.raises(TypeError):
+        op.fragments[0].fields[0].args["x"] = 1  # type: ignore[index]
+
+
+def test_response_unchanged(query: Query) -> None:
+    author = {"name": "A", "born": 1900}
+    data = {
+        "books": [{"title": "T", "author": author, "reviews": []}],
+        "reviews": [{"text": "R", "author": author}],
+        "authors": [author],
+    }
+    assert query.with_fragments().parse_data(data) == query.parse_data(data)
+
+
+def test_manual_fragment() -> None:
+    fragment = Fragment("AuthorFields", "Author", GqlField.fields_of_model(Author))
+    query = Query(
+        "Library",
+        GqlField("books", fields=(GqlField("author", fields=(fragment.spread,)),)),
+        fragments=[fragment],
+    )
+    check_op(
+        query,
+        """query Library {books {author {...AuthorFields,},},}
+        fragment AuthorFields on Author {name, born,}""",
+    )
+
+
+def test_compile_with_fragments() -> None:
+    query = Query(
+        "Library",
+        GqlField.from_model(Book, "books", args={"first": Vars.first}),
+        GqlField.from_model(Author, "authors"),
+        variables=Vars,
+    ).with_fragments()
+    compiled = query.compile("min")
+    assert compiled.render() == f"{query:min}"
+    assert compiled.render({"books": {"first": 3}}).startswith(
+        "query Library($first:Int!){books(first:3){"
+    )
+
+
+def test_combine_with_fragments(query: Query) -> None:
+    op = query.with_fragments()
+    combined = CombinedOperation("Combined", op, op)
+    assert combined.fragments == op.fragments
+
+
+def test_combine_conflicting_fragments() -> None:
+    with pytest.raises(ValueError):
+        CombinedOperation(
+            "Combined",
+            Query("A", fragments=[Fragment("F", "Author", (GqlField("name"),))]),
+            Query("B", fragments=[Fragment("F", "Author", (GqlField("born"),))]),
+        )
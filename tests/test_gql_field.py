@@ -1,6 +1,18 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, replace
+from typing import Callable
+
+import pytest
 from pydantic import BaseModel
 
-from pydantic_gql import GqlField
+from pydantic_gql import FieldPool, GqlField, Query
+from pydantic_gql.gql_field import FrozenGqlField, LazyFields
+from pydantic_gql.connections import CompactConnection
+
+from .check_op import check_op
 
 
 class MyModel(BaseModel):
@@ -17,6 +29,22 @@ class ComplexModel(BaseModel):
     list_of_nested: list[NestedModel]
 
 
+class Category(BaseModel):
+    name: str
+    children: list[Category] = []
+
+
+class User(BaseModel):
+    name: str
+    team: Team | None = None
+
+
+class Team(BaseModel):
+    name: str
+    members: list[User] = []
+    subteams: CompactConnection[Team] | None = None
+
+
 def test_gql_field_from_model():
     gql_field = GqlField.from_model(MyModel)
     assert gql_field.name == "MyModel"
@@ -63,3 +91,265 @@ def test_complex_model():
     assert gql_field.fields[0].fields[0].name == "nested_field"
     assert len(gql_field.fields[1].fields) == 1
     assert gql_field.fields[1].fields[0].name == "nested_field"
+
+
+def test_cached_fields_are_frozen():
+    query = Query.from_model(ComplexModel, "complex")
+    with pytest.raises(FrozenInstanceError):
+        query.fields[0].fields[0].fields[0].name = "changed"
+    with pytest.raises(TypeError):
+        query.fields[0].fields[1].args["first"] = 1  # type: ignore[index]
+    assert GqlField.fields_of_model(ComplexModel)[1].args == {}
+
+
+def test_lazy_cached_fields_are_frozen():
+    GqlField.clear_cache()
+    query = Query.from_model(ComplexModel, "complex", lazy=True)
+    with pytest.raises(FrozenInstanceError):
+        query.fields[0].fields[0].fields[0].name = "changed"
+
+
+def test_cached_fields_are_shared():
+    GqlField.clear_cache()
+    first = Query.from_model(ComplexModel, "complex")
+    second = Query.from_model(ComplexModel, "complex")
+    assert second.fields[0].fields is first.fields[0].fields
+
+
+def test_fields_of_model_cached():
+    GqlField.clear_cache()
+    first = GqlField.fields_of_model(ComplexModel)
+    second = GqlField.fields_of_model(ComplexModel)
+    assert second is first
+    assert first[0].fields is first[1].fields
+    info = GqlField.fields_cache.info()
+    assert info.hits == 2  # NestedModel is reused by list_of_nested, then ComplexModel
+    assert info.misses == 2  # ComplexModel and NestedModel
+
+
+def test_frozen_fields_equal_unfrozen_fields():
+    assert GqlField.fields_of_model(NestedModel) == (GqlField("nested_field"),)
+    assert (GqlField("nested_field"),) == GqlField.fields_of_model(NestedModel)
+    assert GqlField("a", {"x": [1]}).freeze() == GqlField("a", {"x": [1]})
+    assert GqlField("a").freeze() != GqlField("b")
+
+
+def test_clear_cache_for_model():
+    first = GqlField.fields_of_model(MyModel)
+    GqlField.clear_cache(MyModel)
+    second = GqlField.fields_of_model(MyModel)
+    assert second is not first
+    assert second == first
+
+
+def test_recursive_model_max_depth():
+    check_op(
+        Query.from_model(Category, "categories", max_depth=2),
+        """
+        query Category {
+            categories {
+                name,
+                children {
+                    name,
+                    children {
+                        name,
+                    },
+                },
+            },
+        }
+        """,
+    )
+
+
+def test_recursive_model_zero_depth():
+    assert GqlField.fields_of_model(Category, 0) == (GqlField("name"),)
+
+
+def test_recursive_model_without_max_depth():
+    with pytest.raises(ValueError, match="Category refers to itself"):
+        GqlField.from_model(Category)
+
+
+def test_mutually_recursive_models():
+    with pytest.raises(ValueError, match="refers to itself"):
+        GqlField.fields_of_model(User)
+    check_op(
+        Query.from_model(User, "users", max_depth=1),
+        """
+        query User {
+            users {
+                name,
+                team {
+                    name,
+                },
+            },
+        }
+        """,
+    )
+    # The edges and nodes of a connection count as levels as well.
+    assert format(Query.from_model(Team, "teams", max_depth=3), "noindent") == (
+        "query Team {teams {name,members {name,team {name,members {name,},},},"
+        "subteams {edges {node {name,},},pageInfo {hasNextPage,hasPreviousPage,"
+        "startCursor,endCursor,},},},}"
+    )
+
+
+def test_recursive_model_expanded_once_per_depth():
+    GqlField.clear_cache()
+    GqlField.fields_of_model(Category, 100)
+    assert GqlField.fields_cache.info().misses == 101
+    category = GqlField.from_model(Category, max_depth=5)
+    assert category.fields[1].fields == GqlField.fields_of_model(Category, 4)
+    assert GqlField.fields_cache.info().misses == 101
+
+
+def test_clear_cache_for_model_at_all_depths():
+    GqlField.fields_of_model(Category, 1)
+    GqlField.clear_cache(Category)
+    assert (GqlField, Category, 1) not in GqlField.fields_cache
+    assert (GqlField, Category, 0) not in GqlField.fields_cache
+
+
+def test_lazy_fields_equal_eager():
+    GqlField.clear_cache()
+    lazy = GqlField.from_model(ComplexModel, lazy=True)
+    assert isinstance(lazy.fields, LazyFields)
+    assert not lazy.fields.expanded
+    assert lazy == GqlField.from_model(ComplexModel)
+    assert lazy.fields.expanded
+
+
+def test_lazy_fields_expanded_on_render():
+    GqlField.clear_cache()
+    query = Query.from_model(Category, "categories", max_depth=3, lazy=True)
+    fields = query.fields[0].fields
+    assert isinstance(fields, LazyFields) and not fields.expanded
+    assert (GqlField, Category, 3) not in GqlField.fields_cache
+    assert str(query) == str(Query.from_model(Category, "categories", max_depth=3))
+    assert fields.expanded
+
+
+def test_lazy_fields_use_cache():
+    eager = GqlField.fields_of_model(ComplexModel)
+    lazy = GqlField.fields_of_model(ComplexModel, lazy=True)
+    assert lazy is eager
+
+
+def test_lazy_fields_frozen():
+    GqlField.clear_cache()
+    query = Query.from_model(
+        Category, "categories", max_depth=1, lazy=True, frozen=True
+    )
+    field = query.fields[0]
+    assert isinstance(field, FrozenGqlField)
+    assert isinstance(field.fields, LazyFields) and not field.fields.expanded
+    with pytest.raises(FrozenInstanceError):
+        field.name = "changed"
+    assert "children {" in str(query)
+    assert all(isinstance(f, FrozenGqlField) for f in field.fields)
+    with pytest.raises(FrozenInstanceError):
+        field.fields[1].name = "changed"
+    assert format(query, "noindent") == query.document
+
+
+def test_freeze_lazy_fields():
+    lazy = GqlField.from_model(Category, max_depth=2, lazy=True).freeze()
+    assert isinstance(lazy.fields, LazyFields) and not lazy.fields.expanded
+    eager = GqlField.from_model(Category, max_depth=2).freeze()
+    assert hash(lazy) == hash(eager)
+    assert lazy == eager
+
+
+def test_lazy_recursive_model_without_max_depth():
+    query = Query.from_model(User, "users", lazy=True)
+    with pytest.raises(ValueError, match="refers to itself"):
+        str(query)
+
+
+def test_gql_field_has_no_dict():
+    assert not hasattr(GqlField("a"), "__dict__")
+
+
+def test_freeze():
+    field = GqlField("a", {"x": [1, {"y": 2}]}, (GqlField("b", {"z": 3}),), "c")
+    frozen = field.freeze()
+    assert isinstance(frozen, FrozenGqlField)
+    assert isinstance(frozen.fields[0], FrozenGqlField)
+    assert frozen.freeze() is frozen
+    assert frozen.args["x"] == (1, {"y": 2})
+    with pytest.raises(TypeError):
+        frozen.args["x"] = 2  # type: ignore[index]
+    with pytest.raises(FrozenInstanceError):
+        frozen.name = "b"
+    field.args["x"].append(3)  # type: ignore[union-attr]
+    assert frozen.args["x"] == (1, {"y": 2})
+
+
+def test_frozen_hash_and_equality():
+    first = GqlField("a", {"x": [1, 2]}, (GqlField("b"),)).freeze()
+    second = GqlField("a", {"x": (1, 2)}, (GqlField("b"),)).freeze()
+    assert first == second
+    assert hash(first) == hash(second)
+    assert {first: 1}[second] == 1
+    assert first != GqlField("a", {"x": [1, 3]}, (GqlField("b"),)).freeze()
+    assert first != GqlField("a", {"x": [1, 2]}, (GqlField("c"),)).freeze()
+    assert first != replace(first, alias="d")
+
+
+def test_intern_shares_equal_subtrees():
+    pool = FieldPool()
+    GqlField.clear_cache()
+    first = GqlField.from_model(ComplexModel, "a").intern(pool)
+    GqlField.clear_cache()
+    second = GqlField.from_model(ComplexModel, "a").intern(pool)
+    assert first is second
+    assert first.fields[0].fields[0] is first.fields[1].fields[0]
+    assert first.intern(pool) is first
+    other = GqlField.from_model(ComplexModel, "b").intern(pool)
+    assert other.fields[0] is first.fields[0]
+    assert len(pool) == 5
+
+
+def test_intern_keeps_models_apart():
+    pool = FieldPool()
+    first = GqlField("a", fields=(GqlField("b"),), model=MyModel).intern(pool)
+    second = GqlField("a", fields=(GqlField("b"),), model=NestedModel).intern(pool)
+    assert first == second
+    assert first is not second
+    assert second.model is NestedModel
+    assert first.fields[0] is second.fields[0]
+
+
+def test_intern_frozen_field():
+    pool = FieldPool()
+    frozen = GqlField("a", {"x": [1]}, (GqlField("b"),)).freeze()
+    interned = frozen.intern(pool)
+    assert interned == frozen
+    assert interned.fields[0] is GqlField("b").intern(pool)
+    assert GqlField("a", {"x": (1,)}, (GqlField("b"),)).intern(pool) is interned
+
+
+def test_pool_holds_weak_references():
+    pool = FieldPool()
+    field = GqlField("a", fields=(GqlField("b"),)).intern(pool)
+    assert len(pool) == 2
+    del field
+    assert len(pool) == 0
+    GqlField("a").intern(pool)
+    pool.clear()
+    assert len(pool) == 0
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda field: pickle.loads(pickle.dumps(field))],
+)
+def test_copy_frozen(clone: Callable[[FrozenGqlField], FrozenGqlField]):
+    field = GqlField.from_model(ComplexModel, args={"a": {"b": [1]}}).freeze()
+    copied = clone(field)
+    assert isinstance(copied, FrozenGqlField)
+    assert copied == field
+    assert hash(copied) == hash(field)
+    assert copied.model is ComplexModel
+    with pytest.raises(FrozenInstanceError):
+        copied.name = "changed"
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import sys
+import textwrap
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql import Query
+from pydantic_gql.manifest import build_manifest, discover, main, register
+
+
+class Book(BaseModel):
+    title: str
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("pydantic_gql.manifest._registry", {})
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Create a package with operations at the module level of a module and a submodule."""
+    root = tmp_path / "manifest_pkg"
+    (root / "sub").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "sub" / "__init__.py").write_text("")
+    imports = "from pydantic_gql import Query, Mutation\nfrom tests.test_manifest import Book\n"
+    (root / "queries.py").write_text(imports + textwrap.dedent("""
+            BOOKS = Query.from_model(Book, "books")
+            SAME_BOOKS = BOOKS
+            ADD = Mutation.from_model(Book, "add_book", args={"title": "x"})
+            NOT_AN_OPERATION = "query { books { title } }"
+            """))
+    (root / "sub" / "more.py").write_text(
+        imports + 'MAGAZINES = Query.from_model(Book, "magazines")\n'
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "manifest_pkg"
+    for name in list(sys.modules):
+        if name.startswith("manifest_pkg"):
+            del sys.modules[name]
+
+
+def names(operations: list) -> list[str]:
+    return [op.fields[0].name for op in operations]
+
+
+def test_discover(package: str) -> None:
+    assert names(discover([f"{package}.queries"]))[:2] == ["books", "add_book"]
+    assert "magazines" not in names(discover([package]))
+    assert "magazines" in names(discover([package], recursive=True))
+
+
+def test_register(package: str) -> None:
+    registered = register(Query.from_model(Book, "registered"))
+
+    @register
+    def make_query() -> Query:
+        return Query.from_model(Book, "decorated")
+
+    assert callable(make_query)
+    found = discover([f"{package}.queries"])
+    assert registered in found
+    assert names(found)[-2:] == ["registered", "decorated"]
+
+
+def test_build_manifest() -> None:
+    query = Query.from_model(Book, "books")
+    manifest = build_manifest([query, Query.from_model(Book, "books")])
+    assert manifest == {
+        hashlib.sha256(query.document.encode()).hexdigest(): query.document
+    }
+
+
+def test_main(package: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = tmp_path / "manifest.json"
+    main([f"{package}.queries", "--output", str(output)])
+    manifest = json.loads(output.read_text())
+    documents = set(manifest.values())
+    assert "query Book {books {title,},}" in documents
+    assert all(
+        hashlib.sha256(doc.encode()).hexdigest() == sha for sha, doc in manifest.items()
+    )
+    main([package, "-r"])
+    assert "magazines" in capsys.readouterr().out
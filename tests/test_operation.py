@@ -1,6 +1,15 @@
-from pydantic import BaseModel
+import copy
+import hashlib
+import pickle
+from dataclasses import FrozenInstanceError
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
 
 from pydantic_gql import BaseVars, Expr, GqlField, Mutation, Query, Var
+from pydantic_gql.errors import GraphQLError
+from pydantic_gql.values import freeze_value
 
 from .check_op import check_op
 
@@ -121,3 +130,187 @@ def test_mutation_with_vars() -> None:
         mutation,
         "mutation RemovedBook($id: Int, $title: String) { remove_book(bookId: $id, bookTitle: $title) { id, title, author, archived, }, }",
     )
+
+
+def test_frozen_caches_string() -> None:
+    query = Query.from_model(Book, "books", frozen=True)
+    assert str(query) is str(query)
+    assert f"{query:noindent}" is f"{query:noindent}"
+    assert str(query) == str(Query.from_model(Book, "books"))
+
+
+def test_frozen_snapshots_fields() -> None:
+    field = GqlField.from_model(Book, "books", args={"ids": [1, 2]})
+    query = Query("Books", field, frozen=True)
+    before = str(query)
+    field.args["ids"].append(3)  # type: ignore
+    field.name = "magazines"
+    assert str(query) == before
+    with pytest.raises(TypeError):
+        query.fields[0].args["ids"] = [4]  # type: ignore
+
+
+def test_frozen_immutable() -> None:
+    query = Query.from_model(Book, "books", frozen=True)
+    with pytest.raises(FrozenInstanceError):
+        query.name = "Other"
+
+
+def test_frozen_hash_and_eq() -> None:
+    first = Query.from_model(Book, "books", frozen=True)
+    second = Query("Book", GqlField.from_model(Book, "books"), frozen=True)
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != Query.from_model(Book, "books")
+    assert first != Query.from_model(Book, "magazines", frozen=True)
+
+
+def test_document_hash() -> None:
+    query = Query.from_model(Book, "books")
+    assert query.document == f"{query:noindent}"
+    assert query.document_hash == hashlib.sha256(query.document.encode()).hexdigest()
+    query.name = "Other"
+    assert query.document_hash != Query.from_model(Book, "books").document_hash
+
+
+def test_frozen_document_hash_cached() -> None:
+    query = Query.from_model(Book, "books", frozen=True)
+    assert query.document is query.document
+    assert query.document_hash is query.document_hash
+    assert query.document_hash == Query.from_model(Book, "books").document_hash
+
+
+def test_not_frozen_identity() -> None:
+    query = Query.from_model(Book, "books")
+    assert query == query
+    assert query != Query.from_model(Book, "books")
+    assert len({query, query}) == 1
+
+
+def test_mutation_with_input_object() -> None:
+    book = Book(title="The Lord of the Rings", author="J.R.R. Tolkien")
+    mutation = Mutation.from_model(Book, "add_book", args={"book": book})
+    check_op(
+        mutation,
+        'mutation Book { add_book(book: {title: "The Lord of the Rings", author: "J.R.R. Tolkien"}) { title, author, }, }',
+    )
+
+
+def test_frozen_operations_share_fields() -> None:
+    first = Query.from_model(Book, "books", frozen=True)
+    GqlField.clear_cache()
+    second = Query.from_model(Book, "books", frozen=True)
+    assert first.fields[0] is second.fields[0]
+    assert first.fields[0] is GqlField.from_model(Book, "books").intern()
+    assert first.fields[0].model is Book
+
+
+def test_frozen_snapshots_input_objects() -> None:
+    book = Book(title="The Hobbit", author="J.R.R. Tolkien")
+    mutation = Mutation.from_model(
+        Book, "add_book", args={"book": book, "tags": {"a": [1]}}, frozen=True
+    )
+    before = str(mutation)
+    book.title = "Changed"
+    assert str(mutation) == before
+
+
+def test_frozen_values_copyable() -> None:
+    value = freeze_value({"a": [1, {"b": 2}]})
+    assert copy.deepcopy(value) == value
+    assert pickle.loads(pickle.dumps(value)) == {"a": (1, {"b": 2})}
+    with pytest.raises(TypeError):
+        value["a"] = 1  # type: ignore[index]
+
+
+def test_frozen_copyable() -> None:
+    query = Query.from_model(Book, "books", args={"ids": [1, 2]}, frozen=True)
+    for copied in (copy.deepcopy(query), pickle.loads(pickle.dumps(query))):
+        assert copied == query
+        assert str(copied) == str(query)
+        with pytest.raises(FrozenInstanceError):
+            copied.fields[0].name = "changed"
+
+
+def test_frozen_copyable_with_variables() -> None:
+    class Vars(BaseVars):
+        after: Var[str | None]
+        n: Var[int] = Var(default=3)
+
+    query = Query.from_model(
+        Book, "books", variables=Vars, args={"after": Vars.after}, frozen=True
+    )
+    for copied in (copy.deepcopy(query), pickle.loads(pickle.dumps(query))):
+        assert copied == query
+        assert str(copied) == str(query)
+        assert "($after: String, $n: Int)" in str(copied)
+
+
+def test_frozen_variables_snapshot() -> None:
+    first = Var[list[int]]("ids", default=[1])
+    query = Query.from_model(
+        Book, "books", variables=(first,), args={"ids": first}, frozen=True
+    )
+    first.type_name = "ID"
+    first.default.append(2)
+    assert "($ids: [Int!])" in str(query)
+    assert query.variables[0].default == [1]
+
+
+def test_parse_data() -> None:
+    library = GqlField.from_model(Library, "library")
+    library.alias = "lib"
+    query = Query(
+        "Parse",
+        GqlField.from_model(Book, "books"),
+        library,
+        GqlField.from_model(Author, "author"),
+        GqlField("count"),
+    )
+    data: dict[str, Any] = {
+        "books": [{"title": "a", "author": "b"}],
+        "lib": {"name": "c", "books": [], "exclusive_to": None},
+        "author": None,
+        "count": 1,
+    }
+    assert query.parse_data(data) == {
+        "books": [Book(title="a", author="b")],
+        "lib": Library(name="c", books=[], exclusive_to=None),
+        "author": None,
+        "count": 1,
+    }
+
+
+def test_parse_response() -> None:
+    query = Query.from_model(Book, "books")
+    content = b'{"data": {"books": [{"title": "a", "author": "b"}]}}'
+    assert query.parse_response(content) == {"books": [Book(title="a", author="b")]}
+
+
+def test_parse_response_missing_field() -> None:
+    query = Query.from_model(Book, "books")
+    assert query.parse_response('{"data": null}') == {"books": None}
+
+
+def test_parse_response_errors() -> None:
+    query = Query.from_model(Book, "books")
+    with pytest.raises(GraphQLError, match="Oops") as info:
+        query.parse_response(
+            b'{"errors": [{"message": "Oops"}], "data": {"books": null}}'
+        )
+    assert info.value.data == {"books": None}
+
+
+def test_parse_response_invalid() -> None:
+    query = Query.from_model(Book, "books")
+    with pytest.raises(ValidationError):
+        query.parse_response(b'{"data": {"books": [{"title": 1}]}}')
+
+
+def test_response_adapter_cached() -> None:
+    first = Query.from_model(Book, "books")
+    second = Query.from_model(Book, "books", variables=(), args={"first": 1})
+    assert first.response_adapter is second.response_adapter
+    assert (
+        Query.from_model(Book, "other").response_adapter is not first.response_adapter
+    )
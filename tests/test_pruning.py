@@ -0,0 +1,127 @@
+import pytest
+from pydantic import BaseModel, Field
+
+from pydantic_gql import GqlField, Query
+from pydantic_gql.connections import CompactConnection
+
+from .check_op import check_op
+
+
+class Author(BaseModel):
+    name: str
+    bio: str = Field(alias="biography")
+
+
+class Review(BaseModel):
+    text: str
+    stars: int
+
+
+class Book(BaseModel):
+    title: str
+    author: Author
+    reviews: list[Review]
+
+
+def test_exclude() -> None:
+    check_op(
+        Query.from_model(Book, "books", exclude={"author.bio", "reviews"}),
+        "query Book { books { title, author { name, }, }, }",
+    )
+
+
+def test_include() -> None:
+    check_op(
+        Query.from_model(Book, "books", include={"title", "reviews.stars"}),
+        "query Book { books { title, reviews { stars, }, }, }",
+    )
+
+
+def test_include_whole_model() -> None:
+    check_op(
+        Query.from_model(Book, "books", include={"author"}),
+        "query Book { books { author { name, biography, }, }, }",
+    )
+
+
+def test_include_and_exclude() -> None:
+    check_op(
+        Query.from_model(
+            Book, "books", include={"author", "reviews"}, exclude={"author.name"}
+        ),
+        "query Book { books { author { biography, }, reviews { text, stars, }, }, }",
+    )
+
+
+def test_unknown_path() -> None:
+    with pytest.raises(ValueError, match="no fields named summary"):
+        GqlField.from_model(Book, exclude={"summary"})
+    with pytest.raises(ValueError, match="Author has no fields named age"):
+        GqlField.from_model(Book, include={"author.age"})
+
+
+def test_path_below_scalar() -> None:
+    with pytest.raises(ValueError, match="title of Book is not a model"):
+        GqlField.from_model(Book, include={"title.x"})
+    with pytest.raises(ValueError, match="name of Author is not a model"):
+        GqlField.from_model(Book, exclude={"author.name.first"})
+
+
+def test_exclude_all_subfields() -> None:
+    query = Query.from_model(Book, "books", exclude={"author.name", "author.bio"})
+    check_op(query, "query Book { books { title, reviews { text, stars, }, }, }")
+    (book,) = query.parse_data({"books": [{"title": "T", "reviews": []}]})["books"]
+    assert book.author is None
+
+
+def test_response_validation() -> None:
+    query = Query.from_model(Book, "books", exclude={"author.bio", "reviews"})
+    (book,) = query.parse_data({"books": [{"title": "T", "author": {"name": "A"}}]})[
+        "books"
+    ]
+    assert isinstance(book, Book)
+    assert isinstance(book.author, Author)
+    assert (book.title, book.author.name, book.author.bio, book.reviews) == (
+        "T",
+        "A",
+        None,
+        None,
+    )
+
+
+def test_nested_response_validation() -> None:
+    query = Query.from_model(Book, "books", include={"reviews.stars"})
+    (book,) = query.parse_data({"books": [{"reviews": [{"stars": 5}]}]})["books"]
+    assert [review.stars for review in book.reviews] == [5]
+    assert isinstance(book.reviews[0], Review)
+
+
+def test_unpruned_model_unchanged() -> None:
+    assert GqlField.from_model(Book).model is Book
+    assert GqlField.from_model(Book, include={"author"}).model is not Book
+    assert GqlField.from_model(Book, exclude=()).model is Book
+
+
+def test_pruned_selection_cached() -> None:
+    first = GqlField.fields_of_model(Book, exclude={"reviews"})
+    misses = GqlField.fields_cache.info().misses
+    assert GqlField.fields_of_model(Book, exclude=["reviews"]) == first
+    assert GqlField.fields_cache.info().misses == misses
+    assert GqlField.fields_of_model(Book) != first
+    model = GqlField.from_model(Book, exclude={"reviews"}).model
+    assert GqlField.from_model(Book, exclude={"reviews"}).model is model
+
+
+def test_lazy_pruned() -> None:
+    GqlField.clear_cache()
+    query = Query.from_model(Book, "books", lazy=True, include={"author.name"})
+    check_op(query, "query Book { books { author { name, }, }, }")
+
+
+def test_model_with_own_fields() -> None:
+    class Shelf(BaseModel):
+        books: CompactConnection[Book]
+
+    GqlField.from_model(Shelf, exclude={"books"})
+    with pytest.raises(ValueError, match="selects its own fields"):
+        GqlField.from_model(Shelf, exclude={"books.nodes"})
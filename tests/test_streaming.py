@@ -0,0 +1,108 @@
+import asyncio
+import io
+import json
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_gql.errors import GraphQLError
+from pydantic_gql.streaming import aiter_list, iter_list
+
+
+class Book(BaseModel):
+    title: str
+    tags: list[str] = []
+
+
+BOOKS: list[dict[str, Any]] = [
+    {"title": 'A "quoted" title', "tags": ["]", "}", "\\"]},
+    {"title": "Ünïcode [brackets] {braces}", "tags": []},
+    {"title": "c"},
+]
+
+RESPONSE = json.dumps(
+    {
+        "extensions": {"data": {"books": [{"title": "not this one"}]}},
+        "data": {
+            "count": 3,
+            "other": {"books": [{"title": "nor this one"}]},
+            "books": BOOKS,
+            "after": [1, 2, {"x": "y"}],
+        },
+    },
+    indent=2,
+).encode()
+
+
+def chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(RESPONSE)])
+def test_chunk_boundaries(size: int) -> None:
+    books = list(iter_list(chunks(RESPONSE, size), "books", Book))
+    assert books == [Book.model_validate(book) for book in BOOKS]
+
+
+def test_file() -> None:
+    books = list(iter_list(io.BytesIO(RESPONSE), "books", Book, chunk_size=5))
+    assert [book.title for book in books] == [book["title"] for book in BOOKS]
+
+
+def test_yields_before_end_of_stream() -> None:
+    received: list[int] = []
+
+    def source() -> Iterator[bytes]:
+        yield b'{"data": {"books": ['
+        for i in range(3):
+            received.append(i)
+            yield (b"," if i else b"") + json.dumps({"title": str(i)}).encode()
+        yield b"]}}"
+
+    for i, book in enumerate(iter_list(source(), "books", Book)):
+        assert book.title == str(i)
+        assert received == list(range(i + 1))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [b'{"data": null}', b'{"data": {"books": null}}', b'{"data": {}}', b"{}"],
+)
+def test_no_list(response: bytes) -> None:
+    assert list(iter_list([response], "books", Book)) == []
+
+
+@pytest.mark.parametrize("size", [4, 1000])
+def test_errors(size: int) -> None:
+    response = b'{"data": {"books": [{"title": "a"}]}, "errors": [{"message": "Oops"}]}'
+    iterator = iter_list(chunks(response, size), "books", Book)
+    assert next(iterator) == Book(title="a")
+    with pytest.raises(GraphQLError, match="Oops"):
+        next(iterator)
+
+
+def test_empty_errors() -> None:
+    response = b'{"errors": [], "data": {"books": [{"title": "a"}]}}'
+    assert list(iter_list([response], "books", Book)) == [Book(title="a")]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [b'{"data": {"books": [{"title": "a"}', b"[]", b'{"data" {}}', b'{"data": {}} x'],
+)
+def test_invalid(response: bytes) -> None:
+    with pytest.raises(ValueError):
+        list(iter_list(chunks(response, 3), "books", Book))
+
+
+def test_async() -> None:
+    async def source() -> AsyncIterator[bytes]:
+        for chunk in chunks(RESPONSE, 10):
+            yield chunk
+
+    async def main() -> list[Book]:
+        return [book async for book in aiter_list(source(), "books", Book)]
+
+    assert asyncio.run(main()) == [Book.model_validate(book) for book in BOOKS]
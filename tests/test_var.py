@@ -48,3 +48,16 @@ def test_set_default_type() -> None:
     var = Var[Any]("v")
     var.set_default_type(int)
     assert var.var_type == int
+
+
+def test_set_default_type_resets_required() -> None:
+    var = Var[Any]("v")
+    assert var.required
+    var.set_default_type(cast(type, int | None))
+    assert not var.required
+
+
+def test_var_has_no_dict() -> None:
+    var = Var[int]("v")
+    assert not hasattr(var, "__dict__")
+    assert var.renamed("w").var_type is int